@@ -3,7 +3,7 @@
 import asyncio
 from logging.config import fileConfig
 
-from sqlalchemy import pool
+from sqlalchemy import inspect, pool, text
 from sqlalchemy.engine import Connection
 from sqlalchemy.ext.asyncio import async_engine_from_config
 
@@ -51,8 +51,21 @@ def run_migrations_offline() -> None:
         context.run_migrations()
 
 
+def is_unversioned(connection: Connection) -> bool:
+    """Check whether no revision has been applied to the database yet."""
+    if not inspect(connection).has_table("alembic_version"):
+        return True
+    return not connection.execute(text("SELECT EXISTS (SELECT 1 FROM alembic_version)")).scalar()
+
+
 def do_run_migrations(connection: Connection) -> None:
     """Run migrations with the given connection."""
+    # Revisions batch some DDL when building a database from scratch (see
+    # app.migration_helpers.fresh_upgrade_through). End the read transaction
+    # so the migrations run in their own.
+    config.attributes["fresh_database"] = is_unversioned(connection)
+    connection.commit()
+
     context.configure(
         connection=connection,
         target_metadata=target_metadata,
@@ -22,6 +22,12 @@ depends_on: str | Sequence[str] | None = None
 
 def upgrade() -> None:
     """Create initial database schema."""
+    # The whole schema is created in one transaction; a failed run is simply
+    # re-run, so don't wait on WAL flush, and let index builds use workers.
+    op.execute("SET LOCAL synchronous_commit = OFF")
+    op.execute("SET LOCAL maintenance_work_mem = '1GB'")
+    op.execute("SET LOCAL max_parallel_maintenance_workers = 4")
+
     # Enable required extensions
     op.execute("CREATE EXTENSION IF NOT EXISTS vector")
     op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
@@ -238,12 +244,8 @@ def upgrade() -> None:
         ["is_current"],
         postgresql_where=sa.text("is_current = TRUE"),
     )
-    # HNSW index for vector similarity search
-    op.execute("""
-        CREATE INDEX ix_embedding_hnsw ON embedding
-        USING hnsw (embedding vector_cosine_ops)
-        WITH (m = 16, ef_construction = 64)
-    """)
+    # HNSW index for vector similarity search is built in a later revision
+    # (add_embedding_hnsw), after bulk loads, rather than maintained per row.
 
     # Create ingest_run table
     op.create_table(
@@ -295,7 +297,6 @@ def downgrade() -> None:
     """Drop all tables."""
     op.drop_table("ingest_item")
     op.drop_table("ingest_run")
-    op.drop_index("ix_embedding_hnsw", table_name="embedding")
     op.drop_table("embedding")
     op.drop_table("asset_text_chunk")
     op.drop_table("page_text_chunk")
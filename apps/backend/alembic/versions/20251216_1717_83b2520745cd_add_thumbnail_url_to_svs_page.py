@@ -10,6 +10,7 @@ from collections.abc import Sequence
 import sqlalchemy as sa
 
 from alembic import op
+from app.migration_helpers import fresh_upgrade_through
 
 # revision identifiers, used by Alembic.
 revision: str = "83b2520745cd"
@@ -20,6 +21,19 @@ depends_on: str | Sequence[str] | None = None
 
 def upgrade() -> None:
     """Upgrade database schema."""
+    if fresh_upgrade_through("add_thumbnail_storage"):
+        # Building from scratch: also add the columns of add_rich_content and
+        # add_thumbnail_storage, one ALTER (one lock, one catalog update) per
+        # table; those revisions then skip theirs
+        op.execute(
+            "ALTER TABLE svs_page"
+            " ADD COLUMN thumbnail_url varchar(1000),"
+            " ADD COLUMN content_json jsonb,"
+            " ADD COLUMN thumbnail_storage_uri varchar(1000)"
+        )
+        op.execute("ALTER TABLE asset ADD COLUMN caption_html text, ADD COLUMN caption_text text")
+        return
+
     op.add_column("svs_page", sa.Column("thumbnail_url", sa.String(length=1000), nullable=True))
 
 
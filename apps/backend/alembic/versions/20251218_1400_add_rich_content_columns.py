@@ -16,6 +16,7 @@ import sqlalchemy as sa
 from sqlalchemy.dialects import postgresql
 
 from alembic import op
+from app.migration_helpers import fresh_upgrade_through
 
 # revision identifiers, used by Alembic.
 revision: str = "add_rich_content"
@@ -26,6 +27,9 @@ depends_on: str | Sequence[str] | None = None
 
 def upgrade() -> None:
     """Add rich content columns."""
+    if fresh_upgrade_through("add_thumbnail_storage"):
+        return  # Added together with thumbnail_url by 83b2520745cd
+
     # Add content_json to svs_page for structured content with HTML
     op.add_column("svs_page", sa.Column("content_json", postgresql.JSONB(astext_type=sa.Text()), nullable=True))
 
@@ -11,6 +11,7 @@ from collections.abc import Sequence
 import sqlalchemy as sa
 
 from alembic import op
+from app.migration_helpers import fresh_upgrade_through
 
 # revision identifiers, used by Alembic.
 revision: str = "add_thumbnail_storage"
@@ -21,6 +22,9 @@ depends_on: str | Sequence[str] | None = None
 
 def upgrade() -> None:
     """Add thumbnail_storage_uri column for local thumbnail caching."""
+    if fresh_upgrade_through("add_thumbnail_storage"):
+        return  # Added together with thumbnail_url by 83b2520745cd
+
     op.add_column(
         "svs_page",
         sa.Column("thumbnail_storage_uri", sa.String(length=1000), nullable=True),
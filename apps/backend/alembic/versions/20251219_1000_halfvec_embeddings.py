@@ -0,0 +1,32 @@
+"""Store embeddings as halfvec.
+
+Revision ID: halfvec_embeddings
+Revises: add_thumbnail_storage
+Create Date: 2025-12-19 10:00:00.000000
+
+Switch embedding.embedding from vector(1024) to halfvec(1024). FP16 halves
+the per-row and index footprint with negligible recall loss for 1024-d text
+embeddings. The HNSW index is rebuilt by the add_embedding_hnsw revision.
+Requires pgvector >= 0.7.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "halfvec_embeddings"
+down_revision: str | None = "add_thumbnail_storage"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Convert embedding column to halfvec."""
+    op.execute("DROP INDEX IF EXISTS ix_embedding_hnsw")
+    op.execute("ALTER TABLE embedding ALTER COLUMN embedding TYPE halfvec(1024) USING embedding::halfvec(1024)")
+
+
+def downgrade() -> None:
+    """Convert embedding column back to full-precision vector."""
+    op.execute("ALTER TABLE embedding ALTER COLUMN embedding TYPE vector(1024) USING embedding::vector(1024)")
@@ -0,0 +1,48 @@
+"""Build the embedding HNSW index.
+
+Revision ID: add_embedding_hnsw
+Revises: halfvec_embeddings
+Create Date: 2025-12-19 11:00:00.000000
+
+The HNSW index is built separately from the embedding table so bulk loads
+(initial ingest, dump/restore) write to a plain heap and the graph is built
+once afterwards. CONCURRENTLY keeps the table writable during the build.
+On an empty table (a fresh install) there is nothing to build the graph
+from, so the revision is a no-op; the index is built after the first bulk
+load instead (make build-index).
+"""
+
+from collections.abc import Sequence
+
+from app.migration_helpers import (
+    create_index_concurrently,
+    drop_index_concurrently,
+    index_build_settings,
+    table_has_rows,
+)
+
+# revision identifiers, used by Alembic.
+revision: str = "add_embedding_hnsw"
+down_revision: str | None = "halfvec_embeddings"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create HNSW index for vector similarity search."""
+    if not table_has_rows("embedding"):
+        return
+    with index_build_settings():
+        create_index_concurrently(
+            "ix_embedding_hnsw",
+            "embedding",
+            ["embedding"],
+            postgresql_using="hnsw",
+            postgresql_with={"m": 16, "ef_construction": 64},
+            postgresql_ops={"embedding": "halfvec_cosine_ops"},
+        )
+
+
+def downgrade() -> None:
+    """Drop HNSW index."""
+    drop_index_concurrently("ix_embedding_hnsw", "embedding")
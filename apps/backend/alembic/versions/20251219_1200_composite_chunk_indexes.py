@@ -0,0 +1,58 @@
+"""Consolidate embedding and chunk indexes.
+
+Revision ID: composite_chunk_indexes
+Revises: add_embedding_hnsw
+Create Date: 2025-12-19 12:00:00.000000
+
+Replace per-column btrees with fewer composite/covering indexes so every
+chunk and embedding insert dirties fewer index pages:
+- embedding: (chunk_id, chunk_type) INCLUDE (model_name, model_version, is_current)
+  replaces ix_embedding_chunk and ix_embedding_model
+- page_text_chunk: (svs_id, section) replaces the svs_id and section indexes
+- asset_text_chunk: (asset_id, section) replaces the asset_id and section indexes
+"""
+
+from collections.abc import Sequence
+
+from app.migration_helpers import create_index_concurrently, drop_index_concurrently
+
+# revision identifiers, used by Alembic.
+revision: str = "composite_chunk_indexes"
+down_revision: str | None = "add_embedding_hnsw"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create composite indexes and drop the ones they replace."""
+    create_index_concurrently(
+        "ix_embedding_chunk_covering",
+        "embedding",
+        ["chunk_id", "chunk_type"],
+        postgresql_include=["model_name", "model_version", "is_current"],
+    )
+    drop_index_concurrently("ix_embedding_chunk", "embedding")
+    drop_index_concurrently("ix_embedding_model", "embedding")
+
+    create_index_concurrently("ix_page_text_chunk_svs_id_section", "page_text_chunk", ["svs_id", "section"])
+    drop_index_concurrently("ix_page_text_chunk_svs_id", "page_text_chunk")
+    drop_index_concurrently("ix_page_text_chunk_section", "page_text_chunk")
+
+    create_index_concurrently("ix_asset_text_chunk_asset_id_section", "asset_text_chunk", ["asset_id", "section"])
+    drop_index_concurrently("ix_asset_text_chunk_asset_id", "asset_text_chunk")
+    drop_index_concurrently("ix_asset_text_chunk_section", "asset_text_chunk")
+
+
+def downgrade() -> None:
+    """Restore the per-column indexes."""
+    create_index_concurrently("ix_asset_text_chunk_asset_id", "asset_text_chunk", ["asset_id"])
+    create_index_concurrently("ix_asset_text_chunk_section", "asset_text_chunk", ["section"])
+    drop_index_concurrently("ix_asset_text_chunk_asset_id_section", "asset_text_chunk")
+
+    create_index_concurrently("ix_page_text_chunk_svs_id", "page_text_chunk", ["svs_id"])
+    create_index_concurrently("ix_page_text_chunk_section", "page_text_chunk", ["section"])
+    drop_index_concurrently("ix_page_text_chunk_svs_id_section", "page_text_chunk")
+
+    create_index_concurrently("ix_embedding_chunk", "embedding", ["chunk_id", "chunk_type"])
+    create_index_concurrently("ix_embedding_model", "embedding", ["model_name", "model_version"])
+    drop_index_concurrently("ix_embedding_chunk_covering", "embedding")
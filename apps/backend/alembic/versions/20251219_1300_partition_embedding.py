@@ -0,0 +1,106 @@
+"""Partition embedding by is_current.
+
+Revision ID: partition_embedding
+Revises: composite_chunk_indexes
+Create Date: 2025-12-19 13:00:00.000000
+
+Rebuild embedding as a LIST-partitioned table:
+- embedding_current: rows with is_current = TRUE (the only rows searched)
+- embedding_historical: everything else (superseded model versions)
+
+The HNSW index is built on embedding_current only, so re-embedding with a
+new model never grows the graph that queries walk, and purging historical
+vectors touches a partition nobody searches. As in add_embedding_hnsw, the
+graph is built concurrently after the copy commits, and not at all while
+the partition is empty.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+from app.migration_helpers import create_index_concurrently, index_build_settings, table_has_rows
+
+# revision identifiers, used by Alembic.
+revision: str = "partition_embedding"
+down_revision: str | None = "composite_chunk_indexes"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Rebuild embedding as a partitioned table."""
+    op.execute("ALTER TABLE embedding RENAME TO embedding_unpartitioned")
+    op.execute("ALTER TABLE embedding_unpartitioned DROP CONSTRAINT pk_embedding")
+    op.execute("DROP INDEX IF EXISTS ix_embedding_hnsw")
+    op.execute("DROP INDEX IF EXISTS ix_embedding_chunk_covering")
+    op.execute("DROP INDEX IF EXISTS ix_embedding_current")
+
+    # The partition key must be part of the primary key
+    op.execute("""
+        CREATE TABLE embedding (
+            LIKE embedding_unpartitioned INCLUDING DEFAULTS INCLUDING CONSTRAINTS,
+            CONSTRAINT pk_embedding PRIMARY KEY (embedding_id, is_current)
+        ) PARTITION BY LIST (is_current)
+    """)
+    op.execute("CREATE TABLE embedding_current PARTITION OF embedding FOR VALUES IN (TRUE)")
+    op.execute("CREATE TABLE embedding_historical PARTITION OF embedding DEFAULT")
+
+    op.execute("INSERT INTO embedding SELECT * FROM embedding_unpartitioned")
+    op.execute("DROP TABLE embedding_unpartitioned")
+
+    op.create_index(
+        "ix_embedding_chunk_covering",
+        "embedding",
+        ["chunk_id", "chunk_type"],
+        postgresql_include=["model_name", "model_version", "is_current"],
+    )
+
+    # The copy commits before the concurrent build; an empty table (a fresh
+    # install) gets its graph built after the bulk load instead
+    if table_has_rows("embedding_current"):
+        with index_build_settings():
+            create_index_concurrently(
+                "ix_embedding_hnsw",
+                "embedding_current",
+                ["embedding"],
+                postgresql_using="hnsw",
+                postgresql_with={"m": 16, "ef_construction": 64},
+                postgresql_ops={"embedding": "halfvec_cosine_ops"},
+            )
+
+
+def downgrade() -> None:
+    """Rebuild embedding as a single unpartitioned table."""
+    op.execute("ALTER TABLE embedding RENAME TO embedding_partitioned")
+    op.execute("ALTER TABLE embedding_partitioned DROP CONSTRAINT pk_embedding")
+    op.execute("DROP INDEX IF EXISTS ix_embedding_hnsw")
+    op.execute("DROP INDEX IF EXISTS ix_embedding_chunk_covering")
+
+    op.execute("""
+        CREATE TABLE embedding (
+            LIKE embedding_partitioned INCLUDING DEFAULTS INCLUDING CONSTRAINTS,
+            CONSTRAINT pk_embedding PRIMARY KEY (embedding_id)
+        )
+    """)
+    op.execute("INSERT INTO embedding SELECT * FROM embedding_partitioned")
+    op.execute("DROP TABLE embedding_partitioned")
+
+    op.create_index(
+        "ix_embedding_chunk_covering",
+        "embedding",
+        ["chunk_id", "chunk_type"],
+        postgresql_include=["model_name", "model_version", "is_current"],
+    )
+    op.create_index("ix_embedding_current", "embedding", ["is_current"], postgresql_where=sa.text("is_current = TRUE"))
+    if table_has_rows("embedding"):
+        with index_build_settings():
+            create_index_concurrently(
+                "ix_embedding_hnsw",
+                "embedding",
+                ["embedding"],
+                postgresql_using="hnsw",
+                postgresql_with={"m": 16, "ef_construction": 64},
+                postgresql_ops={"embedding": "halfvec_cosine_ops"},
+            )
@@ -0,0 +1,46 @@
+"""Use BRIN indexes for ingest timestamps.
+
+Revision ID: brin_ingest_timestamps
+Revises: partition_embedding
+Create Date: 2025-12-19 14:00:00.000000
+
+ingest_run.started_at and ingest_item.created_at only ever grow, so heap
+order tracks the timestamp and a BRIN index gives range scans at a tiny
+fraction of a btree's size and maintenance cost.
+"""
+
+from collections.abc import Sequence
+
+from app.migration_helpers import create_index_concurrently, drop_index_concurrently
+
+# revision identifiers, used by Alembic.
+revision: str = "brin_ingest_timestamps"
+down_revision: str | None = "partition_embedding"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Replace btree on ingest_run.started_at with BRIN, add BRIN on ingest_item.created_at."""
+    create_index_concurrently(
+        "ix_ingest_run_started_at_brin",
+        "ingest_run",
+        ["started_at"],
+        postgresql_using="brin",
+        postgresql_with={"pages_per_range": 32},
+    )
+    drop_index_concurrently("ix_ingest_run_started_at", "ingest_run")
+    create_index_concurrently(
+        "ix_ingest_item_created_at_brin",
+        "ingest_item",
+        ["created_at"],
+        postgresql_using="brin",
+        postgresql_with={"pages_per_range": 32},
+    )
+
+
+def downgrade() -> None:
+    """Restore btree on ingest_run.started_at."""
+    drop_index_concurrently("ix_ingest_item_created_at_brin", "ingest_item")
+    create_index_concurrently("ix_ingest_run_started_at", "ingest_run", ["started_at"])
+    drop_index_concurrently("ix_ingest_run_started_at_brin", "ingest_run")
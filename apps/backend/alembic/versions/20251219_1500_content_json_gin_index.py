@@ -0,0 +1,36 @@
+"""Add GIN index on svs_page.content_json.
+
+Revision ID: content_json_gin
+Revises: brin_ingest_timestamps
+Create Date: 2025-12-19 15:00:00.000000
+
+jsonb_path_ops only supports containment (@>) and jsonpath operators, which
+is all structured-content queries need, and is roughly half the size of the
+default jsonb_ops opclass.
+"""
+
+from collections.abc import Sequence
+
+from app.migration_helpers import create_index_concurrently, drop_index_concurrently
+
+# revision identifiers, used by Alembic.
+revision: str = "content_json_gin"
+down_revision: str | None = "brin_ingest_timestamps"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create GIN index on content_json."""
+    create_index_concurrently(
+        "ix_svs_page_content_json_gin",
+        "svs_page",
+        ["content_json"],
+        postgresql_using="gin",
+        postgresql_ops={"content_json": "jsonb_path_ops"},
+    )
+
+
+def downgrade() -> None:
+    """Drop GIN index on content_json."""
+    drop_index_concurrently("ix_svs_page_content_json_gin", "svs_page")
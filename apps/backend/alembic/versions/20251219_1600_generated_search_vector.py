@@ -0,0 +1,42 @@
+"""Make svs_page.search_vector a generated column.
+
+Revision ID: generated_search_vector
+Revises: content_json_gin
+Create Date: 2025-12-19 16:00:00.000000
+
+PostgreSQL now computes the weighted tsvector (title A, summary B,
+description C) on every insert/update, so it can no longer go stale or be
+left unpopulated after ingestion.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "generated_search_vector"
+down_revision: str | None = "content_json_gin"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Replace search_vector with a stored generated column."""
+    op.drop_index("ix_svs_page_search_vector", table_name="svs_page")
+    op.drop_column("svs_page", "search_vector")
+    op.execute("""
+        ALTER TABLE svs_page ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+            setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+            setweight(to_tsvector('english', coalesce(summary, '')), 'B') ||
+            setweight(to_tsvector('english', coalesce(description, '')), 'C')
+        ) STORED
+    """)
+    op.create_index("ix_svs_page_search_vector", "svs_page", ["search_vector"], postgresql_using="gin")
+
+
+def downgrade() -> None:
+    """Restore search_vector as a plain column."""
+    op.drop_index("ix_svs_page_search_vector", table_name="svs_page")
+    op.drop_column("svs_page", "search_vector")
+    op.execute("ALTER TABLE svs_page ADD COLUMN search_vector tsvector")
+    op.create_index("ix_svs_page_search_vector", "svs_page", ["search_vector"], postgresql_using="gin")
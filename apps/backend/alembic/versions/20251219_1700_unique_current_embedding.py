@@ -0,0 +1,36 @@
+"""Enforce one current embedding per chunk and model.
+
+Revision ID: unique_current_embedding
+Revises: generated_search_vector
+Create Date: 2025-12-19 17:00:00.000000
+
+embedding_current holds exactly the is_current = TRUE rows, so a plain
+unique index on that partition is the partial unique constraint. Rerunning
+or racing the embedding pipeline can no longer create duplicate current
+vectors, which would otherwise show up twice in ANN results.
+"""
+
+from collections.abc import Sequence
+
+from app.migration_helpers import create_index_concurrently, drop_index_concurrently
+
+# revision identifiers, used by Alembic.
+revision: str = "unique_current_embedding"
+down_revision: str | None = "generated_search_vector"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create unique index on current embeddings."""
+    create_index_concurrently(
+        "uq_embedding_current_chunk",
+        "embedding_current",
+        ["chunk_id", "chunk_type", "model_name"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    """Drop unique index on current embeddings."""
+    drop_index_concurrently("uq_embedding_current_chunk", "embedding_current")
@@ -0,0 +1,48 @@
+"""Use LZ4 TOAST compression for large text columns.
+
+Revision ID: lz4_toast_compression
+Revises: unique_current_embedding
+Create Date: 2025-12-19 18:00:00.000000
+
+LZ4 (PostgreSQL 14+) decompresses considerably faster than the default
+pglz, which matters for chunk content read on every RAG retrieval. Only
+newly written values are affected; existing rows keep pglz until rewritten.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "lz4_toast_compression"
+down_revision: str | None = "unique_current_embedding"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+LZ4_COLUMNS = [
+    ("page_text_chunk", "content"),
+    ("asset_text_chunk", "content"),
+    ("svs_page", "description"),
+    ("svs_page", "content_json"),
+    ("asset", "caption_html"),
+    ("asset", "caption_text"),
+]
+
+
+def upgrade() -> None:
+    """Switch large text columns to LZ4 and keep short chunks inline."""
+    for table, column in LZ4_COLUMNS:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} SET COMPRESSION lz4")
+
+    # Chunks are at most ~3 KB; keep them in the main heap instead of TOAST
+    op.execute("ALTER TABLE page_text_chunk SET (toast_tuple_target = 4096)")
+    op.execute("ALTER TABLE asset_text_chunk SET (toast_tuple_target = 4096)")
+
+
+def downgrade() -> None:
+    """Restore default compression and TOAST threshold."""
+    op.execute("ALTER TABLE asset_text_chunk RESET (toast_tuple_target)")
+    op.execute("ALTER TABLE page_text_chunk RESET (toast_tuple_target)")
+
+    for table, column in LZ4_COLUMNS:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} SET COMPRESSION default")
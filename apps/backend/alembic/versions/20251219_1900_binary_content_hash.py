@@ -0,0 +1,32 @@
+"""Store chunk content hashes as raw SHA-256 bytes.
+
+Revision ID: binary_content_hash
+Revises: lz4_toast_compression
+Create Date: 2025-12-19 19:00:00.000000
+
+content_hash moves from a 64-char hex VARCHAR to the 32-byte BYTEA digest:
+half the size in heap and index, and compared with memcmp instead of
+collation-aware text comparison. Existing hex values are decoded in place.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "binary_content_hash"
+down_revision: str | None = "lz4_toast_compression"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Convert hex content_hash to bytea."""
+    for table in ("page_text_chunk", "asset_text_chunk"):
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN content_hash TYPE bytea USING decode(content_hash, 'hex')")
+
+
+def downgrade() -> None:
+    """Convert bytea content_hash back to hex text."""
+    for table in ("page_text_chunk", "asset_text_chunk"):
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN content_hash TYPE varchar(64) USING encode(content_hash, 'hex')")
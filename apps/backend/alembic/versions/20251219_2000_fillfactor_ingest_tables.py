@@ -0,0 +1,41 @@
+"""Lower fillfactor on update-heavy tables.
+
+Revision ID: fillfactor_ingest_tables
+Revises: binary_content_hash
+Create Date: 2025-12-19 20:00:00.000000
+
+ingest_run and ingest_item are updated per item and per phase (status,
+counters, timestamps), and svs_page is updated on every recrawl. Leaving
+free space in each heap page lets those updates stay HOT (same page, no
+index maintenance). ingest_item also gets more eager autovacuum since it
+churns fastest. Applies to newly written pages; existing pages are
+repacked on the next VACUUM FULL / pg_repack.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "fillfactor_ingest_tables"
+down_revision: str | None = "binary_content_hash"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Set fillfactor and autovacuum storage parameters."""
+    op.execute("ALTER TABLE ingest_run SET (fillfactor = 70)")
+    op.execute("ALTER TABLE ingest_item SET (fillfactor = 70)")
+    op.execute("ALTER TABLE svs_page SET (fillfactor = 80)")
+    op.execute(
+        "ALTER TABLE ingest_item SET (autovacuum_vacuum_scale_factor = 0.02, autovacuum_analyze_scale_factor = 0.01)"
+    )
+
+
+def downgrade() -> None:
+    """Reset storage parameters to defaults."""
+    op.execute("ALTER TABLE ingest_item RESET (autovacuum_vacuum_scale_factor, autovacuum_analyze_scale_factor)")
+    op.execute("ALTER TABLE svs_page RESET (fillfactor)")
+    op.execute("ALTER TABLE ingest_item RESET (fillfactor)")
+    op.execute("ALTER TABLE ingest_run RESET (fillfactor)")
@@ -0,0 +1,36 @@
+"""Make tag.normalized_value a generated column.
+
+Revision ID: generated_tag_normalized_value
+Revises: fillfactor_ingest_tables
+Create Date: 2025-12-19 21:00:00.000000
+
+PostgreSQL derives normalized_value from value, so the two can never drift
+and ingestion only sends value. The expression mirrors the normalization
+the app already used (value.lower().strip()).
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "generated_tag_normalized_value"
+down_revision: str | None = "fillfactor_ingest_tables"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Replace normalized_value with a stored generated column."""
+    # Dropping the column also drops uq_tag_type_value and ix_tag_normalized_value
+    op.drop_column("tag", "normalized_value")
+    op.execute(
+        "ALTER TABLE tag ADD COLUMN normalized_value varchar(200) GENERATED ALWAYS AS (lower(btrim(value))) STORED"
+    )
+    op.create_unique_constraint("uq_tag_type_value", "tag", ["tag_type", "normalized_value"])
+    op.create_index("ix_tag_normalized_value", "tag", ["normalized_value"])
+
+
+def downgrade() -> None:
+    """Restore normalized_value as a plain column."""
+    op.execute("ALTER TABLE tag ALTER COLUMN normalized_value DROP EXPRESSION")
@@ -0,0 +1,43 @@
+"""Use (svs_id, tag_id) as the page_tag primary key.
+
+Revision ID: page_tag_composite_pk
+Revises: generated_tag_normalized_value
+Create Date: 2025-12-19 22:00:00.000000
+
+page_tag is a pure junction table. The natural key replaces the surrogate
+UUID primary key, the uq_page_tag unique constraint and the svs_id index
+(the PK leads with svs_id), leaving two btrees instead of four.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "page_tag_composite_pk"
+down_revision: str | None = "generated_tag_normalized_value"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Replace surrogate key with composite primary key."""
+    op.drop_constraint("pk_page_tag", "page_tag", type_="primary")
+    op.drop_column("page_tag", "id")
+    op.drop_constraint("uq_page_tag", "page_tag", type_="unique")
+    op.drop_index("ix_page_tag_svs_id", table_name="page_tag")
+    op.create_primary_key("pk_page_tag", "page_tag", ["svs_id", "tag_id"])
+
+
+def downgrade() -> None:
+    """Restore surrogate UUID primary key."""
+    op.drop_constraint("pk_page_tag", "page_tag", type_="primary")
+    op.add_column(
+        "page_tag",
+        sa.Column("id", sa.UUID(), server_default=sa.text("gen_random_uuid()"), nullable=False),
+    )
+    op.create_primary_key("pk_page_tag", "page_tag", ["id"])
+    op.create_unique_constraint("uq_page_tag", "page_tag", ["svs_id", "tag_id"])
+    op.create_index("ix_page_tag_svs_id", "page_tag", ["svs_id"])
@@ -0,0 +1,37 @@
+"""Refresh planner statistics and prewarm the HNSW index.
+
+Revision ID: analyze_and_prewarm
+Revises: page_tag_composite_pk
+Create Date: 2025-12-19 23:00:00.000000
+
+The preceding revisions rebuild or rewrite most of the hot tables
+(partitioned embedding, generated columns, bytea hashes, page_tag key).
+Rewritten tables start without statistics until autovacuum gets to them,
+so analyze them explicitly and load the HNSW graph into shared buffers so
+the first searches after deploy don't pay for cold reads.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+from app.migration_helpers import prewarm_index
+
+# revision identifiers, used by Alembic.
+revision: str = "analyze_and_prewarm"
+down_revision: str | None = "page_tag_composite_pk"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+HOT_TABLES = ["svs_page", "asset", "tag", "page_tag", "page_text_chunk", "asset_text_chunk", "embedding"]
+
+
+def upgrade() -> None:
+    """Analyze hot tables and prewarm the HNSW index."""
+    for table in HOT_TABLES:
+        op.execute(f"ANALYZE {table}")
+
+    prewarm_index("ix_embedding_hnsw")
+
+
+def downgrade() -> None:
+    """Nothing to undo; statistics and buffer contents are not schema."""
@@ -0,0 +1,50 @@
+"""Make foreign keys deferrable, checked at commit.
+
+Revision ID: deferrable_foreign_keys
+Revises: analyze_and_prewarm
+Create Date: 2025-12-20 09:00:00.000000
+
+With INITIALLY DEFERRED, RI checks run when the transaction commits rather
+than after each statement, so a loader can insert children before their
+parents (pages, related pages, assets, chunks) within one transaction and
+bulk statements aren't interleaved with per-row lookups.
+
+For very large embedding backfills, drop ix_embedding_hnsw_bq before loading
+and rebuild it afterwards (see binary_quantized_hnsw) instead of paying
+per-row graph inserts.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "deferrable_foreign_keys"
+down_revision: str | None = "analyze_and_prewarm"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+FOREIGN_KEYS = [
+    ("svs_page_relation", "fk_svs_page_relation_source_svs_id_svs_page"),
+    ("svs_page_relation", "fk_svs_page_relation_target_svs_id_svs_page"),
+    ("asset", "fk_asset_svs_id_svs_page"),
+    ("asset_file", "fk_asset_file_asset_id_asset"),
+    ("asset_thumbnail", "fk_asset_thumbnail_asset_id_asset"),
+    ("page_tag", "fk_page_tag_svs_id_svs_page"),
+    ("page_tag", "fk_page_tag_tag_id_tag"),
+    ("page_text_chunk", "fk_page_text_chunk_svs_id_svs_page"),
+    ("asset_text_chunk", "fk_asset_text_chunk_asset_id_asset"),
+    ("ingest_item", "fk_ingest_item_run_id_ingest_run"),
+]
+
+
+def upgrade() -> None:
+    """Make foreign keys deferrable, initially deferred."""
+    for table, constraint in FOREIGN_KEYS:
+        op.execute(f"ALTER TABLE {table} ALTER CONSTRAINT {constraint} DEFERRABLE INITIALLY DEFERRED")
+
+
+def downgrade() -> None:
+    """Make foreign keys immediate again."""
+    for table, constraint in FOREIGN_KEYS:
+        op.execute(f"ALTER TABLE {table} ALTER CONSTRAINT {constraint} NOT DEFERRABLE")
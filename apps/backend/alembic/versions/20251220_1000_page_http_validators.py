@@ -0,0 +1,34 @@
+"""Store HTTP cache validators for crawled pages.
+
+Revision ID: page_http_validators
+Revises: deferrable_foreign_keys
+Create Date: 2025-12-20 10:00:00.000000
+
+Recrawls send the stored ETag / Last-Modified back as If-None-Match /
+If-Modified-Since, so unchanged pages come back as an empty 304 instead
+of the full HTML.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "page_http_validators"
+down_revision: str | None = "deferrable_foreign_keys"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add etag and last_modified columns to svs_page."""
+    op.add_column("svs_page", sa.Column("etag", sa.String(200), nullable=True))
+    op.add_column("svs_page", sa.Column("last_modified", sa.String(100), nullable=True))
+
+
+def downgrade() -> None:
+    """Remove etag and last_modified columns."""
+    op.drop_column("svs_page", "last_modified")
+    op.drop_column("svs_page", "etag")
@@ -0,0 +1,63 @@
+"""Index binary-quantized embeddings for HNSW search.
+
+Revision ID: binary_quantized_hnsw
+Revises: page_http_validators
+Create Date: 2025-12-20 11:00:00.000000
+
+Replace the halfvec HNSW index with one over binary_quantize(embedding):
+one bit per dimension, so the graph holds 128 bytes per vector instead of
+2 KB and stays in memory. Searches take a Hamming-distance candidate set
+from this index and rerank it by exact cosine distance on the stored
+halfvec (see RetrievalService._vector_search). Requires pgvector >= 0.7.
+
+On an empty partition (a fresh install) the index is not built, so bulk
+embedding loads don't pay per-row graph inserts; run `make build-index`
+(svs-ingest build-index) once the first load is done.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+from app.migration_helpers import (
+    create_index_concurrently,
+    drop_index_concurrently,
+    index_build_settings,
+    prewarm_index,
+    table_has_rows,
+)
+
+# revision identifiers, used by Alembic.
+revision: str = "binary_quantized_hnsw"
+down_revision: str | None = "page_http_validators"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Build the binary-quantized HNSW index, then drop the halfvec one."""
+    if not table_has_rows("embedding_current"):
+        # Fresh install: build after the first bulk load (make build-index)
+        drop_index_concurrently("ix_embedding_hnsw", "embedding_current")
+        return
+    with index_build_settings(), op.get_context().autocommit_block():
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_embedding_hnsw_bq ON embedding_current
+            USING hnsw ((binary_quantize(embedding)::bit(1024)) bit_hamming_ops)
+            WITH (m = 16, ef_construction = 64)
+        """)
+    drop_index_concurrently("ix_embedding_hnsw", "embedding_current")
+    prewarm_index("ix_embedding_hnsw_bq")
+
+
+def downgrade() -> None:
+    """Restore the halfvec HNSW index."""
+    create_index_concurrently(
+        "ix_embedding_hnsw",
+        "embedding_current",
+        ["embedding"],
+        postgresql_using="hnsw",
+        postgresql_with={"m": 16, "ef_construction": 64},
+        postgresql_ops={"embedding": "halfvec_cosine_ops"},
+    )
+    drop_index_concurrently("ix_embedding_hnsw_bq", "embedding_current")
+    prewarm_index("ix_embedding_hnsw")
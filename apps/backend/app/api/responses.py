@@ -0,0 +1,20 @@
+"""Response classes shared by API routers."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class OrjsonResponse(JSONResponse):
+    """
+    JSON response rendered with orjson.
+
+    Defined locally rather than using fastapi.responses.ORJSONResponse, which
+    newer FastAPI releases deprecate.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
@@ -2,28 +2,40 @@
 
 from __future__ import annotations
 
+import hmac
+from datetime import datetime
 from uuid import UUID
 
-from fastapi import APIRouter, BackgroundTasks, Depends, Header, HTTPException
+from arq import ArqRedis
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
 from pydantic import BaseModel, Field
-from sqlalchemy import select
+from sqlalchemy import select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.pagination import decode_cursor, encode_cursor
+from app.api.responses import OrjsonResponse
 from app.config import get_settings
-from app.database import get_db
+from app.database import get_db, get_db_ro
 from app.ingestion.pipeline import IngestionPipeline
 from app.middleware.rate_limit import rate_limit_admin
 from app.models import IngestRun
+from app.redis import get_redis
+from app.task_queue import get_task_queue
+from app.worker import content_update_status_key, set_content_update_status
 
 router = APIRouter(dependencies=[Depends(rate_limit_admin)])
 settings = get_settings()
 
+# Bound once at import; None when the admin API is disabled
+_ADMIN_KEY = settings.admin_api_key.encode() or None
+
 
 async def verify_api_key(x_api_key: str = Header(..., description="Admin API key")) -> str:
     """Verify admin API key."""
-    if not settings.admin_api_key:
+    if _ADMIN_KEY is None:
         raise HTTPException(status_code=503, detail="Admin API not configured")
-    if x_api_key != settings.admin_api_key:
+    # Constant-time comparison so response timing doesn't leak key prefixes
+    if not hmac.compare_digest(x_api_key.encode(), _ADMIN_KEY):
         raise HTTPException(status_code=401, detail="Invalid API key")
     return x_api_key
 
@@ -68,47 +80,17 @@ class IngestStatusResponse(BaseModel):
     error_summary: str | None
 
 
-async def run_ingestion_task(
-    run_id: UUID,
-    mode: str,
-    svs_ids: list[int] | None,
-    skip_existing: bool,
-    max_pages: int | None,
-) -> None:
-    """Background task to run ingestion."""
-    from app.database import async_session_maker
-
-    async with async_session_maker() as session:
-        pipeline = IngestionPipeline(session)
-        try:
-            if mode == "discovery":
-                await pipeline.run_discovery(run_id)
-            else:
-                await pipeline.run_html_crawl(
-                    run_id,
-                    svs_ids=svs_ids,
-                    skip_existing=skip_existing,
-                    max_pages=max_pages,
-                )
-        except Exception as e:
-            await pipeline.update_run_status(
-                run_id,
-                "failed",
-                error_summary=str(e),
-            )
-
-
 @router.post("/ingest/run", response_model=IngestResponse)
 async def start_ingestion(
     request: IngestRequest,
-    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
+    queue: ArqRedis = Depends(get_task_queue),
     _api_key: str = Depends(verify_api_key),
 ) -> IngestResponse:
     """
     Start an ingestion run.
 
-    Runs asynchronously in the background. Use /ingest/status/{run_id}
+    The run is queued for the ARQ worker. Use /ingest/status/{run_id}
     to check progress.
 
     Requires admin API key authentication.
@@ -125,10 +107,10 @@ async def start_ingestion(
         },
     )
 
-    # Start background task
-    background_tasks.add_task(
-        run_ingestion_task,
-        run.run_id,
+    # Queue for the worker
+    await queue.enqueue_job(
+        "run_ingestion",
+        str(run.run_id),
         request.mode,
         request.svs_ids,
         request.skip_existing,
@@ -179,41 +161,67 @@ async def get_ingestion_status(
     )
 
 
-@router.get("/ingest/runs")
+@router.get("/ingest/runs", response_class=OrjsonResponse, responses={200: {"model": list[IngestStatusResponse]}})
 async def list_ingestion_runs(
-    limit: int = 20,
-    db: AsyncSession = Depends(get_db),
+    limit: int = Query(20, ge=1, le=1000),
+    cursor: str | None = Query(None, description="Value of X-Next-Cursor from a previous response"),
+    db: AsyncSession = Depends(get_db_ro),
     _api_key: str = Depends(verify_api_key),
-) -> list[IngestStatusResponse]:
+) -> OrjsonResponse:
     """
-    List recent ingestion runs.
+    List recent ingestion runs, newest first.
+
+    Uses keyset pagination on (created_at, run_id). When more runs exist,
+    the cursor for the next page is returned in the X-Next-Cursor header.
+    Rows are streamed from the database and serialized as plain dicts in the
+    IngestStatusResponse shape, skipping per-row model validation.
 
     Requires admin API key authentication.
     """
-    result = await db.execute(select(IngestRun).order_by(IngestRun.created_at.desc()).limit(limit))
-    runs = result.scalars().all()
-
-    return [
-        IngestStatusResponse(
-            run_id=str(run.run_id),
-            status=run.status,
-            mode=run.mode,
-            total_items=run.total_items,
-            processed_items=run.processed_items,
-            success_count=run.success_count,
-            error_count=run.error_count,
-            skipped_count=run.skipped_count,
-            started_at=run.started_at.isoformat() if run.started_at else None,
-            completed_at=run.completed_at.isoformat() if run.completed_at else None,
-            error_summary=run.error_summary,
+    query = select(IngestRun).order_by(IngestRun.created_at.desc(), IngestRun.run_id.desc())
+    if cursor:
+        position = decode_cursor(cursor)
+        try:
+            created_at = datetime.fromisoformat(position["created_at"])
+            run_id = UUID(position["run_id"])
+        except (KeyError, TypeError, ValueError):
+            raise HTTPException(status_code=400, detail={"code": "INVALID_CURSOR", "message": "Malformed cursor"})
+        query = query.where(tuple_(IngestRun.created_at, IngestRun.run_id) < (created_at, run_id))
+
+    rows = []
+    headers = {}
+    last = None
+    async for run in await db.stream_scalars(query.limit(limit + 1)):
+        if len(rows) == limit:
+            # One row past the page: more runs exist
+            headers["X-Next-Cursor"] = encode_cursor(
+                {"created_at": last.created_at.isoformat(), "run_id": str(last.run_id)}
+            )
+            break
+        rows.append(
+            {
+                "run_id": str(run.run_id),
+                "status": run.status,
+                "mode": run.mode,
+                "total_items": run.total_items,
+                "processed_items": run.processed_items,
+                "success_count": run.success_count,
+                "error_count": run.error_count,
+                "skipped_count": run.skipped_count,
+                "started_at": run.started_at.isoformat() if run.started_at else None,
+                "completed_at": run.completed_at.isoformat() if run.completed_at else None,
+                "error_summary": run.error_summary,
+            }
         )
-        for run in runs
-    ]
+        last = run
+
+    return OrjsonResponse(content=rows, headers=headers)
 
 
 class ContentUpdateResponse(BaseModel):
     """Content update response model."""
 
+    task_id: str | None = None
     status: str
     message: str
     processed: int = 0
@@ -221,48 +229,10 @@ class ContentUpdateResponse(BaseModel):
     errors: int = 0
 
 
-# Track content update status (simple in-memory for now)
-_content_update_status: dict[str, ContentUpdateResponse] = {}
-
-
-async def run_content_update_task(
-    task_id: str,
-    batch_size: int,
-    priority_first: bool,
-) -> None:
-    """Background task to run content update."""
-    from app.database import async_session_maker
-
-    _content_update_status[task_id] = ContentUpdateResponse(
-        status="running",
-        message="Content update in progress...",
-    )
-
-    async with async_session_maker() as session:
-        pipeline = IngestionPipeline(session)
-        try:
-            processed, success, errors = await pipeline.run_content_update(
-                batch_size=batch_size,
-                priority_first=priority_first,
-            )
-            _content_update_status[task_id] = ContentUpdateResponse(
-                status="completed",
-                message=f"Content update complete: {processed} processed, {success} success, {errors} errors",
-                processed=processed,
-                success=success,
-                errors=errors,
-            )
-        except Exception as e:
-            _content_update_status[task_id] = ContentUpdateResponse(
-                status="failed",
-                message=f"Content update failed: {e!s}",
-            )
-
-
 @router.post("/ingest/content-update", response_model=ContentUpdateResponse)
 async def start_content_update(
     request: ContentUpdateRequest,
-    background_tasks: BackgroundTasks,
+    queue: ArqRedis = Depends(get_task_queue),
     _api_key: str = Depends(verify_api_key),
 ) -> ContentUpdateResponse:
     """
@@ -272,7 +242,7 @@ async def start_content_update(
     Useful for backfilling pages that were crawled before the rich content
     extraction was implemented.
 
-    Runs asynchronously in the background.
+    The task is queued for the ARQ worker.
 
     Requires admin API key authentication.
     """
@@ -280,15 +250,39 @@ async def start_content_update(
 
     task_id = str(uuid.uuid4())
 
-    # Start background task
-    background_tasks.add_task(
-        run_content_update_task,
+    await set_content_update_status(queue, task_id, status="queued", message="Content update queued")
+    await queue.enqueue_job(
+        "run_content_update",
         task_id,
         request.batch_size,
         request.priority_first,
     )
 
     return ContentUpdateResponse(
+        task_id=task_id,
         status="started",
         message=f"Content update started. Task ID: {task_id}",
     )
+
+
+@router.get("/ingest/content-update/{task_id}", response_model=ContentUpdateResponse)
+async def get_content_update_status(
+    task_id: str,
+    _api_key: str = Depends(verify_api_key),
+) -> ContentUpdateResponse:
+    """
+    Get status of a content update task.
+
+    Status is kept in Redis for a day after the task last reported progress.
+
+    Requires admin API key authentication.
+    """
+    redis = await get_redis()
+    if redis is None:
+        raise HTTPException(status_code=503, detail="Task status unavailable")
+
+    status = await redis.hgetall(content_update_status_key(task_id))
+    if not status:
+        raise HTTPException(status_code=404, detail="Content update task not found")
+
+    return ContentUpdateResponse(task_id=task_id, **status)
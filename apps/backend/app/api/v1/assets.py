@@ -9,7 +9,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from app.database import get_db
+from app.database import get_db_ro
 from app.models import Asset
 from app.schemas.asset import (
     AssetDetailResponse,
@@ -24,7 +24,7 @@ router = APIRouter()
 @router.get("/assets/{asset_id}", response_model=AssetDetailResponse)
 async def get_asset(
     asset_id: UUID = Path(..., description="Asset UUID"),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db_ro),
 ) -> AssetDetailResponse:
     """
     Get detailed information about an asset.
@@ -2,16 +2,19 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
+import re
 import uuid
+from collections.abc import AsyncIterator
 
+import orjson
 from fastapi import APIRouter, Depends
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
+from app.database import get_db, read_session_maker
 from app.middleware.rate_limit import rate_limit_chat
 from app.services.rag import RAGService
 
@@ -19,6 +22,76 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Inline citation marker emitted by the LLM, e.g. [SVS-5502]
+_CITATION_RE = re.compile(r"\[SVS-(\d+)\]")
+# Longest marker we expect; text older than this cannot start a partial match
+_MAX_CITATION_LEN = 16
+
+# Pre-encoded SSE frame parts; events are built as bytes so Starlette sends them as-is
+_TOKEN_PREFIX = b"event: token\ndata: "
+_CITATION_PREFIX = b"event: citation\ndata: "
+_SSE_SUFFIX = b"\n\n"
+
+# Fixed frames and templates; %s slots take orjson-encoded (already quoted/escaped) values
+_NO_CONTEXT_FRAME = (
+    _TOKEN_PREFIX
+    + orjson.dumps({"content": "I couldn't find any relevant information in the SVS archive to answer your question."})
+    + _SSE_SUFFIX
+)
+_DONE_FRAME = b'event: done\ndata: {"conversation_id":%s,"token_count":%d}\n\n'
+_ERROR_FRAME = b'event: error\ndata: {"content":%s}\n\n'
+
+# Tokens are coalesced into one frame until this many bytes are buffered...
+_TOKEN_FLUSH_BYTES = 512
+# ...or this many seconds have passed since the last frame
+_TOKEN_FLUSH_INTERVAL = 0.025
+
+
+async def _coalesce_tokens(tokens: AsyncIterator[str]) -> AsyncIterator[tuple[str, int]]:
+    """
+    Group streamed tokens into larger chunks to cut per-frame write overhead.
+
+    A chunk is emitted once it reaches _TOKEN_FLUSH_BYTES, or when
+    _TOKEN_FLUSH_INTERVAL passes without the buffer being flushed, so a slow
+    stream still shows text promptly.
+
+    Yields:
+        Tuples of (chunk text, number of tokens in the chunk)
+    """
+    loop = asyncio.get_running_loop()
+    iterator = aiter(tokens)
+    buffer: list[str] = []
+    buffered_bytes = 0
+    last_flush = loop.time()
+    # The pending read is awaited with asyncio.wait rather than wait_for, so a
+    # flush timeout never cancels (and thereby closes) the token stream
+    next_token = asyncio.ensure_future(anext(iterator))
+    try:
+        while True:
+            timeout = max(0.0, _TOKEN_FLUSH_INTERVAL - (loop.time() - last_flush)) if buffer else None
+            done, _ = await asyncio.wait({next_token}, timeout=timeout)
+            if not done:
+                yield "".join(buffer), len(buffer)
+                buffer, buffered_bytes, last_flush = [], 0, loop.time()
+                continue
+
+            try:
+                token = next_token.result()
+            except StopAsyncIteration:
+                break
+            next_token = asyncio.ensure_future(anext(iterator))
+
+            buffer.append(token)
+            buffered_bytes += len(token)
+            if buffered_bytes >= _TOKEN_FLUSH_BYTES:
+                yield "".join(buffer), len(buffer)
+                buffer, buffered_bytes, last_flush = [], 0, loop.time()
+
+        if buffer:
+            yield "".join(buffer), len(buffer)
+    finally:
+        next_token.cancel()
+
 
 class ChatRequest(BaseModel):
     """Chat query request model."""
@@ -32,13 +105,12 @@ class ChatRequest(BaseModel):
 @router.post("/chat/query", dependencies=[Depends(rate_limit_chat)])
 async def chat_query(
     request: ChatRequest,
-    db: AsyncSession = Depends(get_db),
 ) -> StreamingResponse:
     """
     Ask a question about SVS content.
 
     Returns a streaming SSE response with:
-    - token events: Individual response tokens
+    - token events: Response text (tokens batched into small frames)
     - citation events: Source citations
     - done event: Completion with metadata
 
@@ -54,85 +126,71 @@ async def chat_query(
     data: {"conversation_id": "...", "token_count": 150}
     ```
     """
-    rag_service = RAGService(db)
     conversation_id = request.conversation_id or str(uuid.uuid4())
+    conversation_id_json = orjson.dumps(conversation_id)
 
     async def generate():
         token_count = 0
         response_text = ""
         citations_sent = set()
+        scan_pos = 0
 
         try:
-            # Retrieve context
-            try:
-                context = await rag_service.retrieve_context(
-                    request.query,
-                    limit=5,
-                    context_svs_id=request.context_svs_id,
-                )
-            except Exception as e:
-                logger.warning(f"Embedding retrieval failed, using fallback: {e}")
-                # Rollback the failed transaction before fallback
-                await db.rollback()
-                context = await rag_service.retrieve_context_fallback(
+            # Retrieve context on a short-lived session; it is closed (and its
+            # connection returned to the pool) before the LLM stream starts
+            async with read_session_maker() as session:
+                rag_service = RAGService(session)
+                context = await rag_service.retrieve_context_with_fallback(
                     request.query,
                     limit=5,
                     context_svs_id=request.context_svs_id,
                 )
 
             if not context:
-                yield 'event: token\ndata: {"content": "I couldn\'t find any relevant information in the SVS archive to answer your question."}\n\n'
-                yield f'event: done\ndata: {{"conversation_id": "{conversation_id}", "token_count": 0}}\n\n'
+                yield _NO_CONTEXT_FRAME
+                yield _DONE_FRAME % (conversation_id_json, 0)
                 return
 
-            # Stream the response
-            async for token in rag_service.generate_response_stream(request.query, context):
-                response_text += token
-                token_count += 1
+            # First chunk per page is the one cited
+            context_by_id = {}
+            for chunk in context:
+                context_by_id.setdefault(chunk.svs_id, chunk)
+
+            # Stream the response, several tokens per frame
+            async for text, n_tokens in _coalesce_tokens(rag_service.generate_response_stream(request.query, context)):
+                response_text += text
+                token_count += n_tokens
 
                 # Send token event
-                token_data = json.dumps({"content": token})
-                yield f"event: token\ndata: {token_data}\n\n"
-
-                # Check for new citations in accumulated text
-                import re
-
-                matches = re.findall(r"\[SVS-(\d+)\]", response_text)
-                for svs_id_str in matches:
-                    svs_id = int(svs_id_str)
-                    if svs_id not in citations_sent:
-                        # Find the matching chunk
-                        for chunk in context:
-                            if chunk.svs_id == svs_id:
-                                citations_sent.add(svs_id)
-                                citation_data = json.dumps(
-                                    {
-                                        "svs_id": chunk.svs_id,
-                                        "title": chunk.title,
-                                        "chunk_id": str(chunk.chunk_id),
-                                        "section": chunk.section,
-                                        "anchor": f"svs-{chunk.svs_id}",
-                                        "excerpt": chunk.content[:200] + "..."
-                                        if len(chunk.content) > 200
-                                        else chunk.content,
-                                    }
-                                )
-                                yield f"event: citation\ndata: {citation_data}\n\n"
-                                break
+                yield _TOKEN_PREFIX + orjson.dumps({"content": text}) + _SSE_SUFFIX
+
+                # Check for new citations in the unscanned tail of the text
+                for match in _CITATION_RE.finditer(response_text, scan_pos):
+                    scan_pos = match.end()
+                    svs_id = int(match.group(1))
+                    chunk = context_by_id.get(svs_id)
+                    if chunk is None or svs_id in citations_sent:
+                        continue
+                    citations_sent.add(svs_id)
+                    citation_data = orjson.dumps(
+                        {
+                            "svs_id": chunk.svs_id,
+                            "title": chunk.title,
+                            "chunk_id": str(chunk.chunk_id),
+                            "section": chunk.section,
+                            "anchor": f"svs-{chunk.svs_id}",
+                            "excerpt": chunk.content[:200] + "..." if len(chunk.content) > 200 else chunk.content,
+                        }
+                    )
+                    yield _CITATION_PREFIX + citation_data + _SSE_SUFFIX
+                scan_pos = max(scan_pos, len(response_text) - _MAX_CITATION_LEN)
 
             # Send done event
-            done_data = json.dumps(
-                {
-                    "conversation_id": conversation_id,
-                    "token_count": token_count,
-                }
-            )
-            yield f"event: done\ndata: {done_data}\n\n"
+            yield _DONE_FRAME % (conversation_id_json, token_count)
 
         except Exception as e:
             logger.error(f"Error in chat stream: {e}")
-            error_data = json.dumps({"content": f"An error occurred: {str(e)}"})
-            yield f"event: error\ndata: {error_data}\n\n"
+            yield _ERROR_FRAME % orjson.dumps(f"An error occurred: {str(e)}")
 
     return StreamingResponse(
         generate(),
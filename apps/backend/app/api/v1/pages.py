@@ -2,11 +2,23 @@
 
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException, Path, Query
+import hashlib
+
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Path, Query, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
-from app.schemas.page import PageDetailResponse, PageListResponse, SearchResult
+from app.api.pagination import decode_cursor, encode_cursor
+from app.api.responses import OrjsonResponse
+from app.database import get_db_ro
+from app.schemas.page import CreditInfo, PageDetailResponse, PageListResponse, SearchResult, TagInfo
+from app.services.cache import (
+    RECENT_HIGHLIGHTS_MAX_LIMIT,
+    RECENT_HIGHLIGHTS_TTL,
+    cache_get_json,
+    cache_set_json,
+    recent_highlights_key,
+)
 from app.services.page import PageService
 
 router = APIRouter()
@@ -14,24 +26,42 @@ router = APIRouter()
 
 @router.get("/pages/recent", response_model=list[SearchResult])
 async def get_recent_highlights(
-    limit: int = Query(6, ge=1, le=20, description="Number of recent items"),
-    db: AsyncSession = Depends(get_db),
-) -> list[SearchResult]:
+    request: Request,
+    limit: int = Query(6, ge=1, le=RECENT_HIGHLIGHTS_MAX_LIMIT, description="Number of recent items"),
+    db: AsyncSession = Depends(get_db_ro),
+) -> list[SearchResult] | Response:
     """
     Get recent SVS pages for homepage highlights.
 
     Returns pages ordered by publication date that have:
     - Been fully crawled (have content)
     - Have a thumbnail image
+
+    Results are cached in Redis for a minute and served with an ETag.
     """
-    service = PageService(db)
-    return await service.get_recent_highlights(limit=limit)
+    cache_key = recent_highlights_key(limit)
+    payload = await cache_get_json(cache_key)
+    if payload is None:
+        service = PageService(db)
+        highlights = await service.get_recent_highlights(limit=limit)
+        payload = [h.model_dump(mode="json") for h in highlights]
+        await cache_set_json(cache_key, payload, RECENT_HIGHLIGHTS_TTL)
+
+    body = orjson.dumps(payload)
+    etag = f'"{hashlib.md5(body, usedforsecurity=False).hexdigest()}"'
+    headers = {
+        "ETag": etag,
+        "Cache-Control": f"public, max-age=0, s-maxage={RECENT_HIGHLIGHTS_TTL}",
+    }
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
 
 
 @router.get("/svs/{svs_id}", response_model=PageDetailResponse)
 async def get_page(
     svs_id: int = Path(..., ge=1, description="SVS page ID"),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db_ro),
 ) -> PageDetailResponse:
     """
     Get detailed information about an SVS page.
@@ -58,20 +88,41 @@ async def get_page(
     return page
 
 
-@router.get("/pages", response_model=PageListResponse)
+@router.get("/pages", response_model=None, responses={200: {"model": PageListResponse}})
 async def list_pages(
     limit: int = Query(20, ge=1, le=100, description="Results per page"),
-    offset: int = Query(0, ge=0, description="Pagination offset"),
-    db: AsyncSession = Depends(get_db),
-) -> PageListResponse:
+    offset: int = Query(0, ge=0, description="Pagination offset (prefer cursor)"),
+    cursor: str | None = Query(None, description="Opaque cursor from a previous next/previous URL"),
+    db: AsyncSession = Depends(get_db_ro),
+) -> OrjsonResponse:
     """
-    List SVS pages with pagination.
+    List SVS pages with keyset pagination.
+
+    Follow the next/previous URLs to page through results; they carry a
+    cursor so deep pages cost the same as the first one. The total count
+    is only returned on the first page.
 
     This endpoint is primarily for admin/development use.
     For searching content, use /search instead.
     """
+    after_svs_id = before_svs_id = None
+    if cursor:
+        position = decode_cursor(cursor)
+        try:
+            if "before" in position:
+                before_svs_id = int(position["before"])
+            else:
+                after_svs_id = int(position["after"])
+        except (KeyError, TypeError, ValueError):
+            raise HTTPException(status_code=400, detail={"code": "INVALID_CURSOR", "message": "Malformed cursor"})
+
     service = PageService(db)
-    pages, total = await service.list_pages(limit=limit, offset=offset)
+    pages, total, has_more = await service.list_pages(
+        limit=limit,
+        offset=0 if cursor else offset,
+        after_svs_id=after_svs_id,
+        before_svs_id=before_svs_id,
+    )
 
     # Convert to response format
     results = []
@@ -83,8 +134,15 @@ async def list_pages(
                 canonical_url=page.canonical_url,
                 published_date=page.published_date,
                 summary=page.description or page.summary,
-                credits=[],
-                tags=[],
+                credits=[
+                    CreditInfo(
+                        role=credit.get("role", ""),
+                        name=credit.get("name", ""),
+                        organization=credit.get("organization"),
+                    )
+                    for credit in page.credits_json or []
+                ],
+                tags=[TagInfo(type=pt.tag.tag_type, value=pt.tag.value) for pt in page.tags],
                 assets=[],
                 related_pages=[],
             )
@@ -92,14 +150,19 @@ async def list_pages(
 
     next_url = None
     prev_url = None
-    if offset + limit < total:
-        next_url = f"/api/v1/pages?offset={offset + limit}&limit={limit}"
-    if offset > 0:
-        prev_url = f"/api/v1/pages?offset={max(0, offset - limit)}&limit={limit}"
-
-    return PageListResponse(
+    if pages:
+        backwards = before_svs_id is not None
+        if has_more or backwards:
+            next_url = f"/api/v1/pages?cursor={encode_cursor({'after': pages[-1].svs_id})}&limit={limit}"
+        if (has_more and backwards) or (not backwards and (cursor or offset > 0)):
+            prev_url = f"/api/v1/pages?cursor={encode_cursor({'before': pages[0].svs_id})}&limit={limit}"
+
+    # Models are validated on construction; dump once and skip FastAPI's
+    # response_model re-validation
+    response = PageListResponse(
         count=total,
         results=results,
         next=next_url,
         previous=prev_url,
     )
+    return OrjsonResponse(content=response.model_dump(mode="json"))
@@ -5,12 +5,13 @@ from __future__ import annotations
 from datetime import date
 from enum import Enum
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
+from app.database import get_db_ro
 from app.middleware.rate_limit import rate_limit_search
 from app.schemas.page import MediaType, SearchResponse, SortOption
+from app.services.cache import SEARCH_RESULTS_TTL, cache_get_raw, cache_set_json, search_results_key
 from app.services.search import SearchService
 
 router = APIRouter()
@@ -32,7 +33,7 @@ async def browse(
     sort: BrowseSortOption = Query(BrowseSortOption.DATE_DESC, description="Sort order"),
     limit: int = Query(20, ge=1, le=100, description="Results per page"),
     offset: int = Query(0, ge=0, description="Pagination offset"),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db_ro),
 ) -> SearchResponse:
     """
     Browse all SVS visualizations without a search query.
@@ -68,8 +69,8 @@ async def search(
     sort: SortOption = Query(SortOption.RELEVANCE, description="Sort order"),
     limit: int = Query(20, ge=1, le=100, description="Results per page"),
     offset: int = Query(0, ge=0, description="Pagination offset"),
-    db: AsyncSession = Depends(get_db),
-) -> SearchResponse:
+    db: AsyncSession = Depends(get_db_ro),
+) -> SearchResponse | Response:
     """
     Search SVS visualizations.
 
@@ -80,9 +81,31 @@ async def search(
     - Sorting by relevance or date
 
     If the query is a numeric SVS ID (e.g., "5502"), it performs a direct lookup.
+
+    Responses are cached in Redis for a short time, keyed by the query and
+    filters exactly as given: the cached body echoes them in its pagination
+    URLs, so requests differing only in case or order must not share it.
     """
+    cache_key = search_results_key(
+        {
+            "q": q,
+            "media_type": [mt.value for mt in media_type] if media_type else None,
+            "domain": domain,
+            "mission": mission,
+            "date_from": date_from,
+            "date_to": date_to,
+            "sort": sort.value,
+            "limit": limit,
+            "offset": offset,
+        }
+    )
+    cached = await cache_get_raw(cache_key)
+    if cached is not None:
+        # Already a serialized SearchResponse; send it without parsing and re-validating
+        return Response(content=cached, media_type="application/json")
+
     service = SearchService(db)
-    return await service.search(
+    response = await service.search(
         query=q,
         media_types=media_type,
         domain=domain,
@@ -93,3 +116,6 @@ async def search(
         limit=limit,
         offset=offset,
     )
+
+    await cache_set_json(cache_key, response.model_dump(mode="json"), SEARCH_RESULTS_TTL)
+    return response
@@ -1,17 +1,18 @@
 """Thumbnails API endpoints for serving cached thumbnails."""
 
-from fastapi import APIRouter, Depends, HTTPException, Path
-from fastapi.responses import RedirectResponse, Response
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, Depends, HTTPException, Path, Request
+from fastapi.responses import RedirectResponse, Response, StreamingResponse
+from starlette.concurrency import run_in_threadpool
 
-from app.database import get_db
-from app.models import SvsPage
+from app.database import get_pg_pool
+from app.services.cache import THUMBNAIL_LOOKUP_TTL, cache_get_json, cache_set_json, thumbnail_lookup_key
 from app.services.storage import MinioStorageService, get_storage_service
 from app.services.thumbnail import ThumbnailService
 
 router = APIRouter()
 
+THUMBNAIL_LOCATION_SQL = "SELECT thumbnail_storage_uri, thumbnail_url FROM svs_page WHERE svs_id = $1"
+
 
 def get_thumbnail_service(
     storage: MinioStorageService = Depends(get_storage_service),
@@ -22,50 +23,79 @@ def get_thumbnail_service(
 
 @router.get("/thumbnails/pages/{svs_id}")
 async def get_page_thumbnail(
+    request: Request,
     svs_id: int = Path(..., description="SVS page ID"),
-    db: AsyncSession = Depends(get_db),
     thumbnail_service: ThumbnailService = Depends(get_thumbnail_service),
 ) -> Response:
     """
     Get cached thumbnail for an SVS page.
 
     Returns:
-    - Cached thumbnail from MinIO if available (200 with image data)
+    - 307 redirect to a presigned MinIO URL for cached thumbnails when a
+      public storage endpoint is configured
+    - Cached thumbnail streamed from MinIO otherwise (200 with image
+      data, or 304 when If-None-Match matches the stored ETag)
     - 307 redirect to external URL if not cached locally
     - 404 if page has no thumbnail
     """
-    # Query page for thumbnail info
-    query = select(SvsPage).where(SvsPage.svs_id == svs_id)
-    result = await db.execute(query)
-    page = result.scalar_one_or_none()
+    # Look up thumbnail location, skipping the DB when it is cached
+    cache_key = thumbnail_lookup_key(svs_id)
+    location = await cache_get_json(cache_key)
+    if location is None:
+        # Single-row read on the raw asyncpg pool, skipping ORM overhead
+        pool = await get_pg_pool()
+        row = await pool.fetchrow(THUMBNAIL_LOCATION_SQL, svs_id)
 
-    if not page:
-        raise HTTPException(
-            status_code=404,
-            detail={
-                "code": "PAGE_NOT_FOUND",
-                "message": f"Page SVS-{svs_id} not found",
-            },
-        )
+        if not row:
+            raise HTTPException(
+                status_code=404,
+                detail={
+                    "code": "PAGE_NOT_FOUND",
+                    "message": f"Page SVS-{svs_id} not found",
+                },
+            )
+
+        location = {"storage_uri": row["thumbnail_storage_uri"], "url": row["thumbnail_url"]}
+        await cache_set_json(cache_key, location, THUMBNAIL_LOOKUP_TTL)
 
-    # If we have a cached thumbnail, serve it from MinIO
-    if page.thumbnail_storage_uri:
-        thumbnail_data = thumbnail_service.get_thumbnail_data(page.thumbnail_storage_uri)
-        if thumbnail_data:
-            data, content_type = thumbnail_data
-            return Response(
-                content=data,
-                media_type=content_type,
+    # If we have a cached thumbnail and a public storage endpoint, send the
+    # client straight to MinIO/CDN so the bytes never pass through the API
+    if location["storage_uri"]:
+        presigned_url = thumbnail_service.get_thumbnail_url(location["storage_uri"])
+        if presigned_url:
+            return RedirectResponse(
+                url=presigned_url,
+                status_code=307,
                 headers={
-                    "Cache-Control": "public, max-age=86400",  # Cache for 24 hours
-                    "X-Thumbnail-Source": "cache",
+                    # Shorter than the presigned URL's lifetime so a cached redirect never points at an expired URL
+                    "Cache-Control": "public, max-age=1800",
+                    "X-Thumbnail-Source": "cache-presigned",
                 },
             )
 
+    # Otherwise stream the cached thumbnail from MinIO
+    if location["storage_uri"]:
+        # The MinIO client is blocking; open the object off the event loop
+        thumbnail = await run_in_threadpool(thumbnail_service.get_thumbnail_stream, location["storage_uri"])
+        if thumbnail:
+            stream, content_type, size, etag = thumbnail
+            headers = {
+                "Cache-Control": "public, max-age=86400",  # Cache for 24 hours
+                "X-Thumbnail-Source": "cache",
+            }
+            if etag:
+                headers["ETag"] = etag
+                if request.headers.get("if-none-match") == etag:
+                    await run_in_threadpool(stream.close)
+                    return Response(status_code=304, headers=headers)
+            if size is not None:
+                headers["Content-Length"] = str(size)
+            return StreamingResponse(stream, media_type=content_type, headers=headers)
+
     # If we have an external URL but no cache, redirect to it
-    if page.thumbnail_url:
+    if location["url"]:
         return RedirectResponse(
-            url=page.thumbnail_url,
+            url=location["url"],
             status_code=307,  # Temporary redirect
             headers={
                 "X-Thumbnail-Source": "external",
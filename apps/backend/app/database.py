@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Sequence
 
-from sqlalchemy import text
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+import asyncpg
+from sqlalchemy import Executable, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 
 from app.config import get_settings
 
@@ -14,16 +16,33 @@ logger = logging.getLogger(__name__)
 
 settings = get_settings()
 
+
+def _create_engine(url: str, application_name: str) -> AsyncEngine:
+    """Create an async engine with the shared pool and driver settings."""
+    return create_async_engine(
+        url,
+        echo=settings.debug,
+        pool_pre_ping=True,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout,
+        pool_recycle=settings.db_pool_recycle,
+        connect_args={
+            "statement_cache_size": settings.db_statement_cache_size,
+            "prepared_statement_cache_size": settings.db_statement_cache_size // 2,
+            # Short OLTP queries; JIT compilation costs more than it saves
+            "server_settings": {"jit": "off", "application_name": application_name},
+        },
+    )
+
+
 # Create async engine
-engine = create_async_engine(
-    settings.database_url,
-    echo=settings.debug,
-    pool_pre_ping=True,
-    pool_size=5,
-    max_overflow=10,
-)
+engine = _create_engine(settings.database_url, "svs-backend")
 
-# Create async session factory
+# Read-only engine: a replica when configured, otherwise the primary
+read_engine = _create_engine(settings.database_ro_url, "svs-backend-ro") if settings.database_ro_url else engine
+
+# Create async session factories
 async_session_maker = async_sessionmaker(
     engine,
     class_=AsyncSession,
@@ -31,10 +50,17 @@ async_session_maker = async_sessionmaker(
     autocommit=False,
     autoflush=False,
 )
+read_session_maker = async_sessionmaker(
+    read_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+    autocommit=False,
+    autoflush=False,
+)
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    """Dependency for database sessions."""
+    """Dependency for read-write database sessions; commits on success."""
     async with async_session_maker() as session:
         try:
             yield session
@@ -46,6 +72,83 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+async def get_db_ro() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency for read-only database sessions.
+
+    Never commits: the transaction is rolled back when the session closes,
+    saving the COMMIT round trip on GET requests.
+    """
+    async with read_session_maker() as session:
+        yield session
+
+
+# Raw asyncpg pool for hot single-row reads where ORM overhead dominates
+_pg_pool: asyncpg.Pool | None = None
+
+
+async def get_pg_pool() -> asyncpg.Pool:
+    """Get the raw asyncpg pool (against the read database), creating it on first use."""
+    global _pg_pool
+    if _pg_pool is None:
+        dsn = (settings.database_ro_url or settings.database_url).replace("postgresql+asyncpg://", "postgresql://")
+        _pg_pool = await asyncpg.create_pool(
+            dsn=dsn,
+            min_size=settings.db_raw_pool_min_size,
+            max_size=settings.db_raw_pool_max_size,
+            max_queries=50000,
+            max_inactive_connection_lifetime=600,
+            statement_cache_size=settings.db_statement_cache_size,
+            server_settings={"jit": "off", "application_name": "svs-backend-raw"},
+        )
+    return _pg_pool
+
+
+async def warm_database_pools(
+    statements: Sequence[Executable] = (),
+    raw_statements: Sequence[tuple[str, tuple]] = (),
+) -> None:
+    """
+    Open pooled connections up front and prepare hot statements on each.
+
+    Opens db_pool_size engine connections concurrently (plus the raw pool's
+    min_size) so the first burst of requests doesn't pay for connection
+    setup, and runs each statement once per connection to seed asyncpg's
+    per-connection prepared statement cache.
+
+    Args:
+        statements: SQLAlchemy statements to prepare on engine connections
+        raw_statements: (SQL, args) pairs to prepare on raw pool connections
+    """
+
+    async def warm_engine_connection() -> None:
+        async with read_engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+            for stmt in statements:
+                await conn.execute(stmt)
+
+    async def warm_raw_connection(pool: asyncpg.Pool) -> None:
+        async with pool.acquire() as conn:
+            for sql, args in raw_statements:
+                await conn.fetch(sql, *args)
+
+    await asyncio.gather(*(warm_engine_connection() for _ in range(settings.db_pool_size)))
+    pool = await get_pg_pool()
+    await asyncio.gather(*(warm_raw_connection(pool) for _ in range(settings.db_raw_pool_min_size)))
+    logger.info(f"Warmed {settings.db_pool_size} engine and {settings.db_raw_pool_min_size} raw connections")
+
+
+def get_pool_stats(pool_engine: AsyncEngine) -> dict[str, int]:
+    """Connection counts for an engine's pool, for logging and monitoring."""
+    pool = pool_engine.pool
+    return {
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "free_connections": pool.checkedin(),
+        "overflow": pool.overflow(),
+    }
+
+
 async def verify_database_connection() -> bool:
     """Verify database connection is working."""
     try:
@@ -59,9 +162,15 @@ async def verify_database_connection() -> bool:
 
 
 async def close_database_connection() -> None:
-    """Close database connection pool."""
+    """Close database connection pools."""
+    global _pg_pool
     try:
         await engine.dispose()
+        if read_engine is not engine:
+            await read_engine.dispose()
+        if _pg_pool is not None:
+            await _pg_pool.close()
+            _pg_pool = None
         logger.info("Database connection pool closed")
     except Exception as e:
         logger.error(f"Error closing database connection: {e}")
@@ -4,10 +4,14 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
+from collections.abc import AsyncIterator, Callable
 from dataclasses import dataclass
+from itertools import islice
 from typing import Any
 
 import httpx
+import orjson
 
 logger = logging.getLogger(__name__)
 
@@ -15,14 +19,22 @@ logger = logging.getLogger(__name__)
 SVS_API_BASE = "https://svs.gsfc.nasa.gov/api"
 SVS_SEARCH_URL = f"{SVS_API_BASE}/search/"
 SVS_PAGE_URL = "https://svs.gsfc.nasa.gov"
+PAGE_URL_PREFIX = f"{SVS_PAGE_URL}/"
+
+# Connection pool limits; idle connections are kept long enough to survive
+# the gaps between rate-limited requests
+HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=30.0)
 
 # Rate limiting defaults
 DEFAULT_RATE_LIMIT = 2.0  # requests per second
+DEFAULT_RATE_BURST = 5.0  # requests allowed at once after an idle period
 DEFAULT_MAX_RETRIES = 3
 DEFAULT_RETRY_DELAY = 5.0  # seconds
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+DEFAULT_DISCOVERY_CONCURRENCY = 10  # in-flight search requests during discovery
 
 
-@dataclass
+@dataclass(slots=True)
 class SvsSearchResult:
     """Individual search result from SVS API."""
 
@@ -34,7 +46,7 @@ class SvsSearchResult:
     result_type: str
 
 
-@dataclass
+@dataclass(slots=True)
 class SvsSearchResponse:
     """Response from SVS search API."""
 
@@ -44,20 +56,46 @@ class SvsSearchResponse:
     previous_url: str | None
 
 
+@dataclass(slots=True)
+class SvsPageFetch:
+    """Undecoded HTML of an SVS page with its HTTP cache validators."""
+
+    html: bytes
+    encoding: str | None  # charset from the Content-Type header, if any
+    etag: str | None
+    last_modified: str | None
+
+
 class RateLimiter:
-    """Simple rate limiter for API requests."""
+    """
+    Token-bucket rate limiter for API requests.
 
-    def __init__(self, requests_per_second: float = DEFAULT_RATE_LIMIT):
-        self.min_interval = 1.0 / requests_per_second
-        self.last_request_time: float = 0
+    Tokens refill at `requests_per_second` up to `burst`, so up to `burst`
+    requests can go out at once after an idle period while the long-run
+    rate stays at `requests_per_second`.
+    """
+
+    def __init__(self, requests_per_second: float = DEFAULT_RATE_LIMIT, burst: float = DEFAULT_RATE_BURST):
+        self.refill_rate = requests_per_second
+        self.capacity = burst
+        self.tokens = burst
+        self.last_refill: float | None = None
+        self._lock = asyncio.Lock()
 
     async def wait(self) -> None:
-        """Wait if needed to respect rate limit."""
-        now = asyncio.get_event_loop().time()
-        elapsed = now - self.last_request_time
-        if elapsed < self.min_interval:
-            await asyncio.sleep(self.min_interval - elapsed)
-        self.last_request_time = asyncio.get_event_loop().time()
+        """Wait until a request may be sent."""
+        # Only the token arithmetic is serialized; each caller reserves a token
+        # (possibly going into debt) and then sleeps off its own delay
+        async with self._lock:
+            now = time.monotonic()
+            if self.last_refill is not None:
+                self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.refill_rate)
+            self.last_refill = now
+            self.tokens -= 1
+            delay = -self.tokens / self.refill_rate if self.tokens < 0 else 0.0
+
+        if delay > 0:
+            await asyncio.sleep(delay)
 
 
 class SvsApiClient:
@@ -66,40 +104,69 @@ class SvsApiClient:
     def __init__(
         self,
         rate_limit: float = DEFAULT_RATE_LIMIT,
+        rate_burst: float = DEFAULT_RATE_BURST,
         max_retries: int = DEFAULT_MAX_RETRIES,
         retry_delay: float = DEFAULT_RETRY_DELAY,
         timeout: float = 30.0,
     ):
-        self.rate_limiter = RateLimiter(rate_limit)
+        self.rate_limiter = RateLimiter(rate_limit, rate_burst)
         self.max_retries = max_retries
         self.retry_delay = retry_delay
         self.timeout = timeout
         self._client: httpx.AsyncClient | None = None
+        # One entry per active `async with`; True if that block opened the client
+        self._owns_client: list[bool] = []
 
-    async def __aenter__(self) -> SvsApiClient:
-        """Enter async context manager."""
-        self._client = httpx.AsyncClient(
-            timeout=self.timeout,
-            headers={
-                "User-Agent": "SVS-Browser/1.0 (NASA SVS Knowledge Browser; research project)",
-                "Accept": "application/json",
-            },
-        )
+    async def open(self) -> SvsApiClient:
+        """
+        Open the underlying HTTP client if it isn't already.
+
+        A client opened this way stays open across `async with` blocks
+        until close() is called, so one connection pool can serve several
+        pipeline phases or CLI commands.
+        """
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                http2=True,
+                limits=HTTP_LIMITS,
+                timeout=self.timeout,
+                headers={
+                    "User-Agent": "SVS-Browser/1.0 (NASA SVS Knowledge Browser; research project)",
+                    "Accept": "application/json",
+                },
+            )
         return self
 
-    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
-        """Exit async context manager."""
+    async def close(self) -> None:
+        """Close the underlying HTTP client."""
         if self._client:
             await self._client.aclose()
             self._client = None
 
+    async def __aenter__(self) -> SvsApiClient:
+        """Enter async context manager."""
+        self._owns_client.append(self._client is None)
+        return await self.open()
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Exit async context manager, closing the client only if this block opened it."""
+        if self._owns_client.pop():
+            await self.close()
+
     async def _request(
         self,
         method: str,
         url: str,
+        raise_for_status: bool = True,
         **kwargs,
     ) -> httpx.Response:
-        """Make an HTTP request with rate limiting and retries."""
+        """
+        Make an HTTP request with rate limiting and retries.
+
+        Rate limit and server errors are retried. With raise_for_status=False
+        any other response is returned as-is for the caller to inspect, which
+        avoids raising and catching an exception for expected statuses.
+        """
         if not self._client:
             raise RuntimeError("Client not initialized. Use async context manager.")
 
@@ -109,26 +176,30 @@ class SvsApiClient:
             try:
                 await self.rate_limiter.wait()
                 response = await self._client.request(method, url, **kwargs)
-                response.raise_for_status()
-                return response
-
-            except httpx.HTTPStatusError as e:
-                last_error = e
-                if e.response.status_code in (429, 500, 502, 503, 504):
-                    # Retry on rate limit or server errors
-                    wait_time = self.retry_delay * (2**attempt)
-                    logger.warning(
-                        f"HTTP {e.response.status_code} on attempt {attempt + 1}, retrying in {wait_time}s: {url}"
-                    )
-                    await asyncio.sleep(wait_time)
-                else:
-                    raise
-
             except httpx.RequestError as e:
                 last_error = e
                 wait_time = self.retry_delay * (2**attempt)
-                logger.warning(f"Request error on attempt {attempt + 1}, retrying in {wait_time}s: {e}")
+                logger.warning("Request error on attempt %s, retrying in %ss: %s", attempt + 1, wait_time, e)
                 await asyncio.sleep(wait_time)
+                continue
+
+            if response.status_code in RETRY_STATUS_CODES and attempt < self.max_retries - 1:
+                # Retry on rate limit or server errors
+                wait_time = self.retry_delay * (2**attempt)
+                logger.warning(
+                    "HTTP %s on attempt %s, retrying in %ss: %s",
+                    response.status_code,
+                    attempt + 1,
+                    wait_time,
+                    url,
+                )
+                await asyncio.sleep(wait_time)
+                continue
+
+            # 304 only comes back for conditional requests; callers check for it
+            if raise_for_status and response.status_code != 304:
+                response.raise_for_status()
+            return response
 
         raise last_error or RuntimeError("Request failed after retries")
 
@@ -161,12 +232,12 @@ class SvsApiClient:
             params["missions"] = ",".join(missions)
 
         response = await self._request("GET", SVS_SEARCH_URL, params=params)
-        data = response.json()
+        data = orjson.loads(response.content)
 
         results = [
             SvsSearchResult(
                 id=item["id"],
-                url=item.get("url", f"{SVS_PAGE_URL}/{item['id']}"),
+                url=item["url"] if "url" in item else PAGE_URL_PREFIX + str(item["id"]),
                 title=item.get("title", ""),
                 description=item.get("description"),
                 release_date=item.get("release_date"),
@@ -182,61 +253,141 @@ class SvsApiClient:
             previous_url=data.get("previous"),
         )
 
-    async def discover_all_pages(
+    async def iter_all_pages(
         self,
         batch_size: int = 500,
-        progress_callback: callable | None = None,
-    ) -> list[SvsSearchResult]:
+        progress_callback: Callable[[int, int], None] | None = None,
+        max_concurrency: int = DEFAULT_DISCOVERY_CONCURRENCY,
+    ) -> AsyncIterator[SvsSearchResult]:
         """
-        Discover all SVS pages using the search API.
+        Stream all SVS pages from the search API.
+
+        The first request returns the total count, so the remaining offsets
+        are known up front and fetched concurrently (still paced by the
+        rate limiter). Results are yielded as each batch arrives, and the
+        next requests are already in flight while the caller processes them.
 
         Args:
             batch_size: Number of results to fetch per request
             progress_callback: Optional callback(current, total) for progress
+            max_concurrency: Max search requests in flight at once
 
-        Returns:
-            List of all discovered SVS pages
+        Yields:
+            Discovered SVS pages, batch by batch in completion order
         """
-        all_results: list[SvsSearchResult] = []
-        offset = 0
-
         # Initial request to get total count
         first_response = await self.search(limit=batch_size, offset=0)
         total_count = first_response.count
-        all_results.extend(first_response.results)
+        fetched = len(first_response.results)
 
         logger.info(f"Discovered {total_count} total SVS pages")
 
         if progress_callback:
-            progress_callback(len(all_results), total_count)
+            progress_callback(fetched, total_count)
 
-        # Fetch remaining pages
-        offset = batch_size
-        while offset < total_count:
-            response = await self.search(limit=batch_size, offset=offset)
-            all_results.extend(response.results)
-            offset += batch_size
+        # Keep up to max_concurrency of the remaining batches in flight
+        offsets = iter(range(batch_size, total_count, batch_size))
+        pending: set[asyncio.Task[SvsSearchResponse]] = set()
 
-            if progress_callback:
-                progress_callback(len(all_results), total_count)
+        def schedule() -> None:
+            for offset in islice(offsets, max_concurrency - len(pending)):
+                pending.add(asyncio.create_task(self.search(limit=batch_size, offset=offset)))
+
+        schedule()
+        try:
+            for result in first_response.results:
+                yield result
+
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                schedule()
+                for task in done:
+                    response = task.result()
+                    fetched += len(response.results)
+                    if progress_callback:
+                        progress_callback(fetched, total_count)
+                    logger.debug("Fetched %s/%s pages", fetched, total_count)
+
+                    for result in response.results:
+                        yield result
+        finally:
+            for task in pending:
+                task.cancel()
 
-            logger.debug(f"Fetched {len(all_results)}/{total_count} pages")
+    async def discover_all_pages(
+        self,
+        batch_size: int = 500,
+        progress_callback: Callable[[int, int], None] | None = None,
+        max_concurrency: int = DEFAULT_DISCOVERY_CONCURRENCY,
+    ) -> list[SvsSearchResult]:
+        """
+        Discover all SVS pages using the search API.
 
-        return all_results
+        Prefer iter_all_pages, which doesn't hold every result in memory.
 
-    async def fetch_page_html(self, svs_id: int) -> str:
+        Returns:
+            All discovered SVS pages
+        """
+        return [
+            result
+            async for result in self.iter_all_pages(
+                batch_size=batch_size,
+                progress_callback=progress_callback,
+                max_concurrency=max_concurrency,
+            )
+        ]
+
+    async def fetch_page_html(self, svs_id: int) -> bytes:
         """
         Fetch the HTML content of an SVS page.
 
+        The body is returned undecoded; the HTML parser detects the charset
+        itself, so decoding here would only be done twice.
+
         Args:
             svs_id: SVS page ID
 
         Returns:
-            Raw HTML content
+            Raw HTML bytes
         """
-        url = f"{SVS_PAGE_URL}/{svs_id}"
+        url = PAGE_URL_PREFIX + str(svs_id)
         response = await self._request("GET", url)
-        return response.text
+        return response.content
+
+    async def fetch_page(
+        self,
+        svs_id: int,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> SvsPageFetch | None:
+        """
+        Fetch an SVS page, conditionally if validators from a previous fetch are given.
+
+        Args:
+            svs_id: SVS page ID
+            etag: ETag from the previous fetch, sent as If-None-Match
+            last_modified: Last-Modified from the previous fetch, sent as If-Modified-Since
+
+        Returns:
+            The page HTML and its new validators, or None if the page is unchanged (304)
+        """
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+        url = PAGE_URL_PREFIX + str(svs_id)
+        response = await self._request("GET", url, headers=headers)
+        if response.status_code == 304:
+            return None
+
+        return SvsPageFetch(
+            html=response.content,
+            encoding=response.charset_encoding,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+        )
 
     async def check_page_exists(self, svs_id: int) -> bool:
         """
@@ -248,11 +399,9 @@ class SvsApiClient:
         Returns:
             True if page exists, False otherwise
         """
-        url = f"{SVS_PAGE_URL}/{svs_id}"
-        try:
-            response = await self._request("HEAD", url)
-            return response.status_code == 200
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 404:
-                return False
-            raise
+        url = PAGE_URL_PREFIX + str(svs_id)
+        response = await self._request("HEAD", url, raise_for_status=False)
+        if response.status_code == 404:
+            return False
+        response.raise_for_status()
+        return response.status_code == 200
@@ -5,6 +5,7 @@ from __future__ import annotations
 import hashlib
 import logging
 import re
+from collections.abc import Iterator
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
@@ -27,7 +28,7 @@ class TextChunk:
     section: str  # description, credits, caption, transcript, etc.
     chunk_index: int
     token_count: int
-    content_hash: str
+    content_hash: bytes  # raw SHA-256 digest
 
 
 class TextChunker:
@@ -56,6 +57,8 @@ class TextChunker:
 
         # Sentence boundary pattern
         self.sentence_pattern = re.compile(r"(?<=[.!?])\s+(?=[A-Z])|(?<=[.!?])\s*$")
+        # Clause boundary pattern, for splitting overlong sentences
+        self.clause_pattern = re.compile(r"[,;:]\s+")
 
     def estimate_tokens(self, text: str) -> int:
         """Estimate token count for text."""
@@ -85,26 +88,27 @@ class TextChunker:
                 return []
             return [self._create_chunk(text, section, 0)]
 
-        # Split into sentences
-        sentences = self._split_sentences(text)
-
-        # Build chunks from sentences
+        # Build chunks from sentences. The current chunk is a list of parts
+        # joined with spaces on flush; its size is tracked in characters and
+        # converted to tokens with integer division, same as estimate_tokens.
         chunks = []
-        current_text = ""
-        current_tokens = 0
+        current_parts: list[str] = []
+        current_chars = 0
         chunk_index = 0
 
-        for sentence in sentences:
-            sentence_tokens = self.estimate_tokens(sentence)
+        for sentence in self._split_sentences(text):
+            sentence_chars = len(sentence)
+            sentence_tokens = sentence_chars // CHARS_PER_TOKEN
+            current_tokens = current_chars // CHARS_PER_TOKEN
 
             # If single sentence is too long, we need to split it
             if sentence_tokens > self.max_tokens:
                 # Flush current chunk if any
-                if current_text:
-                    chunks.append(self._create_chunk(current_text, section, chunk_index))
+                if current_parts:
+                    chunks.append(self._create_chunk(" ".join(current_parts), section, chunk_index))
                     chunk_index += 1
-                    current_text = ""
-                    current_tokens = 0
+                    current_parts = []
+                    current_chars = 0
 
                 # Split long sentence into sub-chunks
                 sub_chunks = self._split_long_sentence(sentence, section, chunk_index)
@@ -112,33 +116,40 @@ class TextChunker:
                 chunk_index += len(sub_chunks)
                 continue
 
-            # Check if adding this sentence would exceed target
-            if current_tokens + sentence_tokens > self.target_tokens:
-                # If we have content, create a chunk
-                if current_text and current_tokens >= self.min_tokens:
-                    chunks.append(self._create_chunk(current_text, section, chunk_index))
-                    chunk_index += 1
+            # If adding this sentence would exceed target and we have enough
+            # content, create a chunk and start the next one with overlap
+            if (
+                current_tokens + sentence_tokens > self.target_tokens
+                and current_parts
+                and current_tokens >= self.min_tokens
+            ):
+                current_text = " ".join(current_parts)
+                chunks.append(self._create_chunk(current_text, section, chunk_index))
+                chunk_index += 1
+
+                overlap_text = self._get_overlap_text(current_text)
+                current_parts = [overlap_text + sentence]
+                current_chars = len(overlap_text) + sentence_chars
+                continue
 
-                    # Start new chunk with overlap
-                    overlap_text = self._get_overlap_text(current_text)
-                    current_text = overlap_text + sentence
-                    current_tokens = self.estimate_tokens(current_text)
-                else:
-                    # Current chunk too small, add sentence anyway
-                    current_text = (current_text + " " + sentence).strip()
-                    current_tokens = self.estimate_tokens(current_text)
-            else:
-                # Add sentence to current chunk
-                current_text = (current_text + " " + sentence).strip()
-                current_tokens = self.estimate_tokens(current_text)
+            # Add sentence to current chunk (even past target if it is still too small)
+            if current_parts:
+                # An overlap-seeded chunk may start with whitespace, which is dropped on the next append
+                if current_parts[0][:1].isspace():
+                    seed_chars = len(current_parts[0])
+                    current_parts[0] = current_parts[0].lstrip()
+                    current_chars -= seed_chars - len(current_parts[0])
+                current_chars += 1
+            current_parts.append(sentence)
+            current_chars += sentence_chars
 
         # Don't forget the last chunk
-        if current_text and current_tokens >= self.min_tokens:
-            chunks.append(self._create_chunk(current_text, section, chunk_index))
-        elif current_text and chunks:
+        if current_parts and current_chars // CHARS_PER_TOKEN >= self.min_tokens:
+            chunks.append(self._create_chunk(" ".join(current_parts), section, chunk_index))
+        elif current_parts and chunks:
             # Attach small remainder to previous chunk
             last_chunk = chunks[-1]
-            combined = last_chunk.content + " " + current_text
+            combined = last_chunk.content + " " + " ".join(current_parts)
             chunks[-1] = self._create_chunk(combined, section, last_chunk.chunk_index)
 
         return chunks
@@ -170,23 +181,27 @@ class TextChunker:
 
         return all_chunks
 
-    def _split_sentences(self, text: str) -> list[str]:
-        """Split text into sentences."""
-        # Split on sentence boundaries
-        parts = self.sentence_pattern.split(text)
+    def _split_sentences(self, text: str) -> Iterator[str]:
+        """Split text into sentences, yielding them one at a time."""
+        found = False
+        start = 0
 
-        # Clean up and filter empty parts
-        sentences = []
-        for part in parts:
-            part = part.strip()
-            if part:
-                sentences.append(part)
+        # Walk sentence boundaries, yielding the non-empty text between them
+        for match in self.sentence_pattern.finditer(text):
+            sentence = text[start : match.start()].strip()
+            start = match.end()
+            if sentence:
+                found = True
+                yield sentence
 
-        # If no sentences found, return original text
-        if not sentences:
-            return [text]
+        sentence = text[start:].strip()
+        if sentence:
+            found = True
+            yield sentence
 
-        return sentences
+        # If no sentences found, return original text
+        if not found:
+            yield text
 
     def _split_long_sentence(
         self,
@@ -198,23 +213,48 @@ class TextChunker:
         chunks = []
 
         # Split on clause boundaries (commas, semicolons, etc.)
-        clause_pattern = re.compile(r"[,;:]\s+")
-        parts = clause_pattern.split(sentence)
-
-        current_text = ""
+        parts = self.clause_pattern.split(sentence)
+
+        # Parts are joined with ", " on flush. Like stripping ", " from the
+        # joined text on every append, a part's trailing separators are dropped
+        # and a chunk started from a raw part has its leading ones dropped.
+        current_parts: list[str] = []
+        current_chars = 0
+        raw_start = False
         chunk_index = start_index
 
         for part in parts:
-            if self.estimate_tokens(current_text + part) <= self.max_tokens:
-                current_text = (current_text + ", " + part).strip(", ")
+            if (current_chars + len(part)) // CHARS_PER_TOKEN <= self.max_tokens:
+                if raw_start and not current_parts[0].strip(", "):
+                    current_parts = []
+                if not current_parts:
+                    part = part.strip(", ")
+                    current_parts = [part] if part else []
+                    current_chars = len(part)
+                else:
+                    if raw_start:
+                        current_chars -= len(current_parts[0])
+                        current_parts[0] = current_parts[0].lstrip(", ")
+                        current_chars += len(current_parts[0])
+                    tail = part.rstrip(", ")
+                    if tail:
+                        current_parts.append(tail)
+                        current_chars += 2 + len(tail)
+                    else:
+                        current_chars -= len(current_parts[-1])
+                        current_parts[-1] = current_parts[-1].rstrip(", ")
+                        current_chars += len(current_parts[-1])
+                raw_start = False
             else:
-                if current_text:
-                    chunks.append(self._create_chunk(current_text, section, chunk_index))
+                if current_parts:
+                    chunks.append(self._create_chunk(", ".join(current_parts), section, chunk_index))
                     chunk_index += 1
-                current_text = part
+                current_parts = [part] if part else []
+                current_chars = len(part)
+                raw_start = bool(part)
 
-        if current_text:
-            chunks.append(self._create_chunk(current_text, section, chunk_index))
+        if current_parts:
+            chunks.append(self._create_chunk(", ".join(current_parts), section, chunk_index))
 
         return chunks
 
@@ -238,7 +278,7 @@ class TextChunker:
     def _create_chunk(self, content: str, section: str, index: int) -> TextChunk:
         """Create a TextChunk with hash."""
         content = content.strip()
-        content_hash = hashlib.sha256(content.encode()).hexdigest()
+        content_hash = hashlib.sha256(content.encode(), usedforsecurity=False).digest()
         token_count = self.estimate_tokens(content)
 
         return TextChunk(
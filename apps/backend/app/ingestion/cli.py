@@ -4,8 +4,11 @@ import argparse
 import asyncio
 import logging
 import sys
+from collections.abc import Awaitable, Callable
+from functools import lru_cache
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 
 from app.config import get_settings
 from app.ingestion.api_client import SvsApiClient
@@ -19,16 +22,34 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-async def get_session() -> AsyncSession:
-    """Create database session."""
+@lru_cache(maxsize=1)
+def get_engine() -> AsyncEngine:
+    """Create the database engine shared by everything a CLI run does."""
     settings = get_settings()
-    engine = create_async_engine(settings.database_url, echo=False)
-    async_session_maker = async_sessionmaker(
-        engine,
+    return create_async_engine(
+        settings.database_url,
+        echo=False,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout,
+        pool_recycle=settings.db_pool_recycle,
+        pool_pre_ping=True,
+    )
+
+
+@lru_cache(maxsize=1)
+def get_session_maker() -> async_sessionmaker[AsyncSession]:
+    """Create the session factory bound to the shared engine."""
+    return async_sessionmaker(
+        get_engine(),
         class_=AsyncSession,
         expire_on_commit=False,
     )
-    return async_session_maker()
+
+
+async def get_session() -> AsyncSession:
+    """Create database session."""
+    return get_session_maker()()
 
 
 async def cmd_discover(args: argparse.Namespace) -> int:
@@ -40,7 +61,7 @@ async def cmd_discover(args: argparse.Namespace) -> int:
         print(f"\rDiscovering pages: {current}/{total} ({pct:.1f}%)", end="", flush=True)
 
     async with await get_session() as session:
-        pipeline = IngestionPipeline(session)
+        pipeline = IngestionPipeline(session, api_client=args.api_client)
         run = await pipeline.create_run(mode="discovery")
 
         try:
@@ -61,7 +82,7 @@ async def cmd_crawl(args: argparse.Namespace) -> int:
         print(f"\rCrawling: {processed} processed, {success} success, {errors} errors", end="", flush=True)
 
     async with await get_session() as session:
-        pipeline = IngestionPipeline(session)
+        pipeline = IngestionPipeline(session, api_client=args.api_client)
         run = await pipeline.create_run(mode="crawl")
 
         try:
@@ -95,6 +116,7 @@ async def cmd_ingest(args: argparse.Namespace) -> int:
                 session,
                 max_pages=args.max_pages,
                 skip_existing=args.skip_existing,
+                api_client=args.api_client,
             )
             logger.info(f"Ingestion complete: {result}")
             return 0 if result["errors"] == 0 else 1
@@ -107,7 +129,7 @@ async def cmd_test_api(args: argparse.Namespace) -> int:
     """Test SVS API connection."""
     logger.info("Testing SVS API connection...")
 
-    async with SvsApiClient() as client:
+    async with args.api_client as client:
         try:
             # Test search
             result = await client.search(limit=5)
@@ -127,6 +149,7 @@ async def cmd_cache_thumbnails(args: argparse.Namespace) -> int:
     from sqlalchemy import select
 
     from app.models.page import SvsPage
+    from app.services.cache import invalidate_page_cache
     from app.services.storage import MinioStorageService
     from app.services.thumbnail import ThumbnailService
 
@@ -168,6 +191,7 @@ async def cmd_cache_thumbnails(args: argparse.Namespace) -> int:
         success = 0
         errors = 0
         batch_size = args.batch_size
+        semaphore = asyncio.Semaphore(args.concurrency)
 
         async with httpx.AsyncClient(
             timeout=30.0,
@@ -176,33 +200,37 @@ async def cmd_cache_thumbnails(args: argparse.Namespace) -> int:
         ) as http_client:
             thumbnail_service = ThumbnailService(storage, http_client)
 
-            for i, page in enumerate(pages):
-                try:
-                    storage_uri = await thumbnail_service.cache_page_thumbnail(
-                        page.svs_id,
-                        page.thumbnail_url,
-                    )
-                    if storage_uri:
+            async def cache_thumbnail(page: SvsPage) -> str | None:
+                async with semaphore:
+                    return await thumbnail_service.cache_page_thumbnail(page.svs_id, page.thumbnail_url)
+
+            # Download a batch concurrently, then commit it
+            for start in range(0, total, batch_size):
+                batch = pages[start : start + batch_size]
+                results = await asyncio.gather(*(cache_thumbnail(page) for page in batch), return_exceptions=True)
+                cached_ids = []
+
+                for page, storage_uri in zip(batch, results):
+                    if isinstance(storage_uri, Exception):
+                        logger.debug("Failed to cache thumbnail for %s: %s", page.svs_id, storage_uri)
+                        errors += 1
+                    elif storage_uri:
                         page.thumbnail_storage_uri = storage_uri
+                        cached_ids.append(page.svs_id)
                         success += 1
                     else:
                         errors += 1
-                except Exception as e:
-                    logger.debug(f"Failed to cache thumbnail for {page.svs_id}: {e}")
-                    errors += 1
-
-                # Progress and periodic commit
-                if (i + 1) % batch_size == 0:
-                    await session.commit()
-                    pct = ((i + 1) / total) * 100
-                    print(
-                        f"\rProgress: {i + 1}/{total} ({pct:.1f}%) - {success} cached, {errors} failed",
-                        end="",
-                        flush=True,
-                    )
-
-            # Final commit
-            await session.commit()
+
+                await session.commit()
+                await invalidate_page_cache(cached_ids)
+                done = start + len(batch)
+                pct = (done / total) * 100
+                print(
+                    f"\rProgress: {done}/{total} ({pct:.1f}%) - {success} cached, {errors} failed",
+                    end="",
+                    flush=True,
+                )
+
             print()  # Newline after progress
 
         logger.info(f"Thumbnail caching complete: {success} cached, {errors} failed")
@@ -221,7 +249,7 @@ async def cmd_reformat(args: argparse.Namespace) -> int:
         )
 
     async with await get_session() as session:
-        pipeline = IngestionPipeline(session)
+        pipeline = IngestionPipeline(session, api_client=args.api_client)
 
         try:
             processed, success, errors = await pipeline.run_content_update(
@@ -238,13 +266,46 @@ async def cmd_reformat(args: argparse.Namespace) -> int:
             return 1
 
 
+async def cmd_build_index(args: argparse.Namespace) -> int:
+    """Build the vector search index after a bulk embedding load."""
+    logger.info("Building ix_embedding_hnsw_bq on embedding_current...")
+
+    # CREATE INDEX CONCURRENTLY cannot run in a transaction; the build
+    # settings are session-level, so reset them before the connection returns to the pool
+    async with get_engine().connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        await conn.execute(text("SET maintenance_work_mem = '2GB'"))
+        await conn.execute(text("SET max_parallel_maintenance_workers = 7"))
+        await conn.execute(text("SET max_parallel_workers = 8"))
+        try:
+            await conn.execute(
+                text("""
+                    CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_embedding_hnsw_bq ON embedding_current
+                    USING hnsw ((binary_quantize(embedding)::bit(1024)) bit_hamming_ops)
+                    WITH (m = 16, ef_construction = 64)
+                """)
+            )
+            await conn.execute(text("ANALYZE embedding_current"))
+        except Exception as e:
+            # A failed concurrent build leaves an INVALID index that IF NOT EXISTS would skip
+            logger.error(f"Index build failed (drop ix_embedding_hnsw_bq before retrying): {e}")
+            return 1
+        finally:
+            await conn.execute(text("RESET maintenance_work_mem"))
+            await conn.execute(text("RESET max_parallel_maintenance_workers"))
+            await conn.execute(text("RESET max_parallel_workers"))
+
+    logger.info("Index build complete")
+    return 0
+
+
 async def cmd_test_parse(args: argparse.Namespace) -> int:
     """Test HTML parsing for a specific page."""
     from app.ingestion.html_parser import SvsHtmlParser
 
     logger.info(f"Testing HTML parsing for SVS page {args.svs_id}...")
 
-    async with SvsApiClient() as client:
+    async with args.api_client as client:
         try:
             html = await client.fetch_page_html(args.svs_id)
             parser = SvsHtmlParser()
@@ -265,6 +326,31 @@ async def cmd_test_parse(args: argparse.Namespace) -> int:
             return 1
 
 
+def event_loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """
+    Return uvloop's event loop factory if it is installed.
+
+    uvloop comes with uvicorn[standard] on Linux and macOS; elsewhere (e.g.
+    Windows) this returns None and asyncio's default loop is used.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
+
+
+async def run_command(command: Callable[[argparse.Namespace], Awaitable[int]], args: argparse.Namespace) -> int:
+    """Run a command with one SVS API client and database pool shared by everything it does."""
+    args.api_client = await SvsApiClient().open()
+    try:
+        return await command(args)
+    finally:
+        await args.api_client.close()
+        if get_engine.cache_info().currsize:
+            await get_engine().dispose()
+
+
 def main() -> int:
     """Main CLI entry point."""
     parser = argparse.ArgumentParser(
@@ -362,6 +448,12 @@ def main() -> int:
         default=50,
         help="Commit after this many pages",
     )
+    cache_thumbnails_parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=20,
+        help="Thumbnails downloaded at once (default: 20)",
+    )
 
     # reformat command
     reformat_parser = subparsers.add_parser(
@@ -386,6 +478,12 @@ def main() -> int:
         help="Process oldest pages first (default: newest first)",
     )
 
+    # build-index command
+    subparsers.add_parser(
+        "build-index",
+        help="Build the vector search index after a bulk embedding load",
+    )
+
     args = parser.parse_args()
 
     if args.verbose:
@@ -404,9 +502,11 @@ def main() -> int:
         "test-parse": cmd_test_parse,
         "cache-thumbnails": cmd_cache_thumbnails,
         "reformat": cmd_reformat,
+        "build-index": cmd_build_index,
     }
 
-    return asyncio.run(commands[args.command](args))
+    with asyncio.Runner(loop_factory=event_loop_factory()) as runner:
+        return runner.run(run_command(commands[args.command], args))
 
 
 if __name__ == "__main__":
@@ -4,169 +4,316 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from datetime import datetime
-from typing import TYPE_CHECKING
+import time
+from collections.abc import AsyncIterator
+from typing import TYPE_CHECKING, Union
 from uuid import UUID
 
-from sqlalchemy import func, select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import Select, and_, bindparam, select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 
+from app.config import get_settings
 from app.models.chunk import AssetTextChunk, PageTextChunk
 from app.models.embedding import Embedding
 from app.services.embedding import get_embedding_service
 
 if TYPE_CHECKING:
-    pass
+    import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# Batches buffered between pipeline stages
+PIPELINE_QUEUE_SIZE = 2
+
+# Chunks read per keyset query, and texts per model forward pass. Each query
+# is streamed to the embedder in model-sized batches.
+DEFAULT_FETCH_SIZE = 512
+DEFAULT_EMBED_BATCH_SIZE = 128
+
+# Written batches per transaction; one WAL flush covers all of them
+DEFAULT_COMMIT_EVERY = 8
+
+# Batches being embedded at once. A second in-flight batch hides the
+# per-call overhead (tokenization, or the round trip to a remote API).
+DEFAULT_EMBED_CONCURRENCY = 2
+
+# At most the fetch and write stages hold a connection at once; the rest is headroom
+PIPELINE_POOL_SIZE = 4
+
+# Keyset cursor start: sorts before every chunk ID
+FIRST_CHUNK_ID = UUID(int=0)
+
+ChunkBatch = list[tuple[UUID, str]]
+# One row per chunk; the local backend returns a float16 array
+Embeddings = Union[list[list[float]], "np.ndarray"]
+
 
 class EmbeddingPipeline:
-    """Pipeline for generating embeddings for text chunks."""
+    """
+    Pipeline for generating embeddings for text chunks.
 
-    def __init__(self, session: AsyncSession, batch_size: int = 32):
-        self.session = session
+    run() overlaps three stages connected by bounded queues: fetching the
+    next batch of chunks, embedding the current ones (embed_concurrency
+    batches at a time), and writing the previous ones. The fetch stage opens
+    a short-lived session per query and the write stage one per group of
+    commit_every batches, so a commit never waits behind a fetch.
+    """
+
+    def __init__(
+        self,
+        session_maker: async_sessionmaker[AsyncSession],
+        chunk_type: str = "page",
+        batch_size: int = DEFAULT_EMBED_BATCH_SIZE,
+        fetch_size: int = DEFAULT_FETCH_SIZE,
+        commit_every: int = DEFAULT_COMMIT_EVERY,
+        embed_concurrency: int = DEFAULT_EMBED_CONCURRENCY,
+    ):
+        self.session_maker = session_maker
+        self.chunk_type = chunk_type
+        self.chunk_model = PageTextChunk if chunk_type == "page" else AssetTextChunk
         self.batch_size = batch_size
+        self.fetch_size = max(fetch_size, batch_size)
+        self.commit_every = max(commit_every, 1)
+        self.embed_concurrency = max(embed_concurrency, 1)
         self.embedding_service = get_embedding_service()
-
-    async def get_chunks_without_embeddings(
-        self, chunk_type: str = "page", limit: int | None = None
-    ) -> list[tuple[UUID, str]]:
-        """Get chunks that don't have current embeddings."""
-        if chunk_type == "page":
-            chunk_model = PageTextChunk
-        else:
-            chunk_model = AssetTextChunk
-
-        # Find chunks without current embeddings for this model
-        subquery = (
-            select(Embedding.chunk_id)
-            .where(Embedding.chunk_type == chunk_type)
-            .where(Embedding.model_name == self.embedding_service.model_name)
-            .where(Embedding.is_current.is_(True))
+        # Fixed for the service's lifetime, so read once instead of per batch
+        self.model_name = self.embedding_service.model_name
+        self.model_version = self.embedding_service.model_version
+        self.dims = self.embedding_service.dims
+        # Built once; each fetch only binds after_id and limit
+        self._fetch_stmt = (
+            self._without_current_embedding(select(self.chunk_model.chunk_id, self.chunk_model.content))
+            .where(self.chunk_model.chunk_id > bindparam("after_id"))
+            .order_by(self.chunk_model.chunk_id)
+            .limit(bindparam("limit"))
         )
 
-        query = (
-            select(chunk_model.chunk_id, chunk_model.content)
-            .where(~chunk_model.chunk_id.in_(subquery))
-            .order_by(chunk_model.chunk_id)
+    def _without_current_embedding(self, query: Select) -> Select:
+        """
+        Restrict a chunk query to chunks with no current embedding for this model.
+
+        Written as an anti-join (LEFT JOIN ... IS NULL) so PostgreSQL can probe
+        uq_embedding_current_chunk per chunk instead of hashing every
+        embedding ID as it does for NOT IN.
+        """
+        return query.outerjoin(
+            Embedding,
+            and_(
+                Embedding.chunk_id == self.chunk_model.chunk_id,
+                Embedding.chunk_type == self.chunk_type,
+                Embedding.model_name == self.model_name,
+                Embedding.is_current.is_(True),
+            ),
+        ).where(Embedding.chunk_id.is_(None))
+
+    async def stream_chunks_without_embeddings(
+        self,
+        session: AsyncSession,
+        limit: int,
+        after_id: UUID | None = None,
+        partition_size: int = DEFAULT_EMBED_BATCH_SIZE,
+    ) -> AsyncIterator[ChunkBatch]:
+        """
+        Stream chunks that don't have current embeddings, in batches.
+
+        Rows are read through a server-side cursor, so the first batch can be
+        embedded while later rows are still arriving and at most one batch
+        is materialized at a time.
+
+        Args:
+            session: Database session
+            limit: Maximum number of chunks to return
+            after_id: Only return chunks after this ID (keyset cursor from the previous batch)
+            partition_size: Chunks per yielded batch
+        """
+        params = {"after_id": after_id or FIRST_CHUNK_ID, "limit": limit}
+        result = await session.stream(self._fetch_stmt.execution_options(yield_per=partition_size), params)
+        async for partition in result.partitions():
+            yield [(row.chunk_id, row.content) for row in partition]
+
+    async def estimate_chunk_count(self, session: AsyncSession) -> int:
+        """
+        Estimate the number of chunks from the planner statistics.
+
+        Reads pg_class.reltuples instead of counting, so it costs one catalog
+        lookup however large the table is. It counts all chunks, embedded or
+        not, so it is only an upper bound for progress reporting. Returns 0 if
+        the table has never been analyzed.
+        """
+        result = await session.execute(
+            text("SELECT reltuples::bigint FROM pg_class WHERE relname = :table"),
+            {"table": self.chunk_model.__tablename__},
         )
+        return max(result.scalar() or 0, 0)
 
-        if limit:
-            query = query.limit(limit)
-
-        result = await self.session.execute(query)
-        return [(row.chunk_id, row.content) for row in result.all()]
-
-    async def count_chunks_without_embeddings(self, chunk_type: str = "page") -> int:
-        """Count chunks that need embeddings."""
-        if chunk_type == "page":
-            chunk_model = PageTextChunk
-        else:
-            chunk_model = AssetTextChunk
-
-        subquery = (
-            select(Embedding.chunk_id)
-            .where(Embedding.chunk_type == chunk_type)
-            .where(Embedding.model_name == self.embedding_service.model_name)
-            .where(Embedding.is_current.is_(True))
+    async def embed_chunks(self, chunks: ChunkBatch) -> Embeddings:
+        """Generate embeddings for a batch of chunks."""
+        return await self.embedding_service.batch_generate_embeddings(
+            [content for _, content in chunks], batch_size=self.batch_size
         )
 
-        query = select(func.count()).select_from(chunk_model).where(~chunk_model.chunk_id.in_(subquery))
+    async def store_embeddings(
+        self,
+        session: AsyncSession,
+        chunks: ChunkBatch,
+        embeddings: Embeddings,
+    ) -> int:
+        """Store embeddings for a batch of chunks; the caller commits."""
+        if not chunks:
+            return 0
 
-        result = await self.session.execute(query)
-        return result.scalar() or 0
+        # Insert embedding records in one multi-row INSERT, bypassing the
+        # unit of work (no ORM objects are needed afterwards). Chunks that
+        # gained a current embedding since they were fetched (a concurrent or
+        # overlapping run) hit uq_embedding_current_chunk and are skipped.
+        chunk_type = self.chunk_type
+        model_name = self.model_name
+        model_version = self.model_version
+        dims = self.dims
+        rows = [
+            {
+                "chunk_id": chunk_id,
+                "chunk_type": chunk_type,
+                "model_name": model_name,
+                "model_version": model_version,
+                "dims": dims,
+                "embedding": embedding_vector,
+                "is_current": True,
+            }
+            for (chunk_id, _), embedding_vector in zip(chunks, embeddings)
+        ]
+
+        await session.execute(pg_insert(Embedding).on_conflict_do_nothing(), rows)
+        return len(chunks)
 
     async def generate_embeddings_for_chunks(
         self,
-        chunks: list[tuple[UUID, str]],
-        chunk_type: str = "page",
+        session: AsyncSession,
+        chunks: ChunkBatch,
     ) -> int:
         """Generate and store embeddings for a batch of chunks."""
         if not chunks:
             return 0
 
-        chunk_ids = [c[0] for c in chunks]
-        texts = [c[1] for c in chunks]
-
+        embeddings = await self.embed_chunks(chunks)
         try:
-            # Generate embeddings
-            embeddings = await self.embedding_service.batch_generate_embeddings(texts, batch_size=self.batch_size)
-
-            # Create embedding records
-            for chunk_id, embedding_vector in zip(chunk_ids, embeddings):
-                embedding = Embedding(
-                    chunk_id=chunk_id,
-                    chunk_type=chunk_type,
-                    model_name=self.embedding_service.model_name,
-                    model_version=self.embedding_service.model_version,
-                    dims=self.embedding_service.dims,
-                    embedding=embedding_vector,
-                    is_current=True,
-                )
-                self.session.add(embedding)
-
-            await self.session.commit()
-            return len(chunks)
-
+            count = await self.store_embeddings(session, chunks, embeddings)
+            await session.commit()
         except Exception as e:
-            logger.error(f"Failed to generate embeddings: {e}")
-            await self.session.rollback()
+            logger.error(f"Failed to store embeddings: {e}")
+            await session.rollback()
             raise
+        return count
 
     async def run(
         self,
-        chunk_type: str = "page",
         limit: int | None = None,
         progress_callback: callable | None = None,
     ) -> dict:
         """Run the embedding pipeline for all chunks without embeddings.
 
         Args:
-            chunk_type: 'page' or 'asset'
             limit: Maximum number of chunks to process (None for all)
-            progress_callback: Optional callback(processed, total) for progress updates
+            progress_callback: Optional callback(processed, estimated_total) for progress updates
 
         Returns:
             Dict with stats: total_processed, elapsed_time, chunks_per_second
         """
-        start_time = datetime.now()
+        start_time = time.perf_counter()
 
-        total_to_process = await self.count_chunks_without_embeddings(chunk_type)
+        async with self.session_maker() as session:
+            estimated_total = await self.estimate_chunk_count(session)
         if limit:
-            total_to_process = min(total_to_process, limit)
+            estimated_total = min(estimated_total, limit)
 
         logger.info(
-            f"Starting embedding pipeline for {total_to_process} {chunk_type} chunks "
-            f"using model {self.embedding_service.model_name}"
+            f"Starting embedding pipeline for up to ~{estimated_total} {self.chunk_type} chunks "
+            f"using model {self.model_name}"
         )
 
+        # None marks the end of the stream on each queue
+        fetch_q: asyncio.Queue[ChunkBatch | None] = asyncio.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+        write_q: asyncio.Queue[tuple[ChunkBatch, Embeddings] | None] = asyncio.Queue(maxsize=PIPELINE_QUEUE_SIZE)
         processed = 0
-        batch_num = 0
 
-        while processed < total_to_process:
-            batch_limit = min(self.batch_size, total_to_process - processed)
-            chunks = await self.get_chunks_without_embeddings(chunk_type=chunk_type, limit=batch_limit)
-
-            if not chunks:
-                break
-
-            count = await self.generate_embeddings_for_chunks(chunks, chunk_type)
-            processed += count
-            batch_num += 1
-
-            if progress_callback:
-                progress_callback(processed, total_to_process)
-
-            if batch_num % 10 == 0:
-                elapsed = (datetime.now() - start_time).total_seconds()
+        async def fetch() -> None:
+            fetched = 0
+            last_id: UUID | None = None
+            while True:
+                fetch_limit = min(self.fetch_size, limit - fetched) if limit else self.fetch_size
+                if fetch_limit <= 0:
+                    break
+                window_start = fetched
+                async with self.session_maker() as session:
+                    async for chunks in self.stream_chunks_without_embeddings(
+                        session,
+                        limit=fetch_limit,
+                        after_id=last_id,
+                        partition_size=self.batch_size,
+                    ):
+                        last_id = chunks[-1][0]
+                        fetched += len(chunks)
+                        await fetch_q.put(chunks)
+                # A short window means the cursor ran out of chunks
+                if fetched - window_start < fetch_limit:
+                    break
+            for _ in range(self.embed_concurrency):
+                await fetch_q.put(None)
+
+        async def embed() -> None:
+            while (chunks := await fetch_q.get()) is not None:
+                embeddings = await self.embed_chunks(chunks)
+                await write_q.put((chunks, embeddings))
+            await write_q.put(None)
+
+        async def write() -> None:
+            nonlocal processed
+            running_embedders = self.embed_concurrency
+            while running_embedders:
+                pending = 0
+                async with self.session_maker() as session:
+                    try:
+                        # Embeddings can be regenerated, so a crash losing the
+                        # last few commits only means the next run redoes them
+                        await session.execute(text("SET LOCAL synchronous_commit = off"))
+                        batches = 0
+                        while batches < self.commit_every:
+                            item = await write_q.get()
+                            if item is None:
+                                running_embedders -= 1
+                                if not running_embedders:
+                                    break
+                                continue
+                            chunks, embeddings = item
+                            pending += await self.store_embeddings(session, chunks, embeddings)
+                            batches += 1
+                        await session.commit()
+                    except Exception as e:
+                        # Uncommitted chunks still lack embeddings, so the next run picks them up
+                        logger.error(f"Failed to store embeddings, rolled back {pending} chunks: {e}")
+                        await session.rollback()
+                        raise
+                if not pending:
+                    continue
+                processed += pending
+
+                if progress_callback:
+                    progress_callback(processed, estimated_total)
+
+                elapsed = time.perf_counter() - start_time
                 rate = processed / elapsed if elapsed > 0 else 0
-                logger.info(
-                    f"Progress: {processed}/{total_to_process} chunks "
-                    f"({processed / total_to_process * 100:.1f}%) - {rate:.1f} chunks/sec"
-                )
+                logger.info(f"Progress: {processed}/~{estimated_total} chunks - {rate:.1f} chunks/sec")
+
+        stages = [asyncio.create_task(stage()) for stage in (fetch, *[embed] * self.embed_concurrency, write)]
+        try:
+            await asyncio.gather(*stages)
+        finally:
+            # If one stage fails the others would block on their queues forever
+            for task in stages:
+                task.cancel()
 
-        elapsed = (datetime.now() - start_time).total_seconds()
+        elapsed = time.perf_counter() - start_time
         rate = processed / elapsed if elapsed > 0 else 0
 
         logger.info(f"Embedding pipeline complete: {processed} chunks in {elapsed:.1f}s ({rate:.1f} chunks/sec)")
@@ -175,21 +322,57 @@ class EmbeddingPipeline:
             "total_processed": processed,
             "elapsed_seconds": elapsed,
             "chunks_per_second": rate,
-            "model_name": self.embedding_service.model_name,
+            "model_name": self.model_name,
         }
 
 
+def create_pipeline_engine(pipelines: int = 1) -> AsyncEngine:
+    """Create a database engine with a pool sized for concurrent pipeline runs."""
+    return create_async_engine(
+        get_settings().database_url,
+        echo=False,
+        pool_size=PIPELINE_POOL_SIZE * pipelines,
+        max_overflow=0,
+        pool_pre_ping=True,
+    )
+
+
 async def run_embedding_pipeline(
     chunk_type: str = "page",
-    batch_size: int = 32,
+    batch_size: int = DEFAULT_EMBED_BATCH_SIZE,
+    fetch_size: int = DEFAULT_FETCH_SIZE,
+    commit_every: int = DEFAULT_COMMIT_EVERY,
+    embed_concurrency: int = DEFAULT_EMBED_CONCURRENCY,
     limit: int | None = None,
+    engine: AsyncEngine | None = None,
 ) -> dict:
-    """Convenience function to run embedding pipeline with a new session."""
-    from app.database import async_session_maker
-
-    async with async_session_maker() as session:
-        pipeline = EmbeddingPipeline(session, batch_size=batch_size)
-        return await pipeline.run(chunk_type=chunk_type, limit=limit)
+    """
+    Convenience function to run the embedding pipeline.
+
+    Uses the given engine, or a dedicated pipeline engine that is disposed
+    when the run finishes.
+    """
+    from app.database import get_pool_stats
+
+    owned_engine = engine is None
+    if engine is None:
+        engine = create_pipeline_engine()
+    session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    try:
+        pipeline = EmbeddingPipeline(
+            session_maker,
+            chunk_type=chunk_type,
+            batch_size=batch_size,
+            fetch_size=fetch_size,
+            commit_every=commit_every,
+            embed_concurrency=embed_concurrency,
+        )
+        return await pipeline.run(limit=limit)
+    finally:
+        logger.debug("Pipeline pool stats: %s", get_pool_stats(engine))
+        if owned_engine:
+            await engine.dispose()
 
 
 if __name__ == "__main__":
@@ -206,9 +389,21 @@ if __name__ == "__main__":
     parser.add_argument(
         "--batch-size",
         type=int,
-        default=32,
+        default=DEFAULT_EMBED_BATCH_SIZE,
         help="Batch size for embedding generation",
     )
+    parser.add_argument(
+        "--fetch-size",
+        type=int,
+        default=DEFAULT_FETCH_SIZE,
+        help="Chunks fetched from the database per batch",
+    )
+    parser.add_argument(
+        "--embed-concurrency",
+        type=int,
+        default=DEFAULT_EMBED_CONCURRENCY,
+        help="Batches embedded at once",
+    )
     parser.add_argument(
         "--limit",
         type=int,
@@ -219,22 +414,27 @@ if __name__ == "__main__":
     args = parser.parse_args()
 
     async def main():
-        if args.type in ["page", "all"]:
-            print("Processing page chunks...")
-            result = await run_embedding_pipeline(
-                chunk_type="page",
-                batch_size=args.batch_size,
-                limit=args.limit,
-            )
-            print(f"Page chunks: {result}")
-
-        if args.type in ["asset", "all"]:
-            print("Processing asset chunks...")
-            result = await run_embedding_pipeline(
-                chunk_type="asset",
-                batch_size=args.batch_size,
-                limit=args.limit,
+        # Page and asset chunks live in separate tables, so both pipelines can run at once
+        chunk_types = ["page", "asset"] if args.type == "all" else [args.type]
+        engine = create_pipeline_engine(pipelines=len(chunk_types))
+        try:
+            print(f"Processing {' and '.join(chunk_types)} chunks...")
+            results = await asyncio.gather(
+                *(
+                    run_embedding_pipeline(
+                        chunk_type=chunk_type,
+                        batch_size=args.batch_size,
+                        fetch_size=args.fetch_size,
+                        embed_concurrency=args.embed_concurrency,
+                        limit=args.limit,
+                        engine=engine,
+                    )
+                    for chunk_type in chunk_types
+                )
             )
-            print(f"Asset chunks: {result}")
+            for chunk_type, result in zip(chunk_types, results):
+                print(f"{chunk_type.capitalize()} chunks: {result}")
+        finally:
+            await engine.dispose()
 
     asyncio.run(main())
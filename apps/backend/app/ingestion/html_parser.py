@@ -2,26 +2,158 @@
 
 from __future__ import annotations
 
-import json
 import logging
 import re
 from dataclasses import dataclass, field
 from datetime import date, datetime
+from html import escape
+from typing import Any
 from urllib.parse import urljoin
 
-import bleach
-from bs4 import BeautifulSoup, Tag
+import nh3
+import orjson
+from bs4 import BeautifulSoup, ElementFilter, NavigableString, SoupStrainer, Tag
 
 logger = logging.getLogger(__name__)
 
-# Allowed HTML tags and attributes for sanitization
-ALLOWED_TAGS = ["p", "br", "a", "strong", "b", "em", "i", "ul", "ol", "li", "span"]
-ALLOWED_ATTRS = {"a": ["href", "title", "data-internal"]}
+# Allowed HTML tags, attributes and link schemes for sanitization
+ALLOWED_TAGS = {"p", "br", "a", "strong", "b", "em", "i", "ul", "ol", "li", "span"}
+ALLOWED_ATTRS = {"a": {"href", "title", "data-internal"}}
+ALLOWED_URL_SCHEMES = {"http", "https", "mailto"}
 
-SVS_BASE_URL = "https://svs.gsfc.nasa.gov"
+# Built once; disallowed tags are stripped (keeping their text) and links are
+# left without an added rel attribute
+HTML_SANITIZER = nh3.Cleaner(
+    tags=ALLOWED_TAGS,
+    attributes=ALLOWED_ATTRS,
+    url_schemes=ALLOWED_URL_SCHEMES,
+    link_rel=None,
+)
 
+SVS_BASE_URL = "https://svs.gsfc.nasa.gov"
 
-@dataclass
+# <meta> content values keyed by ("property" | "name", value), in document order
+MetaIndex = dict[tuple[str, str], list[str | None]]
+
+# Tags are classified by whether they contain one of these names (case-insensitive)
+KNOWN_MISSIONS = {
+    "MAVEN",
+    "Hubble",
+    "Webb",
+    "JWST",
+    "Cassini",
+    "Curiosity",
+    "Perseverance",
+    "Mars Reconnaissance Orbiter",
+    "MRO",
+    "LRO",
+    "TESS",
+    "Kepler",
+    "Spitzer",
+    "Chandra",
+    "Fermi",
+    "SDO",
+    "SOHO",
+    "ACE",
+    "STEREO",
+    "Parker Solar Probe",
+    "New Horizons",
+    "Juno",
+    "Europa Clipper",
+    "OSIRIS-REx",
+    "GOES",
+    "Landsat",
+    "Terra",
+    "Aqua",
+    "NOAA",
+    "GPM",
+    "ICESat",
+    "GRACE",
+}
+
+KNOWN_TARGETS = {
+    "Earth",
+    "Moon",
+    "Sun",
+    "Mars",
+    "Jupiter",
+    "Saturn",
+    "Venus",
+    "Mercury",
+    "Uranus",
+    "Neptune",
+    "Pluto",
+    "Europa",
+    "Titan",
+    "Enceladus",
+    "Io",
+    "Ganymede",
+    "Callisto",
+    "Ceres",
+    "Vesta",
+    "Bennu",
+    "Ryugu",
+    "Comet",
+}
+
+KNOWN_DOMAINS = {
+    "Earth Science",
+    "Heliophysics",
+    "Astrophysics",
+    "Planetary Science",
+    "Climate",
+    "Weather",
+    "Atmosphere",
+    "Ocean",
+    "Land",
+    "Ice",
+    "Solar",
+    "Space Weather",
+    "Galaxies",
+    "Black Holes",
+    "Stars",
+    "Exoplanets",
+    "Nebulae",
+    "Universe",
+    "Cosmology",
+}
+
+
+class ExtractedElements(ElementFilter):
+    """
+    Parse filter keeping only the elements the extractors read.
+
+    Applied at the top level of the document: a kept element keeps its whole
+    subtree, and kept elements nested in discarded ones (layout divs, the
+    body) are lifted to the top in document order. Everything else (inline
+    scripts, navigation, layout) never becomes a Tag.
+    """
+
+    # Every <ul> is kept: related-page lookup takes the first list after a heading
+    TAGS = frozenset(["title", "meta", "h1", "h2", "h3", "h4", "section", "header", "time", "video", "ul"])
+    DIV_CLASS_PATTERN = re.compile(r"download-notes|usage")
+
+    def allow_tag_creation(self, nsprefix: str | None, name: str, attrs: dict | None) -> bool:
+        if name in self.TAGS:
+            return True
+        attrs = attrs or {}
+        classes = attrs.get("class") or ""
+        if name == "div":
+            return "header" in classes.split() or bool(self.DIV_CLASS_PATTERN.search(classes))
+        if name == "nav":
+            return "row" in classes.split()
+        if name == "script":
+            return attrs.get("type") == "application/ld+json"
+        return False
+
+    def allow_string_creation(self, string: str) -> bool:
+        return False
+
+
+EXTRACTED_ELEMENTS = ExtractedElements()
+
+
+@dataclass(slots=True)
 class ParsedCredit:
     """Parsed credit/attribution."""
 
@@ -30,7 +162,7 @@ class ParsedCredit:
     organization: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedAssetFile:
     """Parsed asset file variant."""
 
@@ -42,7 +174,7 @@ class ParsedAssetFile:
     dimensions: tuple[int, int] | None = None  # width, height
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedAsset:
     """Parsed media asset."""
 
@@ -59,7 +191,7 @@ class ParsedAsset:
     caption_text: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedRelatedPage:
     """Parsed related SVS page reference."""
 
@@ -68,7 +200,7 @@ class ParsedRelatedPage:
     relation_type: str = "related"
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedSvsPage:
     """Parsed SVS page content."""
 
@@ -92,6 +224,16 @@ class ParsedSvsPage:
     content_json: dict | None = None
 
 
+@dataclass(slots=True)
+class GroupParagraph:
+    """A media-group paragraph long enough to count as description text."""
+
+    element: Tag
+    text: str  # Cleaned plain text
+    standalone: bool  # From the group's description div rather than its card body
+    in_dropdown: bool  # Inside a download dropdown menu
+
+
 class SvsHtmlParser:
     """Parser for SVS HTML pages."""
 
@@ -100,19 +242,51 @@ class SvsHtmlParser:
         self.dimension_pattern = re.compile(r"\((\d+)\s*[x×]\s*(\d+)\)")
         self.duration_pattern = re.compile(r"(\d+):(\d+)(?::(\d+))?")
         self.svs_id_pattern = re.compile(r"/(\d+)/?$")
+        self.media_group_pattern = re.compile(r"media_group_\d+")
+        self.description_div_pattern = re.compile(r"px-0|description")
+        self.people_link_pattern = re.compile(r"/search\?people=")
+        self.internal_link_pattern = re.compile(r"^/(\d+)/?$")
+        self.header_credit_class_pattern = re.compile(r"credit|author")
+        self.role_name_pattern = re.compile(r"^([^:]+):\s*(.+)$")
+        self.trailing_parens_pattern = re.compile(r"\(([^)]+)\)$")
+        self.credit_line_pattern = re.compile(r"^Credits?:\s*(.+)$", re.IGNORECASE)
+        self.credit_separator_pattern = re.compile(r"[;,]")
+        self.related_section_pattern = re.compile(r"related|see.*also", re.IGNORECASE)
+        self.download_notes_pattern = re.compile(r"download-notes|usage")
+        # One alternation per category, matched against the uppercased tag
+        self.mission_pattern = re.compile("|".join(re.escape(name.upper()) for name in KNOWN_MISSIONS))
+        self.target_pattern = re.compile("|".join(re.escape(name.upper()) for name in KNOWN_TARGETS))
+        self.domain_pattern = re.compile("|".join(re.escape(name.upper()) for name in KNOWN_DOMAINS))
+        self.credit_list_patterns = [
+            {"class_": re.compile(r"hstack.*list-unstyled")},
+            {"class_": "credits"},
+            {"class_": re.compile(r"credit")},
+        ]
+        # Credit sources, matched during a single walk over the document
+        self.credit_list_strainers = [SoupStrainer("ul", **pattern) for pattern in self.credit_list_patterns]
+        self.header_div_strainer = SoupStrainer("div", class_="header")
+        self.credits_section_strainer = SoupStrainer("section", id="section_credits")
 
-    def parse(self, html: str, svs_id: int) -> ParsedSvsPage:
+    def parse(self, html: str | bytes, svs_id: int, encoding: str | None = None) -> ParsedSvsPage:
         """
         Parse an SVS HTML page.
 
         Args:
-            html: Raw HTML content
+            html: Raw HTML content, as text or undecoded bytes
             svs_id: SVS page ID
+            encoding: Charset of `html` if bytes (detected from the document if omitted)
 
         Returns:
             ParsedSvsPage with extracted content
         """
-        soup = BeautifulSoup(html, "lxml")
+        soup = BeautifulSoup(html, "lxml", from_encoding=encoding, parse_only=EXTRACTED_ELEMENTS)
+        # Descriptions, rich content, assets and credits all read the media groups
+        media_groups = soup.find_all("section", id=self.media_group_pattern)
+        meta = self._index_meta(soup)
+        # Description, thumbnail and credits all fall back to the JSON-LD block
+        json_ld = self._load_json_ld(soup)
+        # Description and rich content read the same paragraphs; clean their text once
+        group_paragraphs = self._collect_group_paragraphs(media_groups)
 
         page = ParsedSvsPage(
             svs_id=svs_id,
@@ -121,21 +295,21 @@ class SvsHtmlParser:
         )
 
         # Extract main content sections
-        page.description = self._extract_description(soup)
-        page.summary = self._extract_summary(soup) or page.description
-        page.content_json = self._extract_rich_content(soup)  # Rich HTML content
-        page.published_date = self._extract_date(soup)
-        page.thumbnail_url = self._extract_thumbnail(soup)
-        page.credits = self._extract_credits(soup)
+        page.description = self._extract_description(group_paragraphs, json_ld)
+        page.summary = self._extract_summary(page.description) or page.description
+        page.content_json = self._extract_rich_content(group_paragraphs)  # Rich HTML content
+        page.published_date = self._extract_date(soup, meta)
+        page.thumbnail_url = self._extract_thumbnail(soup, meta, json_ld)
+        page.credits = self._extract_credits(soup, media_groups, json_ld)
 
         # Extract categorization from article:tag meta elements
-        page.keywords = self._extract_article_tags(soup)
-        page.missions = self._extract_missions(soup)
-        page.targets = self._extract_targets(soup)
-        page.domains = self._extract_domains(soup)
+        page.keywords = self._extract_article_tags(meta)
+        page.missions = self._extract_missions(page.keywords)
+        page.targets = self._extract_targets(page.keywords)
+        page.domains = self._extract_domains(page.keywords)
 
         # Extract media assets from media_group sections
-        page.assets = self._extract_assets(soup)
+        page.assets = self._extract_assets(media_groups)
 
         # Extract related pages
         page.related_pages = self._extract_related_pages(soup)
@@ -145,6 +319,26 @@ class SvsHtmlParser:
 
         return page
 
+    def _index_meta(self, soup: BeautifulSoup) -> MetaIndex:
+        """Collect every <meta> tag's content in one pass over the document."""
+        meta: MetaIndex = {}
+        for tag in soup.find_all("meta"):
+            for attr in ("property", "name"):
+                key = tag.get(attr)
+                if key is not None:
+                    meta.setdefault((attr, key), []).append(tag.get("content"))
+        return meta
+
+    def _load_json_ld(self, soup: BeautifulSoup) -> Any | None:
+        """Decode the page's JSON-LD block, or None if absent or malformed."""
+        script = soup.find("script", attrs={"type": "application/ld+json"})
+        if not script:
+            return None
+        try:
+            return orjson.loads(str(script.string))
+        except orjson.JSONDecodeError:
+            return None
+
     def _extract_title(self, soup: BeautifulSoup) -> str:
         """Extract page title."""
         # Try the main title element (SVS uses h1#title)
@@ -171,34 +365,57 @@ class SvsHtmlParser:
 
         return "Untitled"
 
-    def _extract_description(self, soup: BeautifulSoup) -> str | None:
-        """Extract main description/story text from media groups."""
-        descriptions = []
+    def _collect_group_paragraphs(self, media_groups: list[Tag]) -> list[list[GroupParagraph]]:
+        """
+        Gather each media group's description paragraphs with their cleaned text.
 
-        # Look for media group sections - they contain the actual descriptions
-        media_groups = soup.find_all("section", id=re.compile(r"media_group_\d+"))
+        Card-body paragraphs come first, then those of the standalone
+        description div. Paragraphs of 20 characters or fewer are dropped.
+        """
+        group_paragraphs = []
 
         for group in media_groups:
-            # Get description text from paragraphs, excluding download menus
             # The description is typically in the card-body or after the video
+            candidates = []
             desc_container = group.find("div", class_="card-body")
             if desc_container:
-                # Find description paragraphs (skip download dropdowns)
-                for p in desc_container.find_all("p", recursive=True):
-                    # Skip if inside dropdown menu
-                    if p.find_parent(class_="dropdown-menu"):
-                        continue
-                    text = self._clean_text(p.get_text())
-                    if text and len(text) > 20:  # Skip very short text
-                        descriptions.append(text)
-
-            # Also check for standalone description divs
-            standalone = group.find("div", class_=re.compile(r"px-0|description"))
+                candidates.extend((p, False) for p in desc_container.find_all("p", recursive=True))
+            standalone = group.find("div", class_=self.description_div_pattern)
             if standalone:
-                for p in standalone.find_all("p", recursive=True):
-                    text = self._clean_text(p.get_text())
-                    if text and len(text) > 20:
-                        descriptions.append(text)
+                candidates.extend((p, True) for p in standalone.find_all("p", recursive=True))
+
+            # Find dropdown paragraphs once per group rather than walking up from each
+            # paragraph; Tag hashes by its serialized markup, so key by identity
+            group_in_dropdown = "dropdown-menu" in group.get("class", ()) or bool(
+                group.find_parent(class_="dropdown-menu")
+            )
+            dropdown_ids = {id(p) for menu in group.find_all(class_="dropdown-menu") for p in menu.find_all("p")}
+
+            texts = [self._clean_text(p.get_text()) for p, _ in candidates]
+            group_paragraphs.append(
+                [
+                    GroupParagraph(
+                        element=p,
+                        text=text,
+                        standalone=is_standalone,
+                        in_dropdown=group_in_dropdown or id(p) in dropdown_ids,
+                    )
+                    for (p, is_standalone), text in zip(candidates, texts, strict=True)
+                    if len(text) > 20  # Skip very short text
+                ]
+            )
+
+        return group_paragraphs
+
+    def _extract_description(self, group_paragraphs: list[list[GroupParagraph]], json_ld: Any | None) -> str | None:
+        """Extract main description/story text from media groups."""
+        descriptions = [
+            para.text
+            for paragraphs in group_paragraphs
+            for para in paragraphs
+            # Skip card-body paragraphs inside download dropdowns
+            if para.standalone or not para.in_dropdown
+        ]
 
         if descriptions:
             # Deduplicate descriptions (same text may appear in multiple media groups)
@@ -213,24 +430,21 @@ class SvsHtmlParser:
             return " ".join(unique_descs)
 
         # Fallback: Try JSON-LD for description (but not the meta description which has file list)
-        script = soup.find("script", attrs={"type": "application/ld+json"})
-        if script:
+        if json_ld is not None:
             try:
-                data = json.loads(script.string)
                 # JSON-LD doesn't have the file list concatenated
-                if "description" in data:
-                    desc = data["description"]
+                if "description" in json_ld:
+                    desc = json_ld["description"]
                     # Make sure it's not the corrupted meta description
                     if "||" not in desc:
                         return desc
-            except (json.JSONDecodeError, TypeError):
+            except TypeError:
                 pass
 
         return None
 
-    def _extract_summary(self, soup: BeautifulSoup) -> str | None:
-        """Extract short summary - first paragraph of description."""
-        desc = self._extract_description(soup)
+    def _extract_summary(self, desc: str | None) -> str | None:
+        """Extract short summary - first sentence of the description."""
         if desc:
             # Take first sentence or paragraph as summary
             sentences = desc.split(". ")
@@ -241,7 +455,7 @@ class SvsHtmlParser:
                 return summary[:500]  # Limit length
         return None
 
-    def _extract_rich_content(self, soup: BeautifulSoup) -> dict | None:
+    def _extract_rich_content(self, group_paragraphs: list[list[GroupParagraph]]) -> dict | None:
         """
         Extract structured content preserving HTML formatting and links.
 
@@ -261,47 +475,25 @@ class SvsHtmlParser:
         """
         sections = []
 
-        # Look for media group sections - they contain the actual descriptions
-        media_groups = soup.find_all("section", id=re.compile(r"media_group_\d+"))
-
-        for group in media_groups:
+        # Media group sections contain the actual descriptions
+        for group in group_paragraphs:
             paragraphs = []
 
-            # Get description text from paragraphs in card-body
-            desc_container = group.find("div", class_="card-body")
-            if desc_container:
-                for p in desc_container.find_all("p", recursive=True):
-                    # Skip if inside dropdown menu
-                    if p.find_parent(class_="dropdown-menu"):
-                        continue
-
-                    # Transform internal SVS links before extracting
-                    self._transform_internal_links(p)
-
-                    # Get plain text for search/accessibility
-                    text = self._clean_text(p.get_text())
-                    if text and len(text) > 20:  # Skip very short text
-                        # Sanitize HTML to only allow safe tags
-                        html = bleach.clean(str(p), tags=ALLOWED_TAGS, attributes=ALLOWED_ATTRS, strip=True)
-                        paragraphs.append({"html": html, "text": text})
-
-            # Also check for standalone description divs
-            standalone = group.find("div", class_=re.compile(r"px-0|description"))
-            if standalone:
-                for p in standalone.find_all("p", recursive=True):
-                    # Skip if inside dropdown menu
-                    if p.find_parent(class_="dropdown-menu"):
-                        continue
+            for para in group:
+                # Skip if inside dropdown menu
+                if para.in_dropdown:
+                    continue
+
+                # Transform internal SVS links before extracting
+                self._transform_internal_links(para.element)
 
-                    # Transform internal SVS links before extracting
-                    self._transform_internal_links(p)
+                # Deduplicate standalone paragraphs based on text content
+                if para.standalone and any(existing["text"] == para.text for existing in paragraphs):
+                    continue
 
-                    text = self._clean_text(p.get_text())
-                    if text and len(text) > 20:
-                        html = bleach.clean(str(p), tags=ALLOWED_TAGS, attributes=ALLOWED_ATTRS, strip=True)
-                        # Deduplicate based on text content
-                        if not any(para["text"] == text for para in paragraphs):
-                            paragraphs.append({"html": html, "text": text})
+                # Sanitize HTML to only allow safe tags
+                html = HTML_SANITIZER.clean(self._markup(para.element))
+                paragraphs.append({"html": html, "text": para.text})
 
             if paragraphs:
                 sections.append({"type": "description", "paragraphs": paragraphs})
@@ -311,6 +503,49 @@ class SvsHtmlParser:
 
         return {"format_version": 1, "sections": sections}
 
+    def _markup(self, element: Tag) -> str:
+        """
+        Serialize a paragraph for the sanitizer.
+
+        Produces the same markup as str(element) without going through bs4's
+        per-node formatter machinery, which dominated rich-content extraction.
+        """
+        out: list[str] = []
+        self._write_markup(element, out)
+        return "".join(out)
+
+    def _write_markup(self, tag: Tag, out: list[str]) -> None:
+        """Append a tag's markup to `out`, following bs4's minimal formatter."""
+        out.append(f"<{tag.name}")
+        # bs4 writes attributes sorted by name
+        for key, value in sorted(tag.attrs.items()):
+            if value is None:
+                out.append(f" {key}")
+                continue
+            if isinstance(value, list):
+                value = " ".join(value)
+            value = escape(value, quote=False)
+            if '"' not in value:
+                out.append(f' {key}="{value}"')
+            elif "'" not in value:
+                out.append(f" {key}='{value}'")
+            else:
+                value = value.replace('"', "&quot;")
+                out.append(f' {key}="{value}"')
+        if tag.is_empty_element:
+            out.append("/>")
+            return
+        out.append(">")
+        for child in tag.contents:
+            if isinstance(child, Tag):
+                self._write_markup(child, out)
+            elif type(child) is NavigableString:
+                out.append(escape(child, quote=False))
+            else:
+                # Comments, doctypes and script text have their own output rules
+                out.append(child.output_ready())
+        out.append(f"</{tag.name}>")
+
     def _transform_internal_links(self, element: Tag) -> None:
         """
         Transform internal SVS links to app routes.
@@ -321,19 +556,18 @@ class SvsHtmlParser:
         for link in element.find_all("a", href=True):
             href = link["href"]
             # Match /NNNN/ or /NNNN pattern (SVS page links)
-            match = re.match(r"^/(\d+)/?$", href)
+            match = self.internal_link_pattern.match(href)
             if match:
                 svs_id = match.group(1)
                 link["href"] = f"/svs/{svs_id}"
                 link["data-internal"] = "true"
 
-    def _extract_thumbnail(self, soup: BeautifulSoup) -> str | None:
+    def _extract_thumbnail(self, soup: BeautifulSoup, meta: MetaIndex, json_ld: Any | None) -> str | None:
         """Extract main thumbnail URL from og:image or video poster."""
         # Try og:image meta tag first
-        og_image = soup.find("meta", attrs={"property": "og:image"})
-        if og_image and og_image.get("content"):
-            url = og_image["content"]
-            return urljoin(SVS_BASE_URL, url)
+        og_image = meta.get(("property", "og:image"))
+        if og_image and og_image[0]:
+            return urljoin(SVS_BASE_URL, og_image[0])
 
         # Try first video poster
         video = soup.find("video")
@@ -341,23 +575,21 @@ class SvsHtmlParser:
             return urljoin(SVS_BASE_URL, video["poster"])
 
         # Try JSON-LD thumbnailUrl
-        script = soup.find("script", attrs={"type": "application/ld+json"})
-        if script:
+        if json_ld is not None:
             try:
-                data = json.loads(script.string)
-                if "thumbnailUrl" in data:
-                    return urljoin(SVS_BASE_URL, data["thumbnailUrl"])
-            except (json.JSONDecodeError, TypeError):
+                if "thumbnailUrl" in json_ld:
+                    return urljoin(SVS_BASE_URL, json_ld["thumbnailUrl"])
+            except TypeError:
                 pass
 
         return None
 
-    def _extract_date(self, soup: BeautifulSoup) -> date | None:
+    def _extract_date(self, soup: BeautifulSoup, meta: MetaIndex) -> date | None:
         """Extract publication date."""
         # Try article:published_time meta tag (most reliable for SVS)
-        meta_date = soup.find("meta", attrs={"property": "article:published_time"})
-        if meta_date and meta_date.get("content"):
-            return self._parse_date(meta_date["content"])
+        meta_date = meta.get(("property", "article:published_time"))
+        if meta_date and meta_date[0]:
+            return self._parse_date(meta_date[0])
 
         # Try time element
         time_elem = soup.find("time")
@@ -372,6 +604,29 @@ class SvsHtmlParser:
         if not date_str:
             return None
 
+        # Dispatch on the shape of the string first; each strptime miss raises,
+        # so probing every format in turn is slow for the common ISO forms
+        clean_str = date_str.strip()
+        if len(clean_str) == 10 and clean_str[4] == "-" and clean_str[7] == "-":
+            # Plain ISO date (article:published_time)
+            try:
+                return date.fromisoformat(clean_str)
+            except ValueError:
+                pass
+        elif clean_str[10:11] == "T":
+            # ISO datetime; the date is fixed by its first 19 characters whatever offset follows
+            try:
+                return datetime.strptime(clean_str[:19], "%Y-%m-%dT%H:%M:%S").date()
+            except ValueError:
+                pass
+        elif clean_str[:3].isalpha():
+            # Month name first ("March 5, 2021" or "Mar 5, 2021")
+            for fmt in ("%B %d, %Y", "%b %d, %Y"):
+                try:
+                    return datetime.strptime(clean_str[:25], fmt).date()
+                except ValueError:
+                    continue
+
         # Common formats
         formats = [
             "%Y-%m-%dT%H:%M:%S%z",  # ISO with timezone
@@ -402,18 +657,37 @@ class SvsHtmlParser:
 
         return None
 
-    def _extract_credits(self, soup: BeautifulSoup) -> list[ParsedCredit]:
+    def _extract_credits(self, soup: BeautifulSoup, media_groups: list[Tag], json_ld: Any | None) -> list[ParsedCredit]:
         """Extract credits/attribution from various page locations."""
         credits = []
 
+        # Find the credit lists, header and credits section in one walk rather
+        # than a document search per location; tag names gate the strainers
+        credit_lists: list[list[Tag]] = [[] for _ in self.credit_list_strainers]
+        header_elem = header_div = credits_section = None
+        for elem in soup.descendants:
+            if not isinstance(elem, Tag):
+                continue
+            if elem.name == "ul":
+                for matches, strainer in zip(credit_lists, self.credit_list_strainers, strict=True):
+                    if strainer.match(elem):
+                        matches.append(elem)
+            elif elem.name == "header":
+                if header_elem is None:
+                    header_elem = elem
+            elif elem.name == "div":
+                if header_div is None and self.header_div_strainer.match(elem):
+                    header_div = elem
+            elif elem.name == "section":
+                if credits_section is None and self.credits_section_strainer.match(elem):
+                    credits_section = elem
+
         # 1. Try JSON-LD first (most reliable when present)
-        script = soup.find("script", attrs={"type": "application/ld+json"})
-        if script:
+        if json_ld is not None:
             try:
-                data = json.loads(script.string)
                 # Check for author field
-                if "author" in data:
-                    authors = data["author"]
+                if "author" in json_ld:
+                    authors = json_ld["author"]
                     if isinstance(authors, dict):
                         authors = [authors]
                     for author in authors:
@@ -436,8 +710,8 @@ class SvsHtmlParser:
                                 )
                             )
                 # Check for contributor field
-                if "contributor" in data:
-                    contributors = data["contributor"]
+                if "contributor" in json_ld:
+                    contributors = json_ld["contributor"]
                     if isinstance(contributors, dict):
                         contributors = [contributors]
                     for contrib in contributors:
@@ -451,21 +725,14 @@ class SvsHtmlParser:
                                     else None,
                                 )
                             )
-            except (json.JSONDecodeError, TypeError, KeyError):
+            except (TypeError, KeyError):
                 pass
 
         # 2. Look in header area with various class patterns
         # SVS pages have credits in header with links to /search?people=NAME
         # Try multiple patterns for the credit list
-        credit_patterns = [
-            {"class_": re.compile(r"hstack.*list-unstyled")},
-            {"class_": "credits"},
-            {"class_": re.compile(r"credit")},
-        ]
-
-        for pattern in credit_patterns:
-            credit_lists = soup.find_all("ul", **pattern)
-            for credit_list in credit_lists:
+        for matches in credit_lists:
+            for credit_list in matches:
                 role = None
                 # Look for role label (bold text ending in colon)
                 role_elem = credit_list.find(class_="fw-bold") or credit_list.find("strong")
@@ -475,7 +742,7 @@ class SvsHtmlParser:
                         role = role_text[:-1].strip()
 
                 # Find all person links
-                for link in credit_list.find_all("a", href=re.compile(r"/search\?people=")):
+                for link in credit_list.find_all("a", href=self.people_link_pattern):
                     name = link.get_text(strip=True)
                     if name and role:
                         credits.append(
@@ -487,16 +754,16 @@ class SvsHtmlParser:
                         )
 
         # 3. Look for header spans/divs with credit info
-        header = soup.find("header") or soup.find("div", class_="header")
+        header = header_elem or header_div
         if header:
-            for span in header.find_all(["span", "div"], class_=re.compile(r"credit|author")):
+            for span in header.find_all(["span", "div"], class_=self.header_credit_class_pattern):
                 text = span.get_text(strip=True)
                 # Pattern: "Role: Name" or "Role by Name"
-                role_match = re.match(r"^([^:]+):\s*(.+)$", text)
+                role_match = self.role_name_pattern.match(text)
                 if role_match:
                     role, name = role_match.groups()
                     # Check for organization in parentheses
-                    org_match = re.search(r"\(([^)]+)\)$", name)
+                    org_match = self.trailing_parens_pattern.search(name)
                     org = org_match.group(1) if org_match else None
                     if org_match:
                         name = name[: org_match.start()].strip()
@@ -509,7 +776,6 @@ class SvsHtmlParser:
                     )
 
         # 4. Look in the dedicated credits section
-        credits_section = soup.find("section", id="section_credits")
         if credits_section:
             current_role = None
             for elem in credits_section.find_all(["dt", "dd", "h4", "h5", "li", "p"]):
@@ -525,7 +791,7 @@ class SvsHtmlParser:
 
                     if name and len(name) > 1:
                         # Check for organization in parentheses
-                        org_match = re.search(r"\(([^)]+)\)$", name)
+                        org_match = self.trailing_parens_pattern.search(name)
                         org = org_match.group(1) if org_match else None
                         if org_match:
                             name = name[: org_match.start()].strip()
@@ -539,21 +805,21 @@ class SvsHtmlParser:
                         )
 
         # 5. Look for credit info in description area (some pages embed credits there)
-        for media_group in soup.find_all("section", id=re.compile(r"media_group_\d+")):
+        for media_group in media_groups:
             card_body = media_group.find("div", class_="card-body")
             if card_body:
                 # Look for "Credit:" patterns
                 for p in card_body.find_all("p"):
                     text = p.get_text(strip=True)
-                    credit_match = re.match(r"^Credits?:\s*(.+)$", text, re.IGNORECASE)
+                    credit_match = self.credit_line_pattern.match(text)
                     if credit_match:
                         credit_text = credit_match.group(1)
                         # Handle multiple credits separated by semicolons or commas
-                        for part in re.split(r"[;,]", credit_text):
+                        for part in self.credit_separator_pattern.split(credit_text):
                             part = part.strip()
                             if part:
                                 # Try to extract role from pattern "Name (Role)"
-                                role_match = re.search(r"\(([^)]+)\)$", part)
+                                role_match = self.trailing_parens_pattern.search(part)
                                 if role_match:
                                     org_or_role = role_match.group(1)
                                     name = part[: role_match.start()].strip()
@@ -584,157 +850,59 @@ class SvsHtmlParser:
                 unique_credits.append(credit)
         return unique_credits
 
-    def _extract_article_tags(self, soup: BeautifulSoup) -> list[str]:
+    def _extract_article_tags(self, meta: MetaIndex) -> list[str]:
         """Extract keywords from article:tag meta elements."""
         keywords = []
 
         # SVS uses <meta property="article:tag" content="TAG"> for each tag
-        for meta in soup.find_all("meta", attrs={"property": "article:tag"}):
-            content = meta.get("content")
+        for content in meta.get(("property", "article:tag"), []):
             if content:
                 keywords.append(content.strip())
 
         # Also try meta keywords as fallback
-        meta_keywords = soup.find("meta", attrs={"name": "keywords"})
-        if meta_keywords and meta_keywords.get("content"):
-            for kw in meta_keywords["content"].split(","):
+        meta_keywords = meta.get(("name", "keywords"))
+        if meta_keywords and meta_keywords[0]:
+            for kw in meta_keywords[0].split(","):
                 kw = kw.strip()
-                if kw and kw not in keywords:
+                if kw:
                     keywords.append(kw)
 
-        return list(set(keywords))
+        return list(dict.fromkeys(keywords))
 
-    def _extract_missions(self, soup: BeautifulSoup) -> list[str]:
+    def _extract_missions(self, tags: list[str]) -> list[str]:
         """Extract mission names from tags."""
         # Missions are typically included in the article:tag metadata
         # We detect them by common mission names
         missions = []
-        known_missions = {
-            "MAVEN",
-            "Hubble",
-            "Webb",
-            "JWST",
-            "Cassini",
-            "Curiosity",
-            "Perseverance",
-            "Mars Reconnaissance Orbiter",
-            "MRO",
-            "LRO",
-            "TESS",
-            "Kepler",
-            "Spitzer",
-            "Chandra",
-            "Fermi",
-            "SDO",
-            "SOHO",
-            "ACE",
-            "STEREO",
-            "Parker Solar Probe",
-            "New Horizons",
-            "Juno",
-            "Europa Clipper",
-            "OSIRIS-REx",
-            "GOES",
-            "Landsat",
-            "Terra",
-            "Aqua",
-            "NOAA",
-            "GPM",
-            "ICESat",
-            "GRACE",
-        }
-
-        tags = self._extract_article_tags(soup)
         for tag in tags:
             # Check if tag matches or contains a known mission
-            tag_upper = tag.upper()
-            for mission in known_missions:
-                if mission.upper() in tag_upper:
-                    missions.append(tag)
-                    break
+            if self.mission_pattern.search(tag.upper()):
+                missions.append(tag)
 
-        return list(set(missions))
+        return list(dict.fromkeys(missions))
 
-    def _extract_targets(self, soup: BeautifulSoup) -> list[str]:
+    def _extract_targets(self, tags: list[str]) -> list[str]:
         """Extract celestial body targets from tags."""
         targets = []
-        known_targets = {
-            "Earth",
-            "Moon",
-            "Sun",
-            "Mars",
-            "Jupiter",
-            "Saturn",
-            "Venus",
-            "Mercury",
-            "Uranus",
-            "Neptune",
-            "Pluto",
-            "Europa",
-            "Titan",
-            "Enceladus",
-            "Io",
-            "Ganymede",
-            "Callisto",
-            "Ceres",
-            "Vesta",
-            "Bennu",
-            "Ryugu",
-            "Comet",
-        }
-
-        tags = self._extract_article_tags(soup)
         for tag in tags:
-            tag_upper = tag.upper()
-            for target in known_targets:
-                if target.upper() in tag_upper:
-                    targets.append(tag)
-                    break
+            if self.target_pattern.search(tag.upper()):
+                targets.append(tag)
 
-        return list(set(targets))
+        return list(dict.fromkeys(targets))
 
-    def _extract_domains(self, soup: BeautifulSoup) -> list[str]:
+    def _extract_domains(self, tags: list[str]) -> list[str]:
         """Extract scientific domains from tags."""
         domains = []
-        known_domains = {
-            "Earth Science",
-            "Heliophysics",
-            "Astrophysics",
-            "Planetary Science",
-            "Climate",
-            "Weather",
-            "Atmosphere",
-            "Ocean",
-            "Land",
-            "Ice",
-            "Solar",
-            "Space Weather",
-            "Galaxies",
-            "Black Holes",
-            "Stars",
-            "Exoplanets",
-            "Nebulae",
-            "Universe",
-            "Cosmology",
-        }
-
-        tags = self._extract_article_tags(soup)
         for tag in tags:
-            tag_upper = tag.upper()
-            for domain in known_domains:
-                if domain.upper() in tag_upper:
-                    domains.append(tag)
-                    break
+            if self.domain_pattern.search(tag.upper()):
+                domains.append(tag)
 
-        return list(set(domains))
+        return list(dict.fromkeys(domains))
 
-    def _extract_assets(self, soup: BeautifulSoup) -> list[ParsedAsset]:
+    def _extract_assets(self, media_groups: list[Tag]) -> list[ParsedAsset]:
         """Extract media assets from media_group sections."""
         assets = []
 
-        # Find all media group sections
-        media_groups = soup.find_all("section", id=re.compile(r"media_group_\d+"))
-
         for group in media_groups:
             asset = self._parse_media_group(group)
             if asset:
@@ -886,7 +1054,7 @@ class SvsHtmlParser:
         related = []
 
         # Look for "See Also" or related sections
-        related_section = soup.find("section", id=re.compile(r"related|see.*also", re.I))
+        related_section = soup.find("section", id=self.related_section_pattern)
         if not related_section:
             # Try finding by heading
             for heading in soup.find_all(["h2", "h3", "h4"]):
@@ -932,7 +1100,7 @@ class SvsHtmlParser:
 
     def _extract_download_notes(self, soup: BeautifulSoup) -> str | None:
         """Extract download/usage notes."""
-        notes_section = soup.find("div", class_=re.compile(r"download-notes|usage"))
+        notes_section = soup.find("div", class_=self.download_notes_pattern)
         if notes_section:
             return self._clean_text(notes_section.get_text())
         return None
@@ -964,6 +1132,5 @@ class SvsHtmlParser:
 
     def _clean_text(self, text: str) -> str:
         """Clean and normalize text content."""
-        # Remove excess whitespace
-        text = re.sub(r"\s+", " ", text)
-        return text.strip()
+        # Collapse whitespace runs; str.split() splits on the same characters as \s
+        return " ".join(text.split())
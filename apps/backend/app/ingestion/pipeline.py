@@ -3,11 +3,13 @@
 from __future__ import annotations
 
 import logging
+import time
 from collections.abc import Callable
 from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import and_, func, or_, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.ingestion.api_client import SvsApiClient, SvsSearchResult
@@ -24,9 +26,19 @@ from app.models import (
     SvsPageRelation,
     Tag,
 )
+from app.models.page import PageStatus
+from app.services.cache import invalidate_page_cache
 
 logger = logging.getLogger(__name__)
 
+# Rows per INSERT ... ON CONFLICT during discovery (7 params per row, well under asyncpg's limit)
+DISCOVERY_UPSERT_BATCH_SIZE = 1000
+
+# Content update sizes each batch so that its claimed rows, locked from claim to
+# commit (page fetches included), are held for about the target time
+CONTENT_UPDATE_MAX_BATCH_SIZE = 500
+CONTENT_UPDATE_TARGET_BATCH_SECONDS = 60.0
+
 
 class IngestionPipeline:
     """
@@ -65,17 +77,23 @@ class IngestionPipeline:
         """
         logger.info(f"Starting discovery phase for run {run_id}")
 
+        # Store pages as they stream in, one INSERT ... ON CONFLICT per batch.
+        # Keyed by ID since a statement can't upsert the same row twice.
+        count = 0
+        pending: dict[int, SvsSearchResult] = {}
         async with self.api_client:
-            results = await self.api_client.discover_all_pages(
+            async for result in self.api_client.iter_all_pages(
                 batch_size=500,
                 progress_callback=progress_callback,
-            )
+            ):
+                count += 1
+                pending[result.id] = result
+                if len(pending) >= DISCOVERY_UPSERT_BATCH_SIZE:
+                    await self._upsert_pages_from_api(list(pending.values()))
+                    pending.clear()
 
-        # Store discovered pages
-        count = 0
-        for result in results:
-            await self._upsert_page_from_api(result)
-            count += 1
+        if pending:
+            await self._upsert_pages_from_api(list(pending.values()))
 
         await self.session.commit()
         logger.info(f"Discovery complete: {count} pages found")
@@ -121,11 +139,14 @@ class IngestionPipeline:
         processed = 0
         success = 0
         errors = 0
+        # Pages whose cached entries are dropped once their changes commit
+        changed_ids: list[int] = []
 
         async with self.api_client:
             for page in pages:
                 try:
-                    await self._crawl_page(page)
+                    if await self._crawl_page(page):
+                        changed_ids.append(page.svs_id)
                     success += 1
                 except Exception as e:
                     logger.error(f"Error crawling page {page.svs_id}: {e}")
@@ -138,8 +159,11 @@ class IngestionPipeline:
                 # Commit periodically
                 if processed % 10 == 0:
                     await self.session.commit()
+                    await invalidate_page_cache(changed_ids)
+                    changed_ids.clear()
 
         await self.session.commit()
+        await invalidate_page_cache(changed_ids)
         logger.info(f"HTML crawl complete: {success} success, {errors} errors")
         return processed, success, errors
 
@@ -165,8 +189,12 @@ class IngestionPipeline:
         status: str,
         **kwargs,
     ) -> None:
-        """Update run status and metrics."""
-        result = await self.session.execute(select(IngestRun).where(IngestRun.run_id == run_id))
+        """Update run status and metrics.
+
+        The run row is locked for the read-modify-write so concurrent
+        updates (e.g. a retry racing a completion) apply one after another.
+        """
+        result = await self.session.execute(select(IngestRun).where(IngestRun.run_id == run_id).with_for_update())
         run = result.scalar_one_or_none()
         if run:
             run.status = status
@@ -175,41 +203,53 @@ class IngestionPipeline:
                     setattr(run, key, value)
             await self.session.commit()
 
-    async def _upsert_page_from_api(self, result: SvsSearchResult) -> SvsPage:
-        """Create or update page from API result."""
-        existing = await self.session.execute(select(SvsPage).where(SvsPage.svs_id == result.id))
-        page = existing.scalar_one_or_none()
-
-        if page:
-            # Update existing
-            page.title = result.title
-            page.canonical_url = result.url
-            if result.release_date:
-                page.published_date = self._parse_date(result.release_date)
-            page.api_source = True
-        else:
-            # Create new
-            page = SvsPage(
-                svs_id=result.id,
-                title=result.title,
-                canonical_url=result.url,
-                published_date=self._parse_date(result.release_date) if result.release_date else None,
-                summary=result.description,
-                api_source=True,
-            )
-            self.session.add(page)
+    async def _upsert_pages_from_api(self, results: list[SvsSearchResult]) -> None:
+        """Create or update a batch of pages from API results in one statement."""
+        stmt = pg_insert(SvsPage).values(
+            [
+                {
+                    "svs_id": result.id,
+                    "title": result.title,
+                    "canonical_url": result.url,
+                    "published_date": self._parse_date(result.release_date) if result.release_date else None,
+                    "summary": result.description,
+                    "status": PageStatus.ACTIVE.value,
+                    "api_source": True,
+                }
+                for result in results
+            ]
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[SvsPage.svs_id],
+            set_={
+                "title": stmt.excluded.title,
+                "canonical_url": stmt.excluded.canonical_url,
+                # Keep the stored date when the API omits one
+                "published_date": func.coalesce(stmt.excluded.published_date, SvsPage.published_date),
+                "api_source": True,
+                "updated_at": func.now(),
+            },
+        )
+        await self.session.execute(stmt)
 
-        return page
+    async def _crawl_page(self, page: SvsPage) -> bool:
+        """
+        Crawl and parse a single page.
 
-    async def _crawl_page(self, page: SvsPage) -> None:
-        """Crawl and parse a single page."""
-        logger.debug(f"Crawling page {page.svs_id}")
+        Returns:
+            True if the page was re-parsed, False if it was unchanged
+        """
+        logger.debug("Crawling page %s", page.svs_id)
 
-        # Fetch HTML
-        html = await self.api_client.fetch_page_html(page.svs_id)
+        # Fetch HTML, skipping the parse if the page is unchanged since the last crawl
+        fetched = await self.api_client.fetch_page(page.svs_id, etag=page.etag, last_modified=page.last_modified)
+        if fetched is None:
+            logger.debug("Page %s not modified", page.svs_id)
+            page.last_checked_at = datetime.utcnow()
+            return False
 
         # Parse content
-        parsed = self.html_parser.parse(html, page.svs_id)
+        parsed = self.html_parser.parse(fetched.html, page.svs_id, encoding=fetched.encoding)
 
         # Update page fields
         page.title = parsed.title
@@ -219,6 +259,8 @@ class IngestionPipeline:
         page.published_date = parsed.published_date
         page.thumbnail_url = parsed.thumbnail_url
         page.credits_json = [{"role": c.role, "name": c.name, "organization": c.organization} for c in parsed.credits]
+        page.etag = fetched.etag
+        page.last_modified = fetched.last_modified
         page.html_crawled_at = datetime.utcnow()
         page.last_checked_at = datetime.utcnow()
 
@@ -234,6 +276,8 @@ class IngestionPipeline:
         # Create text chunks
         await self._create_text_chunks(page, parsed)
 
+        return True
+
     async def _process_tags(self, page: SvsPage, parsed: ParsedSvsPage) -> None:
         """Process and link tags for a page."""
         # Collect all tags by type
@@ -251,6 +295,7 @@ class IngestionPipeline:
 
     async def _get_or_create_tag(self, tag_type: str, value: str) -> Tag:
         """Get existing tag or create new one."""
+        # Same normalization as the generated tag.normalized_value column
         normalized = value.lower().strip()
 
         result = await self.session.execute(
@@ -265,7 +310,6 @@ class IngestionPipeline:
             tag = Tag(
                 tag_type=tag_type,
                 value=value,
-                normalized_value=normalized,
                 display_name=value,
             )
             self.session.add(tag)
@@ -427,8 +471,13 @@ class IngestionPipeline:
         - content_json: Structured HTML content with paragraph preservation
         - credits_json: Re-extracted credits (fixes empty extraction)
 
+        Claimed rows stay locked until their batch commits, so the batch size
+        adapts to whole-batch wall time (claim, page fetches and commit): the
+        next batch is sized to take about CONTENT_UPDATE_TARGET_BATCH_SECONDS,
+        growing at most 2x per batch and never past CONTENT_UPDATE_MAX_BATCH_SIZE.
+
         Args:
-            batch_size: Number of pages to process per batch
+            batch_size: Initial number of pages to process per batch
             priority_first: If True, start with recently published pages
             max_pages: Maximum number of pages to process (None = all)
             progress_callback: Callback(processed, success, errors)
@@ -438,33 +487,40 @@ class IngestionPipeline:
         """
         logger.info("Starting content update crawl for pages missing content_json")
 
-        # Query pages that need content update
-        query = select(SvsPage).where(
+        started_at = datetime.utcnow()
+        needs_update = and_(
             SvsPage.html_crawled_at.isnot(None),  # Only already crawled pages
             SvsPage.content_json.is_(None),  # Missing rich content
+            # Skip pages already attempted by this or a concurrent run
+            or_(SvsPage.last_checked_at.is_(None), SvsPage.last_checked_at < started_at),
         )
 
-        if priority_first:
-            query = query.order_by(SvsPage.published_date.desc().nulls_last())
-        else:
-            query = query.order_by(SvsPage.svs_id)
+        count_result = await self.session.execute(select(func.count()).select_from(SvsPage).where(needs_update))
+        logger.info(f"Found {count_result.scalar() or 0} pages needing content update")
 
-        if max_pages:
-            query = query.limit(max_pages)
+        order_by = SvsPage.published_date.desc().nulls_last() if priority_first else SvsPage.svs_id
 
-        result = await self.session.execute(query)
-        pages = result.scalars().all()
-
-        total = len(pages)
         processed = 0
         success = 0
         errors = 0
 
-        logger.info(f"Found {total} pages needing content update")
-
         async with self.api_client:
-            for i in range(0, total, batch_size):
-                batch = pages[i : i + batch_size]
+            while max_pages is None or processed < max_pages:
+                claim_size = batch_size if max_pages is None else min(batch_size, max_pages - processed)
+                batch_started = time.monotonic()
+
+                # Claim a batch; rows locked by another worker are skipped, and
+                # the locks are held until the batch commits
+                result = await self.session.execute(
+                    select(SvsPage)
+                    .where(needs_update)
+                    .order_by(order_by)
+                    .limit(claim_size)
+                    .with_for_update(skip_locked=True)
+                )
+                batch = result.scalars().all()
+                if not batch:
+                    break
 
                 for page in batch:
                     try:
@@ -472,31 +528,43 @@ class IngestionPipeline:
                         success += 1
                     except Exception as e:
                         logger.error(f"Error updating content for page {page.svs_id}: {e}")
+                        # Mark as attempted so the page is not claimed again in this run
+                        page.last_checked_at = datetime.utcnow()
                         errors += 1
 
                     processed += 1
                     if progress_callback:
                         progress_callback(processed, success, errors)
 
-                # Commit after each batch
+                # Commit after each batch, releasing the row locks
                 await self.session.commit()
-                logger.info(f"Batch complete: {processed}/{total} processed, {success} success, {errors} errors")
+                batch_seconds = time.monotonic() - batch_started
+                logger.info(
+                    f"Batch complete: {processed} processed, {success} success, {errors} errors "
+                    f"(batch {len(batch)} in {batch_seconds:.1f}s)"
+                )
+
+                # Size the next batch from this one's per-page rate
+                target_size = int(len(batch) * CONTENT_UPDATE_TARGET_BATCH_SECONDS / max(batch_seconds, 0.001))
+                batch_size = max(1, min(target_size, batch_size * 2, CONTENT_UPDATE_MAX_BATCH_SIZE))
 
         logger.info(f"Content update complete: {success} success, {errors} errors out of {processed} processed")
         return processed, success, errors
 
     async def _update_page_content(self, page: SvsPage) -> None:
         """Re-fetch and parse a page to update rich content fields."""
-        logger.debug(f"Updating content for page {page.svs_id}")
+        logger.debug("Updating content for page %s", page.svs_id)
 
-        # Fetch HTML
-        html = await self.api_client.fetch_page_html(page.svs_id)
+        # Always fetch unconditionally: the point is to re-parse existing HTML
+        fetched = await self.api_client.fetch_page(page.svs_id)
 
         # Parse content
-        parsed = self.html_parser.parse(html, page.svs_id)
+        parsed = self.html_parser.parse(fetched.html, page.svs_id, encoding=fetched.encoding)
 
         # Update content_json
         page.content_json = parsed.content_json
+        page.etag = fetched.etag
+        page.last_modified = fetched.last_modified
 
         # Update credits if currently empty or missing
         if not page.credits_json and parsed.credits:
@@ -511,14 +579,21 @@ async def run_full_ingestion(
     session: AsyncSession,
     max_pages: int | None = None,
     skip_existing: bool = True,
+    api_client: SvsApiClient | None = None,
 ) -> dict:
     """
     Run a full ingestion pipeline.
 
+    Args:
+        session: Database session
+        max_pages: Maximum pages to crawl
+        skip_existing: Skip pages already crawled
+        api_client: Shared SVS API client (a new one is created if omitted)
+
     Returns:
         Dict with run statistics
     """
-    pipeline = IngestionPipeline(session)
+    pipeline = IngestionPipeline(session, api_client=api_client)
 
     # Create run record
     run = await pipeline.create_run(
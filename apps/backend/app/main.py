@@ -5,17 +5,22 @@ from __future__ import annotations
 import logging
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
+from uuid import UUID
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from sqlalchemy import select
 
+from app.api.responses import OrjsonResponse
 from app.api.v1 import admin, assets, chat, pages, search, thumbnails
 from app.config import get_settings
-from app.database import close_database_connection, verify_database_connection
+from app.database import close_database_connection, verify_database_connection, warm_database_pools
 from app.middleware.headers import RateLimitHeadersMiddleware
+from app.models import IngestRun, SvsPage
 from app.redis import close_redis, init_redis, verify_redis_connection
 from app.services.embedding import preload_embedding_model
 from app.services.storage import get_storage_service
+from app.task_queue import close_task_queue
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
@@ -40,6 +45,18 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     db_ok = await verify_database_connection()
     if not db_ok:
         logger.error("Database connection failed - application may not function correctly")
+    else:
+        # Fill the pools and prepare the hottest lookups before serving traffic
+        try:
+            await warm_database_pools(
+                statements=[
+                    select(SvsPage).where(SvsPage.svs_id == 0),
+                    select(IngestRun).where(IngestRun.run_id == UUID(int=0)),
+                ],
+                raw_statements=[(thumbnails.THUMBNAIL_LOCATION_SQL, (0,))],
+            )
+        except Exception as e:
+            logger.warning(f"Database pool warmup failed: {e}")
 
     # Initialize Redis connection
     redis_ok = await init_redis()
@@ -60,7 +77,8 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Shutdown
     logger.info("Shutting down SVS Browser API...")
 
-    # Close Redis connection
+    # Close Redis connections
+    await close_task_queue()
     await close_redis()
 
     # Close database connections
@@ -74,6 +92,7 @@ app = FastAPI(
     version=settings.app_version,
     description="NASA Scientific Visualization Studio Knowledge Browser API",
     lifespan=lifespan,
+    default_response_class=OrjsonResponse,
     docs_url="/docs",
     redoc_url="/redoc",
 )
@@ -0,0 +1,119 @@
+"""Helpers shared by Alembic migration scripts."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+import sqlalchemy as sa
+
+from alembic import context, op
+
+
+def create_index_concurrently(name: str, table: str, columns: list[str], **kw: Any) -> None:
+    """
+    Create an index without blocking writes to the table.
+
+    CREATE INDEX CONCURRENTLY only takes a SHARE UPDATE EXCLUSIVE lock, so
+    ingestion can keep writing while the index builds. It cannot run inside
+    a transaction, so the statement is issued in an autocommit block.
+
+    Args:
+        name: Index name
+        table: Table name
+        columns: Indexed columns (or expressions)
+        **kw: Extra arguments passed to op.create_index (postgresql_using, etc.)
+    """
+    with op.get_context().autocommit_block():
+        op.create_index(name, table, columns, postgresql_concurrently=True, if_not_exists=True, **kw)
+
+
+def drop_index_concurrently(name: str, table: str) -> None:
+    """
+    Drop an index without blocking writes to the table.
+
+    Args:
+        name: Index name
+        table: Table name
+    """
+    with op.get_context().autocommit_block():
+        op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+
+
+def prewarm_index(name: str) -> None:
+    """
+    Load an index into shared buffers so the first queries skip cold reads.
+
+    pg_prewarm is contrib and may need superuser, so a failure is reported
+    as a notice and never fails the migration.
+
+    Args:
+        name: Index name
+    """
+    op.execute(f"""
+        DO $$
+        BEGIN
+            CREATE EXTENSION IF NOT EXISTS pg_prewarm;
+            PERFORM pg_prewarm('{name}');
+        EXCEPTION WHEN OTHERS THEN
+            RAISE NOTICE 'Skipping pg_prewarm: %', SQLERRM;
+        END
+        $$
+    """)
+
+
+def fresh_upgrade_through(revision: str) -> bool:
+    """
+    Check whether this run builds an unversioned database up to `revision`.
+
+    env.py records whether the database had no alembic_version row when the
+    run started. Revisions use this to batch DDL that later revisions in the
+    same run would otherwise repeat statement by statement. Offline (--sql)
+    runs never take the fast path.
+
+    Args:
+        revision: Revision the run must reach
+    """
+    if not context.config.attributes.get("fresh_database"):
+        return False
+    destination = context.get_revision_argument()
+    if destination is None:
+        return False
+    return any(script.revision == revision for script in context.script.iterate_revisions(destination, "base"))
+
+
+def table_has_rows(table: str) -> bool:
+    """
+    Check whether a table holds any rows.
+
+    Offline (--sql) migrations cannot inspect data, so they assume it does.
+
+    Args:
+        table: Table name
+    """
+    if op.get_context().as_sql:
+        return True
+    return bool(op.get_bind().execute(sa.text(f"SELECT EXISTS (SELECT 1 FROM {table})")).scalar())
+
+
+@contextmanager
+def index_build_settings() -> Iterator[None]:
+    """
+    Give index builds in the block more memory and parallel workers.
+
+    The settings are applied at session level (not SET LOCAL) because
+    concurrent builds run outside the migration transaction, and are reset
+    even if the build fails so they do not stay on the connection.
+    """
+    with op.get_context().autocommit_block():
+        op.execute("SET maintenance_work_mem = '2GB'")
+        op.execute("SET max_parallel_maintenance_workers = 7")
+        op.execute("SET max_parallel_workers = 8")
+    try:
+        yield
+    finally:
+        with op.get_context().autocommit_block():
+            op.execute("RESET maintenance_work_mem")
+            op.execute("RESET max_parallel_maintenance_workers")
+            op.execute("RESET max_parallel_workers")
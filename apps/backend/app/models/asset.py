@@ -10,7 +10,7 @@ from sqlalchemy import BigInteger, ForeignKey, Index, String, Text, text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.models.base import Base, TimestampMixin
+from app.models.base import Base, TimestampMixin, uuid7
 
 if TYPE_CHECKING:
     from app.models.chunk import AssetTextChunk
@@ -34,9 +34,12 @@ class Asset(Base, TimestampMixin):
 
     asset_id: Mapped[UUID] = mapped_column(
         primary_key=True,
+        default=uuid7,
         server_default=text("gen_random_uuid()"),
     )
-    svs_id: Mapped[int] = mapped_column(ForeignKey("svs_page.svs_id", ondelete="CASCADE"))
+    svs_id: Mapped[int] = mapped_column(
+        ForeignKey("svs_page.svs_id", ondelete="CASCADE", deferrable=True, initially="DEFERRED")
+    )
     title: Mapped[str | None] = mapped_column(String(500), nullable=True)
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
     # Rich caption with HTML formatting preserved
@@ -90,9 +93,12 @@ class AssetFile(Base, TimestampMixin):
 
     file_id: Mapped[UUID] = mapped_column(
         primary_key=True,
+        default=uuid7,
         server_default=text("gen_random_uuid()"),
     )
-    asset_id: Mapped[UUID] = mapped_column(ForeignKey("asset.asset_id", ondelete="CASCADE"))
+    asset_id: Mapped[UUID] = mapped_column(
+        ForeignKey("asset.asset_id", ondelete="CASCADE", deferrable=True, initially="DEFERRED")
+    )
     variant: Mapped[str] = mapped_column(String(50))
     file_url: Mapped[str] = mapped_column(String(1000))
     storage_uri: Mapped[str | None] = mapped_column(String(1000), nullable=True)  # For future local storage
@@ -116,9 +122,12 @@ class AssetThumbnail(Base, TimestampMixin):
 
     thumbnail_id: Mapped[UUID] = mapped_column(
         primary_key=True,
+        default=uuid7,
         server_default=text("gen_random_uuid()"),
     )
-    asset_id: Mapped[UUID] = mapped_column(ForeignKey("asset.asset_id", ondelete="CASCADE"))
+    asset_id: Mapped[UUID] = mapped_column(
+        ForeignKey("asset.asset_id", ondelete="CASCADE", deferrable=True, initially="DEFERRED")
+    )
     url: Mapped[str] = mapped_column(String(1000))
     storage_uri: Mapped[str | None] = mapped_column(String(1000), nullable=True)
     width: Mapped[int] = mapped_column()
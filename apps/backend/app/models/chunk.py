@@ -6,10 +6,10 @@ from enum import Enum
 from typing import TYPE_CHECKING
 from uuid import UUID
 
-from sqlalchemy import ForeignKey, Index, String, Text, text
+from sqlalchemy import ForeignKey, Index, LargeBinary, String, Text, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.models.base import Base, TimestampMixin
+from app.models.base import Base, TimestampMixin, uuid7
 
 if TYPE_CHECKING:
     from app.models.asset import Asset
@@ -42,14 +42,17 @@ class PageTextChunk(Base, TimestampMixin):
 
     chunk_id: Mapped[UUID] = mapped_column(
         primary_key=True,
+        default=uuid7,
         server_default=text("gen_random_uuid()"),
     )
-    svs_id: Mapped[int] = mapped_column(ForeignKey("svs_page.svs_id", ondelete="CASCADE"))
+    svs_id: Mapped[int] = mapped_column(
+        ForeignKey("svs_page.svs_id", ondelete="CASCADE", deferrable=True, initially="DEFERRED")
+    )
     section: Mapped[str] = mapped_column(String(50))
     chunk_index: Mapped[int] = mapped_column()
     content: Mapped[str] = mapped_column(Text)
     token_count: Mapped[int] = mapped_column()
-    content_hash: Mapped[str] = mapped_column(String(64))  # SHA-256 hash
+    content_hash: Mapped[bytes] = mapped_column(LargeBinary(32))  # SHA-256 digest
 
     # Relationships
     page: Mapped[SvsPage] = relationship("SvsPage", back_populates="text_chunks")
@@ -60,8 +63,7 @@ class PageTextChunk(Base, TimestampMixin):
     )
 
     __table_args__ = (
-        Index("ix_page_text_chunk_svs_id", "svs_id"),
-        Index("ix_page_text_chunk_section", "section"),
+        Index("ix_page_text_chunk_svs_id_section", "svs_id", "section"),
         Index("ix_page_text_chunk_hash", "content_hash"),
     )
 
@@ -73,14 +75,17 @@ class AssetTextChunk(Base, TimestampMixin):
 
     chunk_id: Mapped[UUID] = mapped_column(
         primary_key=True,
+        default=uuid7,
         server_default=text("gen_random_uuid()"),
     )
-    asset_id: Mapped[UUID] = mapped_column(ForeignKey("asset.asset_id", ondelete="CASCADE"))
+    asset_id: Mapped[UUID] = mapped_column(
+        ForeignKey("asset.asset_id", ondelete="CASCADE", deferrable=True, initially="DEFERRED")
+    )
     section: Mapped[str] = mapped_column(String(50))
     chunk_index: Mapped[int] = mapped_column()
     content: Mapped[str] = mapped_column(Text)
     token_count: Mapped[int] = mapped_column()
-    content_hash: Mapped[str] = mapped_column(String(64))
+    content_hash: Mapped[bytes] = mapped_column(LargeBinary(32))
 
     # Relationships
     asset: Mapped[Asset] = relationship("Asset", back_populates="text_chunks")
@@ -91,7 +96,6 @@ class AssetTextChunk(Base, TimestampMixin):
     )
 
     __table_args__ = (
-        Index("ix_asset_text_chunk_asset_id", "asset_id"),
-        Index("ix_asset_text_chunk_section", "section"),
+        Index("ix_asset_text_chunk_asset_id_section", "asset_id", "section"),
         Index("ix_asset_text_chunk_hash", "content_hash"),
     )
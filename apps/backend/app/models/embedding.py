@@ -4,20 +4,27 @@ from __future__ import annotations
 
 from uuid import UUID
 
-from pgvector.sqlalchemy import Vector
-from sqlalchemy import CheckConstraint, Index, String, text
+from pgvector.sqlalchemy import HALFVEC
+from sqlalchemy import DDL, CheckConstraint, Index, String, event, text
 from sqlalchemy.orm import Mapped, mapped_column
 
-from app.models.base import Base, TimestampMixin
+from app.models.base import Base, TimestampMixin, uuid7
 
 
 class Embedding(Base, TimestampMixin):
-    """Vector embedding for a text chunk."""
+    """Vector embedding for a text chunk.
+
+    The table is LIST-partitioned on is_current: searches only ever touch
+    embedding_current, which is also the only partition with an HNSW index
+    (over the binary-quantized vectors; results are reranked on the halfvec).
+    A chunk has at most one current embedding per model.
+    """
 
     __tablename__ = "embedding"
 
     embedding_id: Mapped[UUID] = mapped_column(
         primary_key=True,
+        default=uuid7,
         server_default=text("gen_random_uuid()"),
     )
     chunk_id: Mapped[UUID] = mapped_column()
@@ -25,23 +32,31 @@ class Embedding(Base, TimestampMixin):
     model_name: Mapped[str] = mapped_column(String(100))
     model_version: Mapped[str] = mapped_column(String(50))
     dims: Mapped[int] = mapped_column()
-    embedding: Mapped[list[float]] = mapped_column(Vector(1024))  # BGE-large-en-v1.5
-    is_current: Mapped[bool] = mapped_column(default=True)
+    embedding: Mapped[list[float]] = mapped_column(HALFVEC(1024))  # BGE-large-en-v1.5, stored as FP16
+    # Partition key, so it must be part of the primary key
+    is_current: Mapped[bool] = mapped_column(primary_key=True, default=True)
 
     __table_args__ = (
         CheckConstraint("chunk_type IN ('page', 'asset')", name="valid_chunk_type"),
         Index(
-            "ix_embedding_hnsw",
-            "embedding",
-            postgresql_using="hnsw",
-            postgresql_with={"m": 16, "ef_construction": 64},
-            postgresql_ops={"embedding": "vector_cosine_ops"},
-        ),
-        Index("ix_embedding_chunk", "chunk_id", "chunk_type"),
-        Index("ix_embedding_model", "model_name", "model_version"),
-        Index(
-            "ix_embedding_current",
-            "is_current",
-            postgresql_where=text("is_current = TRUE"),
+            "ix_embedding_chunk_covering",
+            "chunk_id",
+            "chunk_type",
+            postgresql_include=["model_name", "model_version", "is_current"],
         ),
+        {"postgresql_partition_by": "LIST (is_current)"},
     )
+
+
+# Partitions and the per-partition HNSW index are not expressible as table
+# metadata; create them alongside the parent table (used by create_all). asyncpg
+# prepares every statement and a prepared statement holds a single command, so
+# each one is its own DDL.
+for statement in (
+    "CREATE TABLE embedding_current PARTITION OF embedding FOR VALUES IN (TRUE)",
+    "CREATE TABLE embedding_historical PARTITION OF embedding DEFAULT",
+    "CREATE INDEX ix_embedding_hnsw_bq ON embedding_current "
+    "USING hnsw ((binary_quantize(embedding)::bit(1024)) bit_hamming_ops) WITH (m = 16, ef_construction = 64)",
+    "CREATE UNIQUE INDEX uq_embedding_current_chunk ON embedding_current (chunk_id, chunk_type, model_name)",
+):
+    event.listen(Embedding.__table__, "after_create", DDL(statement))
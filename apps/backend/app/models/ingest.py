@@ -10,7 +10,7 @@ from sqlalchemy import ForeignKey, Index, String, Text, text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.models.base import Base, TimestampMixin
+from app.models.base import Base, TimestampMixin, uuid7
 
 
 class IngestRunStatus(str, Enum):
@@ -38,6 +38,7 @@ class IngestRun(Base, TimestampMixin):
 
     run_id: Mapped[UUID] = mapped_column(
         primary_key=True,
+        default=uuid7,
         server_default=text("gen_random_uuid()"),
     )
     mode: Mapped[str] = mapped_column(String(20))
@@ -63,7 +64,12 @@ class IngestRun(Base, TimestampMixin):
 
     __table_args__ = (
         Index("ix_ingest_run_status", "status"),
-        Index("ix_ingest_run_started_at", "started_at"),
+        Index(
+            "ix_ingest_run_started_at_brin",
+            "started_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
     )
 
 
@@ -94,9 +100,12 @@ class IngestItem(Base, TimestampMixin):
 
     item_id: Mapped[UUID] = mapped_column(
         primary_key=True,
+        default=uuid7,
         server_default=text("gen_random_uuid()"),
     )
-    run_id: Mapped[UUID] = mapped_column(ForeignKey("ingest_run.run_id", ondelete="CASCADE"))
+    run_id: Mapped[UUID] = mapped_column(
+        ForeignKey("ingest_run.run_id", ondelete="CASCADE", deferrable=True, initially="DEFERRED")
+    )
     svs_id: Mapped[int] = mapped_column()
     status: Mapped[str] = mapped_column(String(20), default=IngestItemStatus.PENDING.value)
     phase: Mapped[str | None] = mapped_column(String(30), nullable=True)
@@ -116,4 +125,10 @@ class IngestItem(Base, TimestampMixin):
         Index("ix_ingest_item_run_id", "run_id"),
         Index("ix_ingest_item_svs_id", "svs_id"),
         Index("ix_ingest_item_status", "status"),
+        Index(
+            "ix_ingest_item_created_at_brin",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
     )
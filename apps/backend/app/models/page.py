@@ -7,11 +7,11 @@ from enum import Enum
 from typing import TYPE_CHECKING
 from uuid import UUID
 
-from sqlalchemy import ForeignKey, Index, String, Text, text
+from sqlalchemy import Computed, ForeignKey, Index, String, Text, text
 from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.models.base import Base, TimestampMixin
+from app.models.base import Base, TimestampMixin, uuid7
 
 if TYPE_CHECKING:
     from app.models.asset import Asset
@@ -48,9 +48,21 @@ class SvsPage(Base, TimestampMixin):
     api_source: Mapped[bool] = mapped_column(default=False)
     html_crawled_at: Mapped[datetime | None] = mapped_column(nullable=True)
     last_checked_at: Mapped[datetime | None] = mapped_column(nullable=True)
-
-    # Full-text search vector
-    search_vector: Mapped[str | None] = mapped_column(TSVECTOR, nullable=True)
+    # HTTP validators from the last crawl, sent back on recrawl
+    etag: Mapped[str | None] = mapped_column(String(200), nullable=True)
+    last_modified: Mapped[str | None] = mapped_column(String(100), nullable=True)
+
+    # Full-text search vector, computed by PostgreSQL on write
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR,
+        Computed(
+            "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+            "setweight(to_tsvector('english', coalesce(summary, '')), 'B') || "
+            "setweight(to_tsvector('english', coalesce(description, '')), 'C')",
+            persisted=True,
+        ),
+        nullable=True,
+    )
 
     # Relationships
     assets: Mapped[list[Asset]] = relationship("Asset", back_populates="page", cascade="all, delete-orphan")
@@ -75,6 +87,12 @@ class SvsPage(Base, TimestampMixin):
 
     __table_args__ = (
         Index("ix_svs_page_search_vector", "search_vector", postgresql_using="gin"),
+        Index(
+            "ix_svs_page_content_json_gin",
+            "content_json",
+            postgresql_using="gin",
+            postgresql_ops={"content_json": "jsonb_path_ops"},
+        ),
         Index("ix_svs_page_published_date", "published_date"),
         Index("ix_svs_page_status", "status"),
     )
@@ -97,10 +115,15 @@ class SvsPageRelation(Base, TimestampMixin):
 
     id: Mapped[UUID] = mapped_column(
         primary_key=True,
+        default=uuid7,
         server_default=text("gen_random_uuid()"),
     )
-    source_svs_id: Mapped[int] = mapped_column(ForeignKey("svs_page.svs_id", ondelete="CASCADE"))
-    target_svs_id: Mapped[int] = mapped_column(ForeignKey("svs_page.svs_id", ondelete="CASCADE"))
+    source_svs_id: Mapped[int] = mapped_column(
+        ForeignKey("svs_page.svs_id", ondelete="CASCADE", deferrable=True, initially="DEFERRED")
+    )
+    target_svs_id: Mapped[int] = mapped_column(
+        ForeignKey("svs_page.svs_id", ondelete="CASCADE", deferrable=True, initially="DEFERRED")
+    )
     relation_type: Mapped[str] = mapped_column(String(50), default=RelationType.RELATED.value)
 
     # Relationships
@@ -6,10 +6,10 @@ from enum import Enum
 from typing import TYPE_CHECKING
 from uuid import UUID
 
-from sqlalchemy import ForeignKey, Index, String, UniqueConstraint, text
+from sqlalchemy import Computed, ForeignKey, Index, String, UniqueConstraint, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.models.base import Base, TimestampMixin
+from app.models.base import Base, TimestampMixin, uuid7
 
 if TYPE_CHECKING:
     from app.models.page import SvsPage
@@ -36,11 +36,13 @@ class Tag(Base, TimestampMixin):
 
     tag_id: Mapped[UUID] = mapped_column(
         primary_key=True,
+        default=uuid7,
         server_default=text("gen_random_uuid()"),
     )
     tag_type: Mapped[str] = mapped_column(String(50))
     value: Mapped[str] = mapped_column(String(200))
-    normalized_value: Mapped[str] = mapped_column(String(200))
+    # Derived by PostgreSQL; must match the normalization used for lookups
+    normalized_value: Mapped[str] = mapped_column(String(200), Computed("lower(btrim(value))", persisted=True))
     display_name: Mapped[str | None] = mapped_column(String(200), nullable=True)
     description: Mapped[str | None] = mapped_column(String(1000), nullable=True)
 
@@ -59,19 +61,16 @@ class PageTag(Base, TimestampMixin):
 
     __tablename__ = "page_tag"
 
-    id: Mapped[UUID] = mapped_column(
-        primary_key=True,
-        server_default=text("gen_random_uuid()"),
+    svs_id: Mapped[int] = mapped_column(
+        ForeignKey("svs_page.svs_id", ondelete="CASCADE", deferrable=True, initially="DEFERRED"), primary_key=True
+    )
+    tag_id: Mapped[UUID] = mapped_column(
+        ForeignKey("tag.tag_id", ondelete="CASCADE", deferrable=True, initially="DEFERRED"), primary_key=True
     )
-    svs_id: Mapped[int] = mapped_column(ForeignKey("svs_page.svs_id", ondelete="CASCADE"))
-    tag_id: Mapped[UUID] = mapped_column(ForeignKey("tag.tag_id", ondelete="CASCADE"))
 
     # Relationships
     page: Mapped[SvsPage] = relationship("SvsPage", back_populates="tags")
     tag: Mapped[Tag] = relationship("Tag", back_populates="page_tags")
 
-    __table_args__ = (
-        UniqueConstraint("svs_id", "tag_id", name="uq_page_tag"),
-        Index("ix_page_tag_svs_id", "svs_id"),
-        Index("ix_page_tag_tag_id", "tag_id"),
-    )
+    # The (svs_id, tag_id) primary key also serves lookups by svs_id
+    __table_args__ = (Index("ix_page_tag_tag_id", "tag_id"),)
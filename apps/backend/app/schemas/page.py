@@ -154,7 +154,7 @@ class PageDetailResponse(BaseModel):
 class PageListResponse(BaseModel):
     """List of SVS pages (for admin/bulk operations)."""
 
-    count: int = Field(..., description="Total pages")
+    count: int | None = Field(None, description="Total pages (first page only)")
     results: list[PageDetailResponse] = Field(..., description="Page list")
     next: str | None = None
     previous: str | None = None
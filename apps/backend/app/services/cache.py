@@ -0,0 +1,94 @@
+"""Redis-backed response caching for read-mostly endpoints."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from collections.abc import Iterable
+from typing import Any
+
+import orjson
+
+from app.redis import get_redis
+
+logger = logging.getLogger(__name__)
+
+RECENT_HIGHLIGHTS_TTL = 60
+RECENT_HIGHLIGHTS_MAX_LIMIT = 20  # upper bound of the /pages/recent limit parameter
+THUMBNAIL_LOOKUP_TTL = 300
+SEARCH_RESULTS_TTL = 60
+
+
+def recent_highlights_key(limit: int) -> str:
+    """Cache key for the homepage highlights list."""
+    return f"cache:pages:recent:{limit}"
+
+
+def thumbnail_lookup_key(svs_id: int) -> str:
+    """Cache key for a page's thumbnail location."""
+    return f"cache:thumbnail:{svs_id}"
+
+
+def search_results_key(params: dict[str, Any]) -> str:
+    """Cache key for a search, hashed from its normalized parameters."""
+    digest = hashlib.sha1(json.dumps(params, sort_keys=True, default=str).encode(), usedforsecurity=False).hexdigest()
+    return f"cache:search:{digest}"
+
+
+async def cache_get_raw(key: str) -> str | None:
+    """
+    Read a cached value as stored, without decoding it.
+
+    Returns None on a miss or if Redis is unavailable (fail open).
+    """
+    redis = await get_redis()
+    if redis is None:
+        return None
+    try:
+        return await redis.get(key)
+    except Exception as e:
+        logger.warning(f"Cache read failed for {key}: {e}")
+        return None
+
+
+async def cache_get_json(key: str) -> Any | None:
+    """
+    Read a JSON value from the cache.
+
+    Returns None on a miss or if Redis is unavailable (fail open).
+    """
+    raw = await cache_get_raw(key)
+    return orjson.loads(raw) if raw is not None else None
+
+
+async def cache_set_json(key: str, value: Any, ttl: int) -> None:
+    """Store a JSON-serializable value in the cache with a TTL in seconds."""
+    redis = await get_redis()
+    if redis is None:
+        return
+    try:
+        await redis.set(key, orjson.dumps(value, default=str), ex=ttl)
+    except Exception as e:
+        logger.warning(f"Cache write failed for {key}: {e}")
+
+
+async def invalidate_page_cache(svs_ids: Iterable[int]) -> None:
+    """
+    Drop cached entries that may contain pages after they change.
+
+    Call this after the changes are committed, so a concurrent request cannot
+    re-cache the old rows in between. The highlights keys are enumerated from
+    the bounded limit range rather than scanned for.
+    """
+    keys = [thumbnail_lookup_key(svs_id) for svs_id in svs_ids]
+    if not keys:
+        return
+    redis = await get_redis()
+    if redis is None:
+        return
+    keys.extend(recent_highlights_key(limit) for limit in range(1, RECENT_HIGHLIGHTS_MAX_LIMIT + 1))
+    try:
+        await redis.delete(*keys)
+    except Exception as e:
+        logger.warning(f"Cache invalidation failed: {e}")
@@ -33,9 +33,9 @@ def count_tokens(text: str) -> int:
     return len(ENCODING.encode(text))
 
 
-def hash_content(content: str) -> str:
-    """Generate SHA-256 hash of content."""
-    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+def hash_content(content: str) -> bytes:
+    """Generate SHA-256 digest of content."""
+    return hashlib.sha256(content.encode("utf-8"), usedforsecurity=False).digest()
 
 
 def split_into_sentences(text: str) -> list[str]:
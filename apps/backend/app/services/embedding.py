@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING
@@ -9,7 +10,7 @@ from typing import TYPE_CHECKING
 from app.config import get_settings
 
 if TYPE_CHECKING:
-    pass
+    import numpy as np
 
 logger = logging.getLogger(__name__)
 
@@ -23,8 +24,8 @@ class BaseEmbeddingService(ABC):
         pass
 
     @abstractmethod
-    async def batch_generate_embeddings(self, texts: list[str], batch_size: int = 32) -> list[list[float]]:
-        """Generate embeddings for multiple texts in batches."""
+    async def batch_generate_embeddings(self, texts: list[str], batch_size: int = 32) -> list[list[float]] | np.ndarray:
+        """Generate embeddings for multiple texts in batches, one row per text."""
         pass
 
     @property
@@ -91,22 +92,36 @@ class LocalEmbeddingService(BaseEmbeddingService):
             logger.error(f"Failed to generate embedding: {e}")
             raise
 
-    async def batch_generate_embeddings(self, texts: list[str], batch_size: int = 32) -> list[list[float]]:
-        """Generate embeddings for multiple texts in batches."""
+    def _encode_half(self, texts: list[str], batch_size: int) -> np.ndarray:
+        """Encode texts and return them as a float16 array."""
+        embeddings = self._model.encode(
+            texts,
+            batch_size=batch_size,
+            normalize_embeddings=True,
+            convert_to_tensor=True,
+            show_progress_bar=len(texts) > 100,
+        )
+        # Cast on the device: embeddings are stored as halfvec, so FP16 loses
+        # nothing that is kept and halves the device-to-host copy
+        return embeddings.half().cpu().numpy()
+
+    async def batch_generate_embeddings(self, texts: list[str], batch_size: int = 32) -> np.ndarray:
+        """
+        Generate embeddings for multiple texts in batches.
+
+        Returns a float16 array rather than nested lists: converting would box
+        every component into a Python float, while the halfvec column type
+        takes array rows as they are.
+        """
         self._load_model()
 
         # Replace empty texts with a space
         texts = [t if t.strip() else " " for t in texts]
 
         try:
-            # sentence-transformers handles batching internally
-            embeddings = self._model.encode(
-                texts,
-                batch_size=batch_size,
-                normalize_embeddings=True,
-                show_progress_bar=len(texts) > 100,
-            )
-            return embeddings.tolist()
+            # sentence-transformers handles batching internally. Encoding a batch
+            # is long enough to stall the event loop, so it runs in a thread.
+            return await asyncio.to_thread(self._encode_half, texts, batch_size)
         except Exception as e:
             logger.error(f"Failed to generate batch embeddings: {e}")
             raise
@@ -322,19 +322,53 @@ class PageService:
         self,
         limit: int = 20,
         offset: int = 0,
-    ) -> tuple[Sequence[SvsPage], int]:
-        """List pages with pagination."""
-        # Count query
-        count_query = select(func.count()).select_from(SvsPage)
-        count_result = await self.session.execute(count_query)
-        total_count = count_result.scalar() or 0
+        after_svs_id: int | None = None,
+        before_svs_id: int | None = None,
+    ) -> tuple[Sequence[SvsPage], int | None, bool]:
+        """
+        List pages ordered by svs_id descending.
+
+        after_svs_id / before_svs_id select the page following / preceding a
+        keyset position, so each request costs O(limit) however deep it is.
+        offset is still honoured when no cursor is given.
+
+        Tags are eager-loaded so callers can format them without N+1 queries.
+
+        Returns:
+            Tuple of (pages, total count, whether more pages exist in the
+            requested direction). The total is only computed for the first
+            page, as a COUNT(*) OVER () window in the same query.
+        """
+        first_page = after_svs_id is None and before_svs_id is None and offset == 0
+
+        if first_page:
+            query = select(SvsPage, func.count().over().label("total"))
+        else:
+            query = select(SvsPage)
+        query = query.options(selectinload(SvsPage.tags).selectinload(PageTag.tag))
 
-        # Data query
-        query = select(SvsPage).order_by(SvsPage.svs_id.desc()).offset(offset).limit(limit)
-        result = await self.session.execute(query)
-        pages = result.scalars().all()
+        if before_svs_id is not None:
+            # Walk backwards from the cursor, then restore descending order
+            query = query.where(SvsPage.svs_id > before_svs_id).order_by(SvsPage.svs_id.asc())
+        else:
+            if after_svs_id is not None:
+                query = query.where(SvsPage.svs_id < after_svs_id)
+            query = query.order_by(SvsPage.svs_id.desc()).offset(offset)
+
+        result = await self.session.execute(query.limit(limit + 1))
+        rows = result.all()
+
+        total_count = None
+        if first_page:
+            total_count = rows[0].total if rows else 0
+
+        pages = [row[0] for row in rows]
+        has_more = len(pages) > limit
+        pages = pages[:limit]
+        if before_svs_id is not None:
+            pages.reverse()
 
-        return pages, total_count
+        return pages, total_count, has_more
 
     async def get_recent_highlights(self, limit: int = 6) -> list[SearchResult]:
         """Get recent pages with thumbnails for homepage highlights."""
@@ -100,13 +100,13 @@ class RAGService:
                     sp.title,
                     ptc.section,
                     ptc.content,
-                    1 - (e.embedding <=> :embedding::vector) as score
+                    1 - (e.embedding <=> :embedding::halfvec) as score
                 FROM page_text_chunk ptc
                 JOIN embedding e ON e.chunk_id = ptc.chunk_id AND e.chunk_type = 'page'
                 JOIN svs_page sp ON sp.svs_id = ptc.svs_id
                 WHERE ptc.svs_id = :svs_id
                     AND e.is_current = true
-                ORDER BY e.embedding <=> :embedding::vector
+                ORDER BY e.embedding <=> :embedding::halfvec
                 LIMIT :limit
             """)
             result = await self.session.execute(
@@ -143,6 +143,18 @@ class RAGService:
                 )
             return chunks
 
+    async def retrieve_context_with_fallback(
+        self, query: str, limit: int = 5, context_svs_id: int | None = None
+    ) -> list[ChunkWithScore]:
+        """Retrieve context, falling back to full-text search if vector retrieval fails."""
+        try:
+            return await self.retrieve_context(query, limit=limit, context_svs_id=context_svs_id)
+        except Exception as e:
+            logger.warning(f"Embedding retrieval failed, using fallback: {e}")
+            # Rollback the failed transaction before fallback
+            await self.session.rollback()
+            return await self.retrieve_context_fallback(query, limit=limit, context_svs_id=context_svs_id)
+
     async def retrieve_context_fallback(
         self, query: str, limit: int = 5, context_svs_id: int | None = None
     ) -> list[ChunkWithScore]:
@@ -275,13 +287,7 @@ class RAGService:
         """Non-streaming chat for simpler use cases."""
         # Retrieve context
         if use_embeddings:
-            try:
-                context = await self.retrieve_context(query, limit=5, context_svs_id=context_svs_id)
-            except Exception as e:
-                logger.warning(f"Embedding retrieval failed, using fallback: {e}")
-                # Rollback the failed transaction before fallback
-                await self.session.rollback()
-                context = await self.retrieve_context_fallback(query, limit=5, context_svs_id=context_svs_id)
+            context = await self.retrieve_context_with_fallback(query, limit=5, context_svs_id=context_svs_id)
         else:
             context = await self.retrieve_context_fallback(query, limit=5, context_svs_id=context_svs_id)
 
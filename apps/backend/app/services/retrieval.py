@@ -7,7 +7,8 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING
 from uuid import UUID
 
-from sqlalchemy import and_, func, select, text
+from pgvector.sqlalchemy import BIT
+from sqlalchemy import func, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.chunk import PageTextChunk
@@ -20,6 +21,15 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Dimensions of the stored embeddings (Embedding.embedding is halfvec(1024))
+EMBEDDING_DIMS = 1024
+
+# Candidates taken from the binary-quantized index per result, before reranking
+VECTOR_RERANK_FACTOR = 4
+
+# pgvector's default hnsw.ef_search
+HNSW_DEFAULT_EF_SEARCH = 40
+
 
 @dataclass
 class RetrievedChunk:
@@ -132,15 +142,40 @@ class RetrievalService:
         """
         Search chunks using vector similarity.
 
-        Uses cosine distance for similarity ranking.
+        Candidates come from the binary-quantized HNSW index and are ranked
+        by exact cosine distance.
         Returns dict mapping chunk_id to (score, chunk, page).
         """
-        # Cast embedding to vector type for pgvector
-        query_vector = text(f"'{query_embedding}'::vector")
+        query_vector = text(f"'{query_embedding}'::halfvec")
+
+        # Stage 1: nearest candidates by Hamming distance on the binary-quantized
+        # vectors (served by ix_embedding_hnsw_bq; the expression must match it)
+        candidate_limit = top_k * VECTOR_RERANK_FACTOR
+        if candidate_limit > HNSW_DEFAULT_EF_SEARCH:
+            # An HNSW scan returns at most ef_search rows
+            await self.session.execute(text(f"SET LOCAL hnsw.ef_search = {candidate_limit}"))
+
+        hamming_distance = (
+            func.binary_quantize(Embedding.embedding)
+            .cast(BIT(EMBEDDING_DIMS))
+            .op("<~>")(func.binary_quantize(query_vector).cast(BIT(EMBEDDING_DIMS)))
+        )
+        candidates = (
+            select(Embedding.chunk_id, Embedding.embedding)
+            .where(
+                Embedding.chunk_type == "page",
+                Embedding.is_current.is_(True),
+                Embedding.model_name == self.embedding_service.model_name,
+            )
+            .order_by(hamming_distance)
+            .limit(candidate_limit)
+            .subquery()
+        )
 
+        # Stage 2: rerank the candidates by exact cosine distance on the halfvec.
         # Cosine distance (1 - similarity), lower is better
         # Convert to similarity score (1 - distance) so higher is better
-        distance = Embedding.embedding.cosine_distance(query_vector)
+        distance = candidates.c.embedding.cosine_distance(query_vector)
         similarity = (1 - distance).label("similarity")
 
         stmt = (
@@ -149,15 +184,7 @@ class RetrievalService:
                 SvsPage,
                 similarity,
             )
-            .join(
-                Embedding,
-                and_(
-                    Embedding.chunk_id == PageTextChunk.chunk_id,
-                    Embedding.chunk_type == "page",
-                    Embedding.is_current.is_(True),
-                    Embedding.model_name == self.embedding_service.model_name,
-                ),
-            )
+            .join(candidates, candidates.c.chunk_id == PageTextChunk.chunk_id)
             .join(SvsPage, SvsPage.svs_id == PageTextChunk.svs_id)
             .order_by(distance)
             .limit(top_k)
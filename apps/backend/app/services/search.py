@@ -6,7 +6,7 @@ import logging
 import re
 from datetime import date
 
-from sqlalchemy import and_, case, func, or_, select, text
+from sqlalchemy import and_, case, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -45,9 +45,12 @@ class SearchService:
 
         Uses PostgreSQL tsvector for efficient text search with ranking.
         """
-        # Check if query is a numeric SVS ID
-        if query.strip().isdigit():
-            return await self._search_by_id(int(query.strip()), limit, offset)
+        # Numeric SVS IDs take a primary-key lookup. isdecimal() rather than
+        # isdigit(), which also accepts characters like "²" that int() rejects;
+        # the length bound keeps the value within the integer column.
+        stripped = query.strip()
+        if stripped.isdecimal() and len(stripped) <= 8:
+            return await self.search_by_id(int(stripped), limit, offset)
 
         # Build the search query
         search_term = self._prepare_search_term(query)
@@ -221,8 +224,8 @@ class SearchService:
             previous=prev_url,
         )
 
-    async def _search_by_id(self, svs_id: int, limit: int, offset: int) -> SearchResponse:
-        """Search for a specific SVS ID."""
+    async def search_by_id(self, svs_id: int, limit: int = 20, offset: int = 0) -> SearchResponse:
+        """Search for a specific SVS ID (primary-key lookup)."""
         query = (
             select(SvsPage)
             .where(SvsPage.svs_id == svs_id, SvsPage.status == "active")
@@ -680,27 +683,3 @@ class SearchService:
             prev_url = f"{base}&offset={max(0, offset - limit)}"
 
         return next_url, prev_url
-
-
-async def update_search_vectors(session: AsyncSession, svs_ids: list[int] | None = None) -> int:
-    """
-    Update search vectors for pages.
-
-    This should be run after ingestion to populate the tsvector column.
-    """
-    # Build the tsvector from title and description
-    update_sql = """
-        UPDATE svs_page
-        SET search_vector =
-            setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
-            setweight(to_tsvector('english', coalesce(summary, '')), 'B') ||
-            setweight(to_tsvector('english', coalesce(description, '')), 'C')
-    """
-
-    if svs_ids:
-        update_sql += f" WHERE svs_id IN ({','.join(str(id) for id in svs_ids)})"
-
-    result = await session.execute(text(update_sql))
-    await session.commit()
-
-    return result.rowcount
@@ -2,7 +2,10 @@
 
 import io
 import logging
-from typing import TYPE_CHECKING
+from collections.abc import Iterator, Mapping
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlparse
 
 import httpx
 from minio import Minio
@@ -14,6 +17,30 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+class ObjectStream:
+    """Chunked iterator over a MinIO object that releases its connection when done."""
+
+    def __init__(self, response: Any, chunk_size: int):
+        self._response = response
+        self._chunk_size = chunk_size
+
+    @property
+    def headers(self) -> Mapping[str, str]:
+        """Case-insensitive response headers (Content-Type, Content-Length, ETag)."""
+        return self._response.headers
+
+    def __iter__(self) -> Iterator[bytes]:
+        try:
+            yield from self._response.stream(self._chunk_size)
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Release the underlying connection back to the pool."""
+        self._response.close()
+        self._response.release_conn()
+
+
 class MinioStorageService:
     """Service for MinIO object storage operations."""
 
@@ -28,9 +55,24 @@ class MinioStorageService:
             access_key=settings.minio_access_key,
             secret_key=settings.minio_secret_key,
             secure=settings.minio_secure,
+            region=settings.minio_region,
         )
         self.bucket = settings.minio_bucket
 
+        # Presigned URLs are signed for the host the browser will request,
+        # which is usually not the internal endpoint the API talks to.
+        # Signing is offline, so this client never opens a connection.
+        self.public_client: Minio | None = None
+        if settings.minio_public_url:
+            public_url = urlparse(settings.minio_public_url)
+            self.public_client = Minio(
+                endpoint=public_url.netloc,
+                access_key=settings.minio_access_key,
+                secret_key=settings.minio_secret_key,
+                secure=public_url.scheme == "https",
+                region=settings.minio_region,
+            )
+
     def ensure_bucket_exists(self) -> None:
         """Create bucket if it doesn't exist."""
         try:
@@ -48,6 +90,7 @@ class MinioStorageService:
         data: bytes,
         object_name: str,
         content_type: str = "application/octet-stream",
+        cache_control: str | None = None,
     ) -> str:
         """Upload bytes directly to MinIO.
 
@@ -55,6 +98,8 @@ class MinioStorageService:
             data: Bytes to upload.
             object_name: Object path in bucket (e.g., "thumbnails/pages/123/thumbnail.jpg").
             content_type: MIME type of the content.
+            cache_control: Cache-Control header stored with the object and
+                returned on direct GETs (browsers, CDNs).
 
         Returns:
             The object_name (storage URI) on success.
@@ -70,6 +115,7 @@ class MinioStorageService:
                 data=data_stream,
                 length=len(data),
                 content_type=content_type,
+                metadata={"Cache-Control": cache_control} if cache_control else None,
             )
             logger.debug(f"Uploaded object: {object_name} ({len(data)} bytes)")
             return object_name
@@ -102,6 +148,41 @@ class MinioStorageService:
             logger.error(f"Failed to get object {object_name}: {e}")
             raise
 
+    def open_object_stream(self, object_name: str, chunk_size: int = 64 * 1024) -> "ObjectStream":
+        """Open an object for streaming without reading it into memory.
+
+        Args:
+            object_name: Object path in bucket.
+            chunk_size: Bytes per chunk yielded when iterating.
+
+        Returns:
+            ObjectStream over the object's bytes. Callers must consume or
+            close it to release the connection.
+
+        Raises:
+            S3Error: If object doesn't exist or retrieval fails.
+        """
+        try:
+            response = self.client.get_object(self.bucket, object_name)
+        except S3Error as e:
+            logger.error(f"Failed to get object {object_name}: {e}")
+            raise
+        return ObjectStream(response, chunk_size)
+
+    def presign_get(self, object_name: str, expires: int = 3600) -> str | None:
+        """Create a presigned GET URL on the public endpoint.
+
+        Args:
+            object_name: Object path in bucket.
+            expires: URL lifetime in seconds.
+
+        Returns:
+            The presigned URL, or None if no public endpoint is configured.
+        """
+        if self.public_client is None:
+            return None
+        return self.public_client.presigned_get_object(self.bucket, object_name, expires=timedelta(seconds=expires))
+
     def object_exists(self, object_name: str) -> bool:
         """Check if object exists in bucket.
 
@@ -1,5 +1,6 @@
 """Thumbnail caching service for downloading and storing thumbnails in MinIO."""
 
+import asyncio
 import logging
 from pathlib import Path
 from urllib.parse import urlparse
@@ -7,7 +8,7 @@ from urllib.parse import urlparse
 import httpx
 from minio.error import S3Error
 
-from app.services.storage import MinioStorageService
+from app.services.storage import MinioStorageService, ObjectStream
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +27,10 @@ DOWNLOAD_TIMEOUT = 30.0
 # Maximum thumbnail file size (10 MB)
 MAX_THUMBNAIL_SIZE = 10 * 1024 * 1024
 
+# Cache-Control stored on thumbnail objects for browsers/CDNs fetching them directly.
+# Not "immutable": a page's thumbnail keeps its path when re-cached.
+THUMBNAIL_CACHE_CONTROL = "public, max-age=604800"
+
 
 class ThumbnailService:
     """Service for downloading and caching thumbnails in MinIO."""
@@ -127,7 +132,7 @@ class ThumbnailService:
             client = await self._get_client()
 
             # Download thumbnail
-            logger.debug(f"Downloading thumbnail for page {svs_id}: {thumbnail_url}")
+            logger.debug("Downloading thumbnail for page %s: %s", svs_id, thumbnail_url)
             response = await client.get(thumbnail_url)
             response.raise_for_status()
 
@@ -145,9 +150,12 @@ class ThumbnailService:
             ext = self._get_extension_from_url(thumbnail_url)
             content_type = self._get_content_type(ext, response.headers.get("content-type"))
 
-            # Build storage path and upload
+            # Build storage path and upload (the MinIO client is blocking, so
+            # run it in a thread to let concurrent downloads proceed)
             storage_path = self._build_storage_path(svs_id, ext)
-            self.storage.upload_bytes(data, storage_path, content_type)
+            await asyncio.to_thread(
+                self.storage.upload_bytes, data, storage_path, content_type, cache_control=THUMBNAIL_CACHE_CONTROL
+            )
 
             logger.info(f"Cached thumbnail for page {svs_id}: {storage_path} ({len(data)} bytes)")
             return storage_path
@@ -186,6 +194,50 @@ class ThumbnailService:
             logger.error(f"Unexpected error retrieving thumbnail {storage_uri}: {e}")
             return None
 
+    def get_thumbnail_stream(self, storage_uri: str) -> tuple[ObjectStream, str, int | None, str | None] | None:
+        """Open a cached thumbnail for streaming.
+
+        Args:
+            storage_uri: Storage path of the thumbnail.
+
+        Returns:
+            Tuple of (object stream, content_type, size in bytes, ETag) or
+            None if not found. The stream must be consumed or closed to
+            release the storage connection.
+        """
+        try:
+            stream = self.storage.open_object_stream(storage_uri)
+        except S3Error as e:
+            if e.code == "NoSuchKey":
+                logger.debug(f"Thumbnail not found in storage: {storage_uri}")
+                return None
+            logger.error(f"Error retrieving thumbnail {storage_uri}: {e}")
+            return None
+        except Exception as e:
+            logger.error(f"Unexpected error retrieving thumbnail {storage_uri}: {e}")
+            return None
+
+        headers = stream.headers
+        content_length = headers.get("Content-Length")
+        return (
+            stream,
+            headers.get("Content-Type", "application/octet-stream"),
+            int(content_length) if content_length else None,
+            headers.get("ETag"),
+        )
+
+    def get_thumbnail_url(self, storage_uri: str, expires: int = 3600) -> str | None:
+        """Get a presigned URL the client can fetch the thumbnail from directly.
+
+        Args:
+            storage_uri: Storage path of the thumbnail.
+            expires: URL lifetime in seconds.
+
+        Returns:
+            Presigned URL, or None if no public storage endpoint is configured.
+        """
+        return self.storage.presign_get(storage_uri, expires=expires)
+
     def thumbnail_exists(self, storage_uri: str) -> bool:
         """Check if thumbnail exists in storage.
 
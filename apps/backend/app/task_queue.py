@@ -0,0 +1,36 @@
+"""Task queue connection for enqueueing worker jobs."""
+
+from __future__ import annotations
+
+import logging
+
+from arq import ArqRedis, create_pool
+from arq.connections import RedisSettings
+
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+settings = get_settings()
+
+_arq_pool: ArqRedis | None = None
+
+
+async def get_task_queue() -> ArqRedis:
+    """Get the ARQ connection pool, creating it on first use."""
+    global _arq_pool
+    if _arq_pool is None:
+        _arq_pool = await create_pool(RedisSettings.from_dsn(settings.redis_url))
+    return _arq_pool
+
+
+async def close_task_queue() -> None:
+    """Close the ARQ connection pool."""
+    global _arq_pool
+    try:
+        if _arq_pool is not None:
+            await _arq_pool.aclose()
+            _arq_pool = None
+            logger.info("Task queue connection closed")
+    except Exception as e:
+        logger.error(f"Error closing task queue connection: {e}")
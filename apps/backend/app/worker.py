@@ -0,0 +1,138 @@
+"""ARQ worker for long-running ingestion jobs.
+
+Run with: arq app.worker.WorkerSettings
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any
+from uuid import UUID
+
+from arq.connections import RedisSettings
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.config import get_settings
+from app.ingestion.api_client import SvsApiClient
+from app.ingestion.pipeline import IngestionPipeline
+
+logger = logging.getLogger(__name__)
+
+settings = get_settings()
+
+# Content update status is kept for a day after the last write
+CONTENT_UPDATE_STATUS_TTL = 86400
+
+
+def content_update_status_key(task_id: str) -> str:
+    """Redis hash holding the status of a content update task."""
+    return f"content_update:{task_id}"
+
+
+async def set_content_update_status(redis: Any, task_id: str, **fields: Any) -> None:
+    """Write content update status fields to Redis, refreshing the key's TTL."""
+    key = content_update_status_key(task_id)
+    pipe = redis.pipeline()
+    pipe.hset(key, mapping={k: str(v) for k, v in fields.items()})
+    pipe.expire(key, CONTENT_UPDATE_STATUS_TTL)
+    await pipe.execute()
+
+
+async def startup(ctx: dict[str, Any]) -> None:
+    """Create the database engine and SVS API client shared by this worker's jobs."""
+    engine = create_async_engine(
+        settings.database_url,
+        pool_pre_ping=True,
+        pool_size=settings.worker_max_jobs,
+        max_overflow=0,
+        connect_args={"server_settings": {"application_name": "svs-worker"}},
+    )
+    ctx["engine"] = engine
+    ctx["session_maker"] = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    ctx["api_client"] = await SvsApiClient().open()
+    logger.info("Worker startup complete")
+
+
+async def shutdown(ctx: dict[str, Any]) -> None:
+    """Dispose of the worker's database engine and API client."""
+    await ctx["api_client"].close()
+    await ctx["engine"].dispose()
+
+
+async def run_ingestion(
+    ctx: dict[str, Any],
+    run_id: str,
+    mode: str,
+    svs_ids: list[int] | None,
+    skip_existing: bool,
+    max_pages: int | None,
+) -> None:
+    """Run an ingestion job."""
+    run_uuid = UUID(run_id)
+    async with ctx["session_maker"]() as session:
+        pipeline = IngestionPipeline(session, api_client=ctx["api_client"])
+        try:
+            if mode == "discovery":
+                await pipeline.run_discovery(run_uuid)
+            else:
+                await pipeline.run_html_crawl(
+                    run_uuid,
+                    svs_ids=svs_ids,
+                    skip_existing=skip_existing,
+                    max_pages=max_pages,
+                )
+        except Exception as e:
+            logger.error(f"Ingestion run {run_id} failed: {e}")
+            await session.rollback()
+            await pipeline.update_run_status(
+                run_uuid,
+                "failed",
+                error_summary=str(e),
+            )
+
+
+async def run_content_update(
+    ctx: dict[str, Any],
+    task_id: str,
+    batch_size: int,
+    priority_first: bool,
+) -> None:
+    """Run a content update job, recording progress in Redis."""
+    redis = ctx["redis"]
+    await set_content_update_status(redis, task_id, status="running", message="Content update in progress...")
+
+    async with ctx["session_maker"]() as session:
+        pipeline = IngestionPipeline(session, api_client=ctx["api_client"])
+        try:
+            processed, success, errors = await pipeline.run_content_update(
+                batch_size=batch_size,
+                priority_first=priority_first,
+            )
+            await set_content_update_status(
+                redis,
+                task_id,
+                status="completed",
+                message=f"Content update complete: {processed} processed, {success} success, {errors} errors",
+                processed=processed,
+                success=success,
+                errors=errors,
+            )
+        except Exception as e:
+            logger.error(f"Content update {task_id} failed: {e}")
+            await set_content_update_status(
+                redis,
+                task_id,
+                status="failed",
+                message=f"Content update failed: {e!s}",
+            )
+
+
+class WorkerSettings:
+    """ARQ worker configuration."""
+
+    functions = [run_ingestion, run_content_update]
+    on_startup = startup
+    on_shutdown = shutdown
+    redis_settings = RedisSettings.from_dsn(settings.redis_url)
+    max_jobs = settings.worker_max_jobs
+    job_timeout = settings.worker_job_timeout
@@ -0,0 +1,65 @@
+"""Tests for the SVS API client rate limiter."""
+
+import pytest
+
+from app.ingestion import api_client
+from app.ingestion.api_client import RateLimiter
+
+
+class FakeClock:
+    """Monotonic clock that only advances when told to or when slept on."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps: list[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    async def sleep(self, delay: float) -> None:
+        self.sleeps.append(delay)
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    """Replace the rate limiter's clock and sleep with a fake clock."""
+    fake = FakeClock()
+    monkeypatch.setattr(api_client.time, "monotonic", fake.monotonic)
+    monkeypatch.setattr(api_client.asyncio, "sleep", fake.sleep)
+    return fake
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_allows_burst(clock: FakeClock):
+    """Test that up to `burst` requests go out without waiting."""
+    limiter = RateLimiter(requests_per_second=2.0, burst=3.0)
+    for _ in range(3):
+        await limiter.wait()
+    assert clock.sleeps == []
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_waits_past_burst(clock: FakeClock):
+    """Test that requests past the burst are spaced at the refill rate."""
+    limiter = RateLimiter(requests_per_second=2.0, burst=2.0)
+    for _ in range(4):
+        await limiter.wait()
+    # Each caller in debt sleeps off its own share of the deficit
+    assert clock.sleeps == pytest.approx([0.5, 1.0])
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_refills_after_idle(clock: FakeClock):
+    """Test that tokens refill over time up to the burst capacity."""
+    limiter = RateLimiter(requests_per_second=2.0, burst=2.0)
+    await limiter.wait()
+    await limiter.wait()
+
+    clock.now += 0.5  # one token back
+    await limiter.wait()
+    assert clock.sleeps == []
+
+    clock.now += 60.0  # capped at burst, not 120 tokens
+    for _ in range(3):
+        await limiter.wait()
+    assert clock.sleeps == pytest.approx([0.5])
@@ -0,0 +1,92 @@
+"""Tests for text chunking."""
+
+import hashlib
+
+import pytest
+
+from app.ingestion.chunker import TextChunker
+
+TEXT = (
+    "The Sun emits a steady stream of charged particles. "
+    "This solar wind shapes the magnetosphere of Earth. "
+    "Auroras appear when particles reach the upper atmosphere. "
+    "Satellites watch these storms from orbit. Ok."
+)
+
+
+@pytest.fixture
+def chunker() -> TextChunker:
+    return TextChunker(target_tokens=20, max_tokens=30, overlap_tokens=4, min_tokens=5)
+
+
+def test_short_text_single_chunk(chunker: TextChunker):
+    """Test that text under the max size becomes one chunk."""
+    chunks = chunker.chunk_text("  The rover landed in Jezero Crater last February.  ", "description")
+
+    assert len(chunks) == 1
+    chunk = chunks[0]
+    assert chunk.content == "The rover landed in Jezero Crater last February."
+    assert chunk.section == "description"
+    assert chunk.chunk_index == 0
+    assert chunk.token_count == 12
+    assert chunk.content_hash == hashlib.sha256(chunk.content.encode()).digest()
+
+
+def test_tiny_text_dropped(chunker: TextChunker):
+    """Test that text under the minimum size produces no chunks."""
+    assert chunker.chunk_text("Too short.", "description") == []
+    assert chunker.chunk_text("   ", "description") == []
+
+
+def test_chunks_overlap_on_sentence_boundaries(chunker: TextChunker):
+    """Test that long text splits between sentences with overlap from the previous chunk."""
+    chunks = chunker.chunk_text(TEXT, "description")
+
+    assert [(c.content, c.chunk_index, c.token_count) for c in chunks] == [
+        ("The Sun emits a steady stream of charged particles.", 0, 12),
+        ("particles. This solar wind shapes the magnetosphere of Earth.", 1, 15),
+        ("of Earth. Auroras appear when particles reach the upper atmosphere.", 2, 16),
+        ("atmosphere. Satellites watch these storms from orbit. Ok.", 3, 14),
+    ]
+
+
+def test_chunk_sections_keeps_sections_apart(chunker: TextChunker):
+    """Test that chunks never span sections."""
+    chunks = chunker.chunk_sections(
+        {
+            "description": "The rover landed in Jezero Crater last February.",
+            "credits": "Visualizer: Ernie Wright, NASA Goddard Space Flight Center",
+            "download_notes": None,
+        }
+    )
+
+    assert [(c.section, c.chunk_index) for c in chunks] == [("description", 0), ("credits", 0)]
+
+
+@pytest.mark.parametrize(
+    ("sentence", "expected"),
+    [
+        (
+            "alpha beta gamma, delta epsilon zeta, eta theta iota kappa, lambda mu nu xi omicron, pi rho",
+            ["alpha beta gamma, delta epsilon zeta", "eta theta iota kappa, lambda mu nu xi omicron", "pi rho"],
+        ),
+        (
+            ", , leading separators, then words that run on for a while, and more words after that, end",
+            ["leading separators", "then words that run on for a while", "and more words after that, end"],
+        ),
+        (
+            "first clause is here, , , second clause after empties; third clause with a colon: fourth one, done",
+            ["first clause is here", "second clause after empties", "third clause with a colon, fourth one, done"],
+        ),
+        (
+            "aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa, b, c",
+            ["aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa", "b, c"],
+        ),
+    ],
+)
+def test_split_long_sentence(sentence: str, expected: list[str]):
+    """Test clause splitting of overlong sentences, including stripping of empty clauses."""
+    chunks = TextChunker(max_tokens=10)._split_long_sentence(sentence, "description", 3)
+
+    assert [c.content for c in chunks] == expected
+    assert [c.chunk_index for c in chunks] == list(range(3, 3 + len(expected)))
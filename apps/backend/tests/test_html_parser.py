@@ -0,0 +1,187 @@
+"""Tests for the SVS HTML page parser."""
+
+from datetime import date
+
+import pytest
+from bs4 import BeautifulSoup
+
+from app.ingestion.html_parser import EXTRACTED_ELEMENTS, SvsHtmlParser
+
+PAGE_HTML = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>NASA SVS | Perseverance Landing Site - NASA Scientific Visualization Studio</title>
+<meta property="og:image" content="/vis/a010000/a014800/a014801/thumb.jpg">
+<meta property="article:published_time" content="2021-02-18T10:00:00-05:00">
+<meta property="article:tag" content="Mars">
+<meta property="article:tag" content="Mars 2020">
+<meta property="article:tag" content="Planetary Science">
+<script type="application/ld+json">{"description": "Fallback description"}</script>
+</head>
+<body>
+<script>var banner = "<p>not content</p>";</script>
+<nav class="navbar"><a href="/">Home</a></nav>
+<h1 id="title">Perseverance Landing Site</h1>
+<ul class="hstack gap-2 list-unstyled">
+<li class="fw-bold">Visualizer:</li>
+<li><a href="/search?people=Ernie%20Wright">Ernie Wright</a></li>
+</ul>
+<section id="media_group_1" class="card">
+<div class="card-body">
+<video poster="/vis/a010000/a014800/a014801/poster.jpg">
+<source src="/vis/a010000/a014800/a014801/landing_1080p.mp4" type="video/mp4">
+</video>
+<p>The rover landed in Jezero Crater, an ancient lake bed on <a href="/14700/">Mars</a>. It will collect samples for return to Earth.</p>
+</div>
+</section>
+</body>
+</html>
+"""
+
+DESCRIPTION = (
+    "The rover landed in Jezero Crater, an ancient lake bed on Mars. It will collect samples for return to Earth."
+)
+
+
+@pytest.fixture
+def parser() -> SvsHtmlParser:
+    return SvsHtmlParser()
+
+
+def test_parse_page_fields(parser: SvsHtmlParser):
+    """Test the fields extracted from a representative SVS page."""
+    page = parser.parse(PAGE_HTML, 14801)
+
+    assert page.svs_id == 14801
+    assert page.title == "Perseverance Landing Site"
+    assert page.canonical_url == "https://svs.gsfc.nasa.gov/14801"
+    assert page.description == DESCRIPTION
+    assert page.summary == "The rover landed in Jezero Crater, an ancient lake bed on Mars."
+    assert page.published_date == date(2021, 2, 18)
+    assert page.thumbnail_url == "https://svs.gsfc.nasa.gov/vis/a010000/a014800/a014801/thumb.jpg"
+    assert [(c.role, c.name, c.organization) for c in page.credits] == [("Visualizer", "Ernie Wright", None)]
+    assert page.keywords == ["Mars", "Mars 2020", "Planetary Science"]
+    assert page.missions == []
+    assert page.targets == ["Mars", "Mars 2020"]
+    assert page.domains == ["Planetary Science"]
+    assert page.related_pages == []
+    assert page.download_notes is None
+
+
+def test_parse_page_assets(parser: SvsHtmlParser):
+    """Test the media asset extracted from a media group."""
+    page = parser.parse(PAGE_HTML, 14801)
+
+    assert len(page.assets) == 1
+    asset = page.assets[0]
+    assert asset.media_type == "video"
+    assert asset.description == DESCRIPTION
+    assert asset.thumbnail_url == "https://svs.gsfc.nasa.gov/vis/a010000/a014800/a014801/poster.jpg"
+    assert [(f.variant, f.url, f.mime_type, f.filename) for f in asset.files] == [
+        (
+            "1080p",
+            "https://svs.gsfc.nasa.gov/vis/a010000/a014800/a014801/landing_1080p.mp4",
+            "video/mp4",
+            "landing_1080p.mp4",
+        )
+    ]
+
+
+def test_parse_page_rich_content(parser: SvsHtmlParser):
+    """Test that rich content keeps formatting and rewrites internal links."""
+    page = parser.parse(PAGE_HTML, 14801)
+
+    assert page.content_json == {
+        "format_version": 1,
+        "sections": [
+            {
+                "type": "description",
+                "paragraphs": [
+                    {
+                        "html": (
+                            '<p>The rover landed in Jezero Crater, an ancient lake bed on <a data-internal="true" '
+                            'href="/svs/14700">Mars</a>. It will collect samples for return to Earth.</p>'
+                        ),
+                        "text": DESCRIPTION,
+                    }
+                ],
+            }
+        ],
+    }
+
+
+def test_parse_bytes_matches_text(parser: SvsHtmlParser):
+    """Test that undecoded bytes parse the same as decoded text."""
+    assert parser.parse(PAGE_HTML.encode(), 14801, encoding="utf-8") == parser.parse(PAGE_HTML, 14801)
+
+
+@pytest.mark.parametrize(
+    ("name", "attrs", "expected"),
+    [
+        ("section", {"id": "media_group_1"}, True),
+        ("meta", {"property": "og:image"}, True),
+        ("ul", {}, True),
+        ("div", {"class": "page header"}, True),
+        ("div", {"class": "download-notes"}, True),
+        ("div", {"class": "headers"}, False),
+        ("div", None, False),
+        ("nav", {"class": "row"}, True),
+        ("nav", {"class": "navbar"}, False),
+        ("script", {"type": "application/ld+json"}, True),
+        ("script", {}, False),
+        ("p", {}, False),
+    ],
+)
+def test_extracted_elements_filter(name: str, attrs: dict | None, expected: bool):
+    """Test which top-level elements the parse filter keeps."""
+    assert EXTRACTED_ELEMENTS.allow_tag_creation(None, name, attrs) is expected
+
+
+def test_extracted_elements_drop_inline_scripts():
+    """Test that the parse filter drops inline scripts and bare strings."""
+    soup = BeautifulSoup(PAGE_HTML, "lxml", parse_only=EXTRACTED_ELEMENTS)
+
+    assert [tag.get("type") for tag in soup.find_all("script")] == ["application/ld+json"]
+    assert soup.find("nav") is None
+    assert "not content" not in str(soup)
+
+
+@pytest.mark.parametrize(
+    ("date_str", "expected"),
+    [
+        ("2024-01-05", date(2024, 1, 5)),
+        ("2024-01-05T10:00:00Z", date(2024, 1, 5)),
+        ("2024-01-05T10:00:00-04:00", date(2024, 1, 5)),
+        (" 2024-01-05T10:00:00Z", date(2024, 1, 5)),
+        ("2024-01-05 ", date(2024, 1, 5)),
+        ("March 5, 2021", date(2021, 3, 5)),
+        ("Mar 5, 2021", date(2021, 3, 5)),
+        ("03/05/2021", date(2021, 3, 5)),
+        ("2024-13-45", None),
+        ("not a date", None),
+        ("", None),
+    ],
+)
+def test_parse_date(parser: SvsHtmlParser, date_str: str, expected: date | None):
+    """Test date parsing across the shapes SVS pages use."""
+    assert parser._parse_date(date_str) == expected
+
+
+@pytest.mark.parametrize(
+    "html",
+    [
+        "<p>Plain text</p>",
+        '<p class="lead intro" id="x">Classes &amp; ids</p>',
+        "<p>Line<br/>break and <b>bold</b> and <em>em</em></p>",
+        "<p>Escapes: &lt;tag&gt; &amp; \"quotes\" 'apostrophes'</p>",
+        '<p><a href="/x?a=1&amp;b=2" title=\'say "hi"\'>both</a></p>',
+        '<p><a title="it\'s &quot;quoted&quot;">both quotes</a></p>',
+        "<p>Before<!-- a comment -->after</p>",
+        '<p><img alt="" src="/a.png"/> <input checked disabled/></p>',
+    ],
+)
+def test_write_markup_matches_bs4(parser: SvsHtmlParser, html: str):
+    """Test that the markup serializer matches bs4's own output."""
+    paragraph = BeautifulSoup(html, "lxml").p
+    assert parser._markup(paragraph) == str(paragraph)
@@ -0,0 +1,44 @@
+"""Tests for keyset pagination cursors."""
+
+from datetime import UTC, datetime
+
+import pytest
+from fastapi import HTTPException
+
+from app.api.pagination import decode_cursor, encode_cursor
+
+
+def test_cursor_round_trip():
+    """Test that decoding an encoded cursor returns the original values."""
+    values = {"created_at": "2025-12-19T23:00:00+00:00", "run_id": "0193e0a2-7c1d-7abc-8def-0123456789ab"}
+    assert decode_cursor(encode_cursor(values)) == values
+
+
+def test_cursor_is_url_safe():
+    """Test that cursors contain no padding or characters needing URL escaping."""
+    cursor = encode_cursor({"k": "?>?>?>", "n": 1})
+    assert "=" not in cursor
+    assert "+" not in cursor
+    assert "/" not in cursor
+
+
+def test_cursor_stringifies_non_json_values():
+    """Test that values JSON cannot encode, like datetimes, are stored as strings."""
+    created_at = datetime(2025, 12, 19, 23, 0, tzinfo=UTC)
+    assert decode_cursor(encode_cursor({"created_at": created_at})) == {"created_at": str(created_at)}
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "not base64!",  # invalid base64
+        "bm90IGpzb24",  # "not json"
+        "WzEsMl0",  # "[1,2]", JSON but not an object
+    ],
+)
+def test_malformed_cursor_rejected(cursor: str):
+    """Test that malformed cursors raise a 400 error."""
+    with pytest.raises(HTTPException) as exc_info:
+        decode_cursor(cursor)
+    assert exc_info.value.status_code == 400
+    assert exc_info.value.detail["code"] == "INVALID_CURSOR"
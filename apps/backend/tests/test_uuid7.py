@@ -0,0 +1,35 @@
+"""Tests for time-ordered UUID generation."""
+
+import time
+
+from app.models.base import uuid7
+
+
+def test_uuid7_version_and_variant():
+    """Test that generated UUIDs are RFC 9562 version 7."""
+    value = uuid7()
+    assert value.version == 7
+    assert value.variant == "specified in RFC 4122"
+
+
+def test_uuid7_embeds_timestamp():
+    """Test that the first 48 bits hold the Unix time in milliseconds."""
+    before = time.time_ns() // 1_000_000
+    value = uuid7()
+    after = time.time_ns() // 1_000_000
+    assert before <= value.int >> 80 <= after
+
+
+def test_uuid7_ordered_across_milliseconds():
+    """Test that UUIDs from later milliseconds sort after earlier ones."""
+    first = uuid7()
+    time.sleep(0.002)
+    second = uuid7()
+    assert first < second
+    assert str(first) < str(second)
+
+
+def test_uuid7_unique():
+    """Test that UUIDs generated within the same millisecond differ."""
+    values = {uuid7() for _ in range(1000)}
+    assert len(values) == 1000